@@ -3,6 +3,7 @@
 from nautobot.extras.context_managers import (
     change_logging,
     ChangeContext,
+    deferred_object_changes,
     JobChangeContext,
     JobHookChangeContext,
     ORMChangeContext,
@@ -13,6 +14,7 @@ from nautobot.extras.context_managers import (
 __all__ = (
     "change_logging",
     "ChangeContext",
+    "deferred_object_changes",
     "JobChangeContext",
     "JobHookChangeContext",
     "ORMChangeContext",
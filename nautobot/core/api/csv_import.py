@@ -0,0 +1,237 @@
+"""Bulk import of CSV data through the REST API serializers."""
+
+from io import BytesIO
+import logging
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, models, router, transaction
+from django.db.models.signals import post_save, pre_save
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.utils import model_meta
+
+from nautobot.core.api.mixins import WritableSerializerMixin
+from nautobot.core.api.parsers import NautobotCSVParser
+from nautobot.core.api.serializers import RelationshipModelSerializerMixin
+from nautobot.core.constants import CSV_IMPORT_BATCH_SIZE
+from nautobot.core.utils.data import batched
+from nautobot.extras.api.mixins import TaggedModelSerializerMixin
+from nautobot.extras.context_managers import deferred_object_changes
+
+logger = logging.getLogger(__name__)
+
+# Serializer classes whose create() is equivalent to a plain `Model.objects.create()` for data without any tags,
+# relationships or many-to-many values
+BULK_CREATE_SAFE_SERIALIZER_CLASSES = (
+    serializers.BaseSerializer,
+    serializers.ModelSerializer,
+    RelationshipModelSerializerMixin,
+    TaggedModelSerializerMixin,
+)
+
+
+def model_supports_bulk_create(model):
+    """
+    Return True if creating instances of `model` with `bulk_create()` is equivalent to calling `save()` on each one.
+
+    This is the case if no class in the model's hierarchy customizes `save()`, or if the model sets the class attribute
+    `bulk_create_safe_save = True` to declare that its custom `save()` doesn't affect new, already-validated instances.
+    """
+    if getattr(model, "bulk_create_safe_save", False):
+        return True
+    return not any("save" in cls.__dict__ for cls in model.__mro__ if cls is not models.Model)
+
+
+def serializer_supports_bulk_create(serializer_class):
+    """Return True if `serializer_class` doesn't customize how new instances are created and saved."""
+    return not any(
+        "create" in cls.__dict__ or "save" in cls.__dict__
+        for cls in serializer_class.__mro__
+        if cls not in BULK_CREATE_SAFE_SERIALIZER_CLASSES
+    )
+
+
+class CSVImporter:
+    """
+    Create objects from CSV data, processing the rows a chunk at a time.
+
+    For each chunk, references to related objects (by PK, composite-key or attributes) are first resolved for all rows
+    at once, with one query per referenced model and set of attributes rather than one per row. The resolved objects
+    are cached for the rest of the import. Every row in the chunk is then validated, and if all of them are valid and
+    don't conflict with one another, the chunk is saved within a savepoint: new instances of models that support it are
+    inserted with a single `bulk_create()` (sending the usual `pre_save`/`post_save` signals so that change logging and
+    other receivers still apply), and rows with tags, relationships or many-to-many values are saved by their
+    serializer. Otherwise, such as when a row refers to an object created by an earlier row of the same chunk, the
+    chunk is imported a row at a time, validating and saving each row before the next one, as a non-bulk import would.
+
+    ObjectChange records for the imported objects are written in bulk (see `deferred_object_changes()`). Validation
+    errors are collected per row in `errors` rather than raised, so that all of them can be reported to the user;
+    the caller is responsible for rolling back the transaction if there are any.
+
+    Args:
+        serializer_class (Serializer): REST API serializer class of the model to import
+        context (dict): Serializer context, typically `{"request": request}`
+        batch_size (int): Number of rows to process per chunk
+    """
+
+    def __init__(self, serializer_class, *, context=None, batch_size=CSV_IMPORT_BATCH_SIZE):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.context = {**(context or {}), "related_object_cache": {}}
+        self.batch_size = batch_size
+        # List of (row number, field name, error message)
+        self.errors = []
+        self._bulk_create_supported = None
+        self._serializer = None
+
+    @property
+    def bulk_create_supported(self):
+        """True if new instances of this model can be saved with `bulk_create()`."""
+        if self._bulk_create_supported is None:
+            self._bulk_create_supported = model_supports_bulk_create(self.model) and serializer_supports_bulk_create(
+                self.serializer_class
+            )
+            if self._bulk_create_supported and issubclass(self.serializer_class, RelationshipModelSerializerMixin):
+                # Rows without relationships data can't be valid if the model has any required relationships
+                self._bulk_create_supported = not self.model.required_related_objects_errors(
+                    output_for="api", initial_data={}
+                )
+        return self._bulk_create_supported
+
+    def parse(self, csv_text):
+        """Parse the given CSV text into a list of dicts suitable for `run()`, raising a `ParseError` if invalid."""
+        return NautobotCSVParser().parse(
+            stream=BytesIO(csv_text.encode("utf-8")),
+            parser_context={"request": self.context.get("request"), "serializer_class": self.serializer_class},
+        )
+
+    def run(self, data, progress_callback=None):
+        """
+        Import the given parsed rows and return the list of created objects.
+
+        Args:
+            data (list[dict]): Parsed CSV rows, as returned by `parse()`
+            progress_callback (callable): Optional function called as `progress_callback(rows_processed, rows_total)`
+                after each chunk
+        """
+        new_objs = []
+        with deferred_object_changes():
+            for chunk in batched(enumerate(data, start=1), self.batch_size):
+                new_objs.extend(self._import_chunk(chunk))
+                if progress_callback is not None:
+                    progress_callback(chunk[-1][0], len(data))
+        return new_objs
+
+    def _import_chunk(self, rows):
+        self._prefetch_related_objects([entry for _, entry in rows])
+
+        if self.bulk_create_supported:
+            row_serializers = [self.serializer_class(data=entry, context=self.context) for _, entry in rows]
+            if all(serializer.is_valid() for serializer in row_serializers):
+                instances = [self._build_instance(serializer) for serializer in row_serializers]
+                if None not in instances and not self._has_conflicts([instance for instance, _ in instances]):
+                    try:
+                        with transaction.atomic():
+                            return self._save_chunk(row_serializers, instances)
+                    except (IntegrityError, DjangoValidationError, serializers.ValidationError) as exc:
+                        logger.debug(
+                            "Falling back to importing rows %d-%d individually: %s", rows[0][0], rows[-1][0], exc
+                        )
+
+        return self._import_rows(rows)
+
+    def _import_rows(self, rows):
+        """Validate and save each of the given rows in turn."""
+        new_objs = []
+        for row, entry in rows:
+            serializer = self.serializer_class(data=entry, context=self.context)
+            if serializer.is_valid():
+                new_objs.append(serializer.save())
+            else:
+                for field, err in serializer.errors.items():
+                    self.errors.append((row, field, err[0]))
+        return new_objs
+
+    def _save_chunk(self, row_serializers, instances):
+        """Save the given validated rows, using `bulk_create()` for all those that allow it."""
+        new_objs = []
+        to_create = []
+        for serializer, (instance, bulk_create) in zip(row_serializers, instances):
+            if bulk_create:
+                to_create.append(instance)
+                new_objs.append(instance)
+            else:
+                new_objs.append(serializer.save())
+        if to_create:
+            using = router.db_for_write(self.model)
+            for instance in to_create:
+                pre_save.send(sender=self.model, instance=instance, raw=False, using=using, update_fields=None)
+            self.model._default_manager.bulk_create(to_create, batch_size=self.batch_size)
+            for instance in to_create:
+                post_save.send(
+                    sender=self.model, instance=instance, created=True, update_fields=None, raw=False, using=using
+                )
+        return new_objs
+
+    def _build_instance(self, serializer):
+        """
+        Return `(instance, bulk_create)` for the given validated serializer, or None if no instance can be built.
+
+        This mirrors `ModelSerializer.create()`; `bulk_create` is False if the data includes anything (tags,
+        relationships or many-to-many values) that would need to be saved separately, in which case the row must be
+        saved by its serializer instead and the instance is only used to check for conflicts with other rows.
+        """
+        validated_data = dict(serializer.validated_data)
+        separately_saved_data = [validated_data.pop("tags", None), validated_data.pop("relationships", None)]
+        for field_name, relation_info in model_meta.get_field_info(self.model).relations.items():
+            if relation_info.to_many:
+                separately_saved_data.append(validated_data.pop(field_name, None))
+        bulk_create = not any(separately_saved_data)
+        try:
+            return self.model(**validated_data), bulk_create
+        except TypeError:
+            # Serializer data not corresponding to model fields
+            return None
+
+    def _has_conflicts(self, instances):
+        """
+        Return True if any two of the given instances have the same values for a set of unique fields.
+
+        Each row was validated without knowledge of the other rows in its chunk, so such duplicates weren't detected.
+        Null values are compared as equal here, to also catch uniqueness rules enforced only in `clean()`.
+        """
+        seen = set()
+        for instance in instances:
+            unique_checks, _ = instance._get_unique_checks()
+            for model_class, field_names in unique_checks:
+                if field_names == (self.model._meta.pk.name,):
+                    continue
+                key = (
+                    model_class,
+                    field_names,
+                    tuple(getattr(instance, self.model._meta.get_field(name).attname) for name in field_names),
+                )
+                if key in seen:
+                    return True
+                seen.add(key)
+        return False
+
+    def _prefetch_related_objects(self, entries):
+        """Resolve the related objects referenced by the given rows in bulk, populating the related object cache."""
+        if self._serializer is None:
+            self._serializer = self.serializer_class(context=self.context)
+        for field_name, field in self._serializer.fields.items():
+            if field.read_only:
+                continue
+            many = isinstance(field, ManyRelatedField)
+            relation = field.child_relation if many else field
+            if not isinstance(relation, RelatedField) or not isinstance(relation, WritableSerializerMixin):
+                continue
+            values = []
+            for entry in entries:
+                value = entry.get(field_name)
+                if many:
+                    values.extend(value or [])
+                else:
+                    values.append(value)
+            relation.prefetch_objects(values)
@@ -1,3 +1,4 @@
+from collections import defaultdict
 import logging
 import uuid
 
@@ -6,11 +7,12 @@ from django.core.exceptions import (
     MultipleObjectsReturned,
     ObjectDoesNotExist,
 )
-from django.db.models import AutoField
+from django.db.models import AutoField, F, Q
 from rest_framework.exceptions import ValidationError
+from rest_framework.relations import ManyRelatedField
 
 from nautobot.core.api.utils import dict_to_filter_params
-from nautobot.core.utils.data import is_url
+from nautobot.core.utils.data import batched, is_url
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +42,14 @@ class WritableSerializerMixin:
     "parent": { "location_type__parent": {"name": "Campus"}, "parent__name": "Campus-29" }
     vs
     "parent": "10dff139-7333-46b0-bef6-f6a5a7b5497c"
+
+    If the serializer context contains a `related_object_cache` dict, objects retrieved by `get_object()` are stored in
+    and reused from it, and `prefetch_objects()` can be used to populate it for many values with a few queries.
     """
 
+    # Maximum number of distinct lookups combined into a single query by prefetch_objects()
+    prefetch_batch_size = 500
+
     def remove_non_filter_fields(self, filter_params):
         """
         Make output from a WritableSerializer "round-trip" capable by automatically stripping from the
@@ -85,14 +93,36 @@ class WritableSerializerMixin:
         Retrieve an unique object based on a dictionary of data attributes and raise errors accordingly if the object is not found.
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
+        related_object_cache = self.context.get("related_object_cache")
+        if related_object_cache is not None:
+            cache_key = self._get_related_object_cache_key(queryset, filter_params)
+            if cache_key in related_object_cache:
+                return related_object_cache[cache_key]
         try:
-            return queryset.get(**filter_params)
+            obj = queryset.get(**filter_params)
         except ObjectDoesNotExist as e:
             raise ValidationError(f"Related object not found using the provided attributes: {filter_params}") from e
         except MultipleObjectsReturned as e:
             raise ValidationError(f"Multiple objects match the provided attributes: {filter_params}") from e
         except FieldError as e:
             raise ValidationError(e) from e
+        if related_object_cache is not None:
+            related_object_cache[cache_key] = obj
+        return obj
+
+    def get_related_queryset(self):
+        """Return the queryset that related objects are retrieved from."""
+        if hasattr(self, "queryset"):
+            return self.queryset
+        return self.Meta.model.objects
+
+    def to_lookup_data(self, data):
+        """
+        Hook to convert a single input value into the data passed to `get_object()`.
+
+        Subclasses may override this to support additional representations, such as composite-keys.
+        """
+        return data
 
     def to_internal_value(self, data):
         """
@@ -100,10 +130,67 @@ class WritableSerializerMixin:
         """
         if data is None:
             return None
-        if hasattr(self, "queryset"):
-            queryset = self.queryset
-        else:
-            queryset = self.Meta.model.objects
+        queryset = self.get_related_queryset()
         if isinstance(data, list):
-            return [self.get_object(data=entry, queryset=queryset) for entry in data]
-        return self.get_object(data=data, queryset=queryset)
+            return [self.get_object(data=self.to_lookup_data(entry), queryset=queryset) for entry in data]
+        return self.get_object(data=self.to_lookup_data(data), queryset=queryset)
+
+    def _get_related_object_cache_key(self, queryset, filter_params):
+        # Entries of a `many=True` field are looked up by its child relation, which has no field_name of its own
+        field = self.parent if isinstance(self.parent, ManyRelatedField) else self
+        params = tuple(sorted((key, repr(value)) for key, value in filter_params.items()))
+        return (field.field_name, queryset.model._meta.label_lower, params)
+
+    def prefetch_objects(self, values):
+        """
+        Retrieve the related objects referenced by many input values at once and store them in the related object cache.
+
+        Values that reference objects by the same set of attributes are resolved together, using one query per
+        `prefetch_batch_size` distinct values rather than one query per value. Values that can't be resolved
+        unambiguously this way are skipped, leaving `get_object()` to look them up (and report errors) individually.
+        """
+        related_object_cache = self.context.get("related_object_cache")
+        if related_object_cache is None:
+            return
+        queryset = self.get_related_queryset()
+
+        # {(lookup, ...): {cache_key: filter_params}}
+        pending = defaultdict(dict)
+        for value in values:
+            if value is None:
+                continue
+            try:
+                filter_params = self.get_queryset_filter_params(data=self.to_lookup_data(value), queryset=queryset)
+            except ValidationError:
+                continue
+            if not filter_params:
+                continue
+            cache_key = self._get_related_object_cache_key(queryset, filter_params)
+            if cache_key not in related_object_cache:
+                pending[tuple(sorted(filter_params))][cache_key] = filter_params
+
+        for lookups, params_by_cache_key in pending.items():
+            # Annotate each retrieved object with the values of the lookups so that it can be matched back to the
+            # input value(s) that referenced it
+            annotations = {f"_prefetch_{i}": F(lookup) for i, lookup in enumerate(lookups)}
+            for batch in batched(params_by_cache_key.items(), self.prefetch_batch_size):
+                query = Q()
+                for _, filter_params in batch:
+                    query |= Q(**filter_params)
+                try:
+                    objects = list(queryset.filter(query).annotate(**annotations))
+                except FieldError:
+                    # The lookups include a transform or lookup type (e.g. "name__iexact") that can't be annotated
+                    break
+                matches = defaultdict(dict)
+                for obj in objects:
+                    key = tuple(self._normalize_prefetch_value(getattr(obj, name)) for name in annotations)
+                    matches[key][obj.pk] = obj
+                for cache_key, filter_params in batch:
+                    key = tuple(self._normalize_prefetch_value(filter_params[lookup]) for lookup in lookups)
+                    if len(matches.get(key, {})) == 1:
+                        related_object_cache[cache_key] = next(iter(matches[key].values()))
+
+    @staticmethod
+    def _normalize_prefetch_value(value):
+        return None if value is None else str(value)
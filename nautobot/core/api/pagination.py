@@ -1,5 +1,10 @@
-from rest_framework.pagination import LimitOffsetPagination
+from collections import OrderedDict
 
+from django.db.models import QuerySet
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.response import Response
+
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.utils.config import get_settings_or_config
 
 
@@ -8,13 +13,25 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    If the request includes a `cursor` query parameter (even an empty one, to request the first page), the request is
+    instead paginated by `PrimaryKeyCursorPagination`, which scales to arbitrarily deep pages.
     """
 
+    cursor_query_param = "cursor"
+    cursor_paginator = None
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        # Only querysets can be paginated by cursor; other lists of objects fall back to limit/offset pagination
+        if self.cursor_query_param in request.query_params and isinstance(queryset, QuerySet):
+            self.cursor_paginator = PrimaryKeyCursorPagination()
+            self.cursor_paginator.limit_paginator = self
+            return self.cursor_paginator.paginate_queryset(queryset, request, view=view)
+
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
@@ -31,6 +48,11 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -63,3 +85,75 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
             return None
 
         return super().get_previous_link()
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            *PrimaryKeyCursorPagination().get_schema_operation_parameters(view),
+        ]
+
+
+class PrimaryKeyCursorPagination(CursorPagination):
+    """
+    Paginate a queryset by primary key, using an opaque cursor identifying the position of a page in the queryset.
+
+    Unlike limit/offset pagination, where the database has to scan and discard every row before the requested
+    offset, each page is retrieved with an indexed lookup of the primary keys following (or preceding) the cursor, so
+    deep pages are just as fast to retrieve as the first. For the same reason, the total number of objects isn't
+    computed unless explicitly requested with `count=true`; otherwise the `count` in the response is null.
+
+    The objects are always ordered by primary key, regardless of any `sort` query parameter. The page size is set with
+    the `limit` query parameter, as with `OptionalLimitOffsetPagination`.
+    """
+
+    ordering = ("pk",)
+    count_query_param = "count"
+    # `OptionalLimitOffsetPagination` that this paginator acts on behalf of, if any
+    limit_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        try:
+            if is_truthy(request.query_params.get(self.count_query_param, False)):
+                self.count = queryset.count()
+        except ValueError:
+            pass
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_page_size(self, request):
+        limit_paginator = self.limit_paginator or OptionalLimitOffsetPagination()
+        # As there's no "last page" of a cursor, an unlimited page size still returns at most PAGINATE_COUNT objects
+        return limit_paginator.get_limit(request) or get_settings_or_config("PAGINATE_COUNT")
+
+    def get_ordering(self, request, queryset, view):
+        # Only ever order by the (indexed and unique) primary key, ignoring the OrderingFilter filter backend
+        return self.ordering
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Whether to include the total number of results when paginating by cursor.",
+                "schema": {"type": "boolean"},
+            },
+        ]
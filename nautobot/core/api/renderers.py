@@ -1,5 +1,5 @@
 import csv
-from io import StringIO
+import itertools
 import json
 import logging
 
@@ -8,10 +8,18 @@ from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRen
 
 from nautobot.core.celery import NautobotKombuJSONEncoder
 from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
+from nautobot.extras.models import CustomField
 
 logger = logging.getLogger(__name__)
 
 
+class _EchoBuffer:
+    """File-like object whose `write()` simply returns the written value, for use with `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
 class FormlessBrowsableAPIRenderer(BrowsableAPIRenderer):
     """
     Override the built-in BrowsableAPIRenderer to disable HTML forms.
@@ -59,22 +67,45 @@ class NautobotCSVRenderer(BaseRenderer):
 
         headers = self.get_headers(data)
 
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(headers)
+        return "".join(self.render_rows(data, headers=headers))
+
+    def render_rows(self, data, *, headers):
+        """Yield the CSV header row, followed by one CSV row for each record in the provided data."""
+        writer = csv.writer(_EchoBuffer())
+        yield writer.writerow(headers)
         for record in data:
-            writer.writerow(
-                self.object_to_row_elements(
-                    record,
-                    headers=headers,
-                )
-            )
+            yield writer.writerow(self.object_to_row_elements(record, headers=headers))
+
+    def render_stream(self, data, *, model=None):
+        """
+        Incrementally render the provided iterable of records to CSV, yielding one CSV row at a time.
 
-        return buffer.getvalue()
+        Unlike `render()`, this never holds all of the records in memory at once, so `data` can be a generator such as
+        `serialize_queryset_in_batches()`. The custom field headers are derived from the CustomFields of `model` rather
+        than by scanning every record.
+        """
+        data = iter(data)
+        first_record = next(data, None)
+        if first_record is None:
+            return
+
+        custom_field_keys = None
+        if model is not None and hasattr(model, "_custom_field_data"):
+            custom_field_keys = [cf.key for cf in CustomField.objects.get_for_model(model)]
+        headers = self.get_headers([first_record], custom_field_keys=custom_field_keys)
+
+        yield from self.render_rows(itertools.chain([first_record], data), headers=headers)
 
     @classmethod
-    def get_headers(cls, data):
-        """Identify the appropriate CSV headers corresponding to the given data."""
+    def get_headers(cls, data, custom_field_keys=None):
+        """
+        Identify the appropriate CSV headers corresponding to the given data.
+
+        Args:
+            data (list): Records to be rendered
+            custom_field_keys (list): Keys of the CustomFields of the records' model, if known; if unspecified, the
+                custom field headers are derived from the contents of all records instead.
+        """
         base_headers = list(data[0].keys())
 
         # Remove specific headers that we know are irrelevant
@@ -90,8 +121,10 @@ class NautobotCSVRenderer(BaseRenderer):
 
         # Add individual headers for each relevant custom field
         # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
-        if "custom_fields" in data[0]:
+        # we iterate over *all* instances in the data set to be safe, unless we were told what to expect.
+        if "custom_fields" in data[0] and custom_field_keys is not None:
+            cf_headers = sorted(f"cf_{key}" for key in custom_field_keys)
+        elif "custom_fields" in data[0]:
             cf_headers = set()
             for record in data:
                 cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
@@ -46,6 +46,31 @@ from nautobot.ipam.fields import VarbinaryIPField
 logger = logging.getLogger(__name__)
 
 
+def _is_to_many_lookup(model, lookup):
+    """
+    Check whether the given lookup (such as `"location__parent"`) traverses only relations, starting from `model`.
+
+    Returns:
+        (bool): None if the lookup isn't a chain of relations; otherwise, whether it traverses any to-many relation
+            or generic foreign key, in which case it can only be prefetched rather than joined by `select_related()`.
+    """
+    to_many = False
+    for field_name in lookup.split("__"):
+        if model is None:
+            # Can't traverse further than a generic foreign key
+            return None
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation:
+            return None
+        if field.many_to_many or field.one_to_many or field.related_model is None:
+            to_many = True
+        model = field.related_model
+    return to_many
+
+
 class OptInFieldsMixin:
     """
     A serializer mixin that takes an additional `opt_in_fields` argument that controls
@@ -398,6 +423,59 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
         fields = [field for field in fields if filter_field(field)]
         return fields
 
+    def get_related_lookups(self):
+        """
+        Determine the lookups needed to efficiently load the related objects that this serializer will represent.
+
+        The lookups are derived from the serializer's actual fields, so they follow the requested `?depth` (through
+        nested serializers) and `?include` opt-in fields, and also cover the related objects that `natural_slug` reads.
+        Lookups through to-one relations can be joined with `select_related()`, while lookups traversing a to-many
+        relation or a generic foreign key have to be fetched with `prefetch_related()` instead.
+
+        Examples:
+            >>> DeviceSerializer(context={"depth": 1, "request": request}).get_related_lookups()
+            ({"device_type", "device_type__manufacturer", "location", ...}, {"tags", ...})
+
+        Returns:
+            (tuple[set, set]): The `select_related()` lookups and the `prefetch_related()` lookups
+        """
+        model = self.Meta.model
+        select_related = set()
+        prefetch_related = set()
+
+        def add_lookup(lookup, nested_select_related=(), nested_prefetch_related=()):
+            to_many = _is_to_many_lookup(model, lookup)
+            if to_many is None:
+                return
+            lookups = prefetch_related if to_many else select_related
+            lookups.add(lookup)
+            lookups.update(f"{lookup}__{nested_lookup}" for nested_lookup in nested_select_related)
+            prefetch_related.update(f"{lookup}__{nested_lookup}" for nested_lookup in nested_prefetch_related)
+
+        if "natural_slug" in self.fields:
+            for natural_key_lookup in getattr(model, "natural_key_field_lookups", []):
+                if "__" in natural_key_lookup:
+                    add_lookup(natural_key_lookup.rsplit("__", 1)[0])
+
+        for field in self.fields.values():
+            if field.write_only or not field.source_attrs:
+                continue
+            lookup = "__".join(field.source_attrs)
+            if isinstance(field, serializers.ListSerializer):
+                if isinstance(field.child, BaseModelSerializer):
+                    add_lookup(lookup, *field.child.get_related_lookups())
+                else:
+                    add_lookup(lookup)
+            elif isinstance(field, BaseModelSerializer):
+                add_lookup(lookup, *field.get_related_lookups())
+            elif isinstance(field, drf_relations.ManyRelatedField):
+                add_lookup(lookup)
+            elif isinstance(field, drf_relations.RelatedField) and len(field.source_attrs) > 1:
+                # Only the related object's PK is needed, but the objects leading to it still have to be retrieved
+                add_lookup("__".join(field.source_attrs[:-1]))
+
+        return select_related, prefetch_related
+
     def determine_view_options(self, request=None):
         """
         Determine view options to use for rendering the list and detail views associated with this serializer.
@@ -895,7 +973,10 @@ class BulkOperationIntegerIDSerializer(serializers.Serializer):
 
 
 class GraphQLAPISerializer(serializers.Serializer):
-    query = serializers.CharField(required=True, help_text="GraphQL query")
+    query = serializers.CharField(required=False, help_text="GraphQL query")
+    id = serializers.CharField(
+        required=False, help_text="SHA-256 hash of a saved or previously executed query, to execute instead of `query`"
+    )
     variables = serializers.JSONField(required=False, help_text="Variables in JSON Format")
 
 
@@ -912,8 +993,22 @@ class CustomFieldModelSerializerMixin(ValidatedModelSerializer):
 
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_computed_fields(self, obj):
+        if getattr(obj, "prefetched_computed_fields", None) is None:
+            self.prefetch_computed_fields(obj)
         return obj.get_computed_fields()
 
+    def prefetch_computed_fields(self, obj):
+        """
+        Render the computed fields of all objects being serialized together with `obj` at once.
+
+        When `obj` is one of a list of objects being serialized, `CustomFieldModel.prefetch_computed_fields()` is
+        applied to the whole list, rather than rendering the computed fields of each object in turn.
+        """
+        instances = self.parent.instance if isinstance(self.parent, serializers.ListSerializer) else None
+        if not isinstance(instances, (list, models.QuerySet)) or not any(instance is obj for instance in instances):
+            instances = [obj]
+        type(obj).prefetch_computed_fields(list(instances))
+
     def get_field_names(self, declared_fields, info):
         """Ensure that "custom_fields" and "computed_fields" are included appropriately."""
         fields = list(super().get_field_names(declared_fields, info))
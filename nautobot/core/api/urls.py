@@ -12,6 +12,7 @@ from nautobot.core.api.views import (
     GetFilterSetFieldLookupExpressionChoicesAPIView,
     GetMenuAPIView,
     GetObjectCountsView,
+    GlobalSearchView,
     GraphQLDRFAPIView,
     NautobotSpectacularRedocView,
     NautobotSpectacularSwaggerView,
@@ -36,6 +37,7 @@ ui_api_patterns = [
     path("core/", include((core_api_patterns, "core-api"))),
     path("get-menu/", GetMenuAPIView.as_view(), name="get-menu"),
     path("get-object-counts/", GetObjectCountsView.as_view(), name="get-object-counts"),
+    path("search/", GlobalSearchView.as_view(), name="search"),
 ]
 
 urlpatterns = [
@@ -13,6 +13,8 @@ from rest_framework.utils.field_mapping import get_nested_relation_kwargs
 from rest_framework.utils.model_meta import _get_to_field, RelationInfo
 
 from nautobot.core.api import exceptions
+from nautobot.core.constants import CSV_EXPORT_BATCH_SIZE
+from nautobot.core.utils.data import batched
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +122,24 @@ def get_serializer_for_model(model, prefix=""):
         ) from exc
 
 
+def serialize_queryset_in_batches(queryset, get_serializer, batch_size=None):
+    """
+    Serialize the objects in `queryset` a batch at a time, yielding the serialized data of one object at a time.
+
+    Only the primary keys of the whole queryset are retrieved up front (via a server-side cursor); each batch of
+    objects is then retrieved, serialized and discarded in turn, so memory usage doesn't grow with the queryset size.
+
+    Args:
+        queryset (QuerySet): Objects to serialize, in the desired order
+        get_serializer (callable): Called as `get_serializer(batch_queryset, many=True)` to obtain a serializer
+        batch_size (int): Number of objects to retrieve and serialize at a time, defaults to `CSV_EXPORT_BATCH_SIZE`
+    """
+    if batch_size is None:
+        batch_size = CSV_EXPORT_BATCH_SIZE
+    for pks in batched(queryset.values_list("pk", flat=True).iterator(chunk_size=batch_size), batch_size):
+        yield from get_serializer(queryset.filter(pk__in=pks), many=True).data
+
+
 def nested_serializers_for_models(models, prefix=""):
     """
     Dynamically resolve and return the appropriate nested serializers for a list of models.
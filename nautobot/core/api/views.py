@@ -1,7 +1,9 @@
 from collections import OrderedDict
 import itertools
+import json
 import logging
 import platform
+from urllib.parse import urlencode
 
 from django import __version__ as DJANGO_VERSION, forms
 from django.apps import apps
@@ -9,7 +11,7 @@ from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django.db.models import ProtectedError
-from django.http.response import HttpResponseBadRequest
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import NoReverseMatch, reverse as django_reverse
 from drf_spectacular.plumbing import get_relative_url, set_query_parameters
@@ -30,14 +32,21 @@ from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet as ModelViewSet_, ReadOnlyModelViewSet as ReadOnlyModelViewSet_
 
-from nautobot.core.api import BulkOperationSerializer
+from nautobot.core import instrumentation
+from nautobot.core.api import BaseModelSerializer, BulkOperationSerializer
+from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.utils import serialize_queryset_in_batches
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.forms import SearchForm
+from nautobot.core.graphql.backends import get_query_hash
+from nautobot.core.search import iter_search_results
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
+from nautobot.extras.models import GraphQLQuery
 from nautobot.extras.registry import registry
 
 from . import serializers
@@ -171,6 +180,29 @@ class ModelViewSetMixin:
     #       composite_key value instead of a UUID. We're not currently documenting/using this feature, so OK for now
     # lookup_value_regex = r"[^/]+"
 
+    def get_queryset(self):
+        """
+        Extend rest_framework.generics.GenericAPIView.get_queryset to efficiently load the related objects to serialize.
+
+        For GET requests, the `select_related()` and `prefetch_related()` lookups are derived from the fields of the
+        serializer (as determined by `?depth` and `?include`) and applied in addition to any defined on the viewset's
+        `queryset`, so that the number of queries per page doesn't grow with the number of objects on the page.
+        """
+        queryset = super().get_queryset()
+        if self.request is None or self.request.method != "GET":
+            return queryset
+
+        serializer = self.get_serializer()
+        if not isinstance(serializer, BaseModelSerializer) or serializer.Meta.model is not queryset.model:
+            return queryset
+
+        select_related, prefetch_related = serializer.get_related_lookups()
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+        return queryset
+
     def get_object(self):
         """Extend rest_framework.generics.GenericAPIView.get_object to allow "pk" lookups to use a composite-key."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -197,6 +229,43 @@ class ModelViewSetMixin:
 
         return obj
 
+    def list(self, request, *args, **kwargs):
+        """
+        Extend rest_framework.mixins.ListModelMixin.list to stream CSV output instead of rendering it all at once.
+
+        The objects are retrieved and serialized in batches and the CSV rows are written to the response as they are
+        rendered, so memory usage stays flat regardless of the number of objects being exported.
+
+        Otherwise, the serialization of the objects is timed as the "serializer" phase of the request's instrumentation.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if isinstance(request.accepted_renderer, NautobotCSVRenderer):
+            rows = request.accepted_renderer.render_stream(
+                serialize_queryset_in_batches(queryset, self.get_serializer), model=queryset.model
+            )
+            return StreamingHttpResponse(rows, content_type=f"{request.accepted_media_type}; charset=UTF-8")
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            with instrumentation.phase("serializer"):
+                data = serializer.data
+            return self.get_paginated_response(data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        with instrumentation.phase("serializer"):
+            data = serializer.data
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Extend rest_framework.mixins.RetrieveModelMixin.retrieve to time the serialization of the object."""
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        with instrumentation.phase("serializer"):
+            data = serializer.data
+        return Response(data)
+
     def get_serializer(self, *args, **kwargs):
         # If a list of objects has been provided, initialize the serializer with many=True
         if isinstance(kwargs.get("data", {}), list):
@@ -255,14 +324,17 @@ class ModelViewSetMixin:
         self.restrict_queryset(request, *args, **kwargs)
 
     def dispatch(self, request, *args, **kwargs):
-        try:
-            return super().dispatch(request, *args, **kwargs)
-        except ProtectedError as e:
-            protected_objects = list(e.protected_objects)
-            msg = f"Unable to delete object. {len(protected_objects)} dependent objects were found: "
-            msg += ", ".join([f"{obj} ({obj.pk})" for obj in protected_objects])
-            self.logger.warning(msg)
-            return self.finalize_response(request, Response({"detail": msg}, status=409), *args, **kwargs)
+        model = getattr(self.queryset, "model", None)
+        with instrumentation.instrument("api", instrumentation.get_route(request), model=model):
+            try:
+                response = super().dispatch(request, *args, **kwargs)
+            except ProtectedError as e:
+                protected_objects = list(e.protected_objects)
+                msg = f"Unable to delete object. {len(protected_objects)} dependent objects were found: "
+                msg += ", ".join([f"{obj} ({obj.pk})" for obj in protected_objects])
+                self.logger.warning(msg)
+                response = self.finalize_response(request, Response({"detail": msg}, status=409), *args, **kwargs)
+            return instrumentation.render_response(response)
 
     def finalize_response(self, request, response, *args, **kwargs):
         # In the case of certain errors, we might not even get to the point of setting request.accepted_media_type
@@ -569,7 +641,8 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
     def post(self, request, *args, **kwargs):
         try:
             data = self.parse_body(request)
-            result, status_code = self.get_response(request, data)
+            with instrumentation.instrument("graphql", instrumentation.get_route(request)):
+                result, status_code = self.get_response(request, data)
 
             return Response(
                 result,
@@ -614,6 +687,7 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             response (dict), status_code (int): Payload of the response to send and the status code.
         """
         query, variables, operation_name, _id = GraphQLView.get_graphql_params(request, data)
+        query = self.get_persisted_query(request, data, query, _id)
 
         execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
 
@@ -635,6 +709,42 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
 
         return result, status_code
 
+    def get_persisted_query(self, request, data, query, query_id):
+        """Resolve a persisted query hash, if one was sent in the request, to the text of the query to execute.
+
+        The hash (the SHA-256 hex digest of the query) can be sent either as the `id` parameter, or in the format used by
+        Apollo clients, as `{"extensions": {"persistedQuery": {"sha256Hash": ...}}}`. It's resolved against the queries
+        recently executed by this Nautobot process, then against saved GraphQL queries.
+
+        Args:
+            request (HttpRequest): Request object from Django
+            data (dict): Parsed content of the body of the request.
+            query (str): GraphQL query, if any was sent in the request
+            query_id (str): Persisted query hash sent as the `id` parameter, if any
+
+        Returns:
+            (str): GraphQL query
+        """
+        extensions = data.get("extensions") if isinstance(data, dict) else None
+        if not query_id and isinstance(extensions, dict) and isinstance(extensions.get("persistedQuery"), dict):
+            query_id = extensions["persistedQuery"].get("sha256Hash")
+        if not query_id:
+            return query
+
+        if query:
+            if get_query_hash(query) != query_id:
+                raise HttpError(HttpResponseBadRequest("Provided query hash does not match the query string."))
+            return query
+
+        self.init_graphql()
+        backend = self.get_backend(request)
+        persisted_query = backend.get_query(query_id) if hasattr(backend, "get_query") else None
+        if persisted_query is None:
+            persisted_query = GraphQLQuery.objects.filter(query_hash=query_id).values_list("query", flat=True).first()
+        if persisted_query is None:
+            raise HttpError(HttpResponseBadRequest("PersistedQueryNotFound"))
+        return persisted_query
+
     def parse_body(self, request):
         """Analyze the request and based on the content type,
         extract the query from the body as a string or as a JSON payload.
@@ -862,6 +972,42 @@ class GetObjectCountsView(NautobotAPIVersionMixin, APIView):
         return Response(object_counts)
 
 
+class GlobalSearchView(NautobotAPIVersionMixin, APIView):
+    """
+    Perform a global search, streaming the results of each searchable model as newline-delimited JSON.
+
+    Each line is sent as soon as the search of its model completes, so that a client can display results progressively
+    rather than waiting for the slowest model to be searched.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(exclude=True)
+    def get(self, request):
+        form = SearchForm(request.GET)
+        if not form.is_valid():
+            return Response(form.errors, status=status.HTTP_400_BAD_REQUEST)
+        obj_types = [form.cleaned_data["obj_type"]] if form.cleaned_data["obj_type"] else None
+        search_results = iter_search_results(request.user, form.cleaned_data["q"], model_names=obj_types)
+
+        def lines():
+            for result in search_results:
+                data = {
+                    "model": result.target.model._meta.label_lower,
+                    "name": result.target.model._meta.verbose_name_plural,
+                    "url": f"{result.target.list_url}?{urlencode({'q': form.cleaned_data['q']})}",
+                    "has_more": result.has_more,
+                    "timed_out": result.timed_out,
+                    "results": [
+                        {"id": str(obj.pk), "display": str(obj), "url": obj.get_absolute_url()}
+                        for obj in result.results
+                    ],
+                }
+                yield json.dumps(data) + "\n"
+
+        return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
+
+
 #
 # Lookup Expr
 #
@@ -831,6 +831,13 @@ class CoreConfig(NautobotConfig):
             """Convert BigIntegerField to BigInteger scalar."""
             return BigInteger()
 
+        # Parse and validate each distinct GraphQL query only once per process, rather than on every execution
+        from graphql import set_default_backend
+
+        from nautobot.core.graphql.backends import CachedDocumentBackend
+
+        set_default_backend(CachedDocumentBackend())
+
         from django.conf import settings
         from django.contrib.auth.models import update_last_login
         from django.contrib.auth.signals import user_logged_in
@@ -9,7 +9,9 @@ from django.contrib.auth.backends import (
 from django.contrib.auth.models import Group
 from django.db.models import Q
 
+from nautobot.core.utils.cache import generation_lru_cache
 from nautobot.core.utils.permissions import (
+    compile_permission_constraints,
     permission_is_exempt,
     resolve_permission,
     resolve_permission_ct,
@@ -19,32 +21,66 @@ from nautobot.users.models import ObjectPermission
 logger = logging.getLogger(__name__)
 
 
+# Shared generation counter of the cached ObjectPermissions of all users, incremented whenever any of them may be stale
+OBJECT_PERMISSION_CACHE_GENERATION_KEY = "users.objectpermission.cache_generation"
+
+
+# The shared generation is checked on every call, so that a revoked permission is never granted by another process
+@generation_lru_cache(OBJECT_PERMISSION_CACHE_GENERATION_KEY, maxsize=1024, check_interval=0)
+def get_compiled_object_permissions(user_pk):
+    """
+    Return the permissions granted to the given user by ObjectPermissions, along with their compiled constraints.
+
+    The result is cached in-process until any ObjectPermission, group or group membership changes, in any Nautobot
+    process (see `nautobot.users.signals`), so that it needn't be queried anew for every request by the same user; the
+    only cost of a cached lookup is a single read of the shared generation counter from the cache.
+
+    Returns:
+        (tuple): a `(constraints, queries)` tuple of dicts mapping each permission name, such as "dcim.view_location",
+            to the list of its constraint sets and to a single `Q` object matching any of them, respectively.
+            These are shared by all callers and must not be modified.
+    """
+    # Retrieve all assigned and enabled ObjectPermissions
+    object_permissions = ObjectPermission.objects.filter(
+        Q(users=user_pk) | Q(groups__user=user_pk), enabled=True
+    ).prefetch_related("object_types")
+
+    # Create a dictionary mapping permissions to their constraints
+    perms = defaultdict(list)
+    for obj_perm in object_permissions:
+        for object_type in obj_perm.object_types.all():
+            for action in obj_perm.actions:
+                perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
+                perms[perm_name].extend(obj_perm.list_constraints())
+
+    queries = {perm_name: compile_permission_constraints(constraints) for perm_name, constraints in perms.items()}
+    return dict(perms), queries
+
+
 class ObjectPermissionBackend(ModelBackend):
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache, user_obj._object_perm_queries = get_compiled_object_permissions(user_obj.pk)
         return user_obj._object_perm_cache
 
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
         """
-        # Retrieve all assigned and enabled ObjectPermissions
-        object_permissions = ObjectPermission.objects.filter(
-            Q(users=user_obj) | Q(groups__user=user_obj), enabled=True
-        ).prefetch_related("object_types")
+        return get_compiled_object_permissions(user_obj.pk)[0]
 
-        # Create a dictionary mapping permissions to their constraints
-        perms = defaultdict(list)
-        for obj_perm in object_permissions:
-            for object_type in obj_perm.object_types.all():
-                for action in obj_perm.actions:
-                    perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
-                    perms[perm_name].extend(obj_perm.list_constraints())
+    def get_permission_query(self, user_obj, perm):
+        """
+        Return a `Q` object matching all objects on which the user has been granted the given permission.
 
-        return perms
+        The permission must be one of those returned by `get_all_permissions()`.
+        """
+        perms = self.get_all_permissions(user_obj)
+        if not hasattr(user_obj, "_object_perm_queries"):
+            return compile_permission_constraints(perms[perm])
+        return user_obj._object_perm_queries[perm]
 
     def has_perm(self, user_obj, perm, obj=None):
         if perm == "is_staff":
@@ -81,16 +117,8 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a query filter that matches all instances of the specified model
-        obj_perm_constraints = self.get_all_permissions(user_obj)[perm]
-        constraints = Q()
-        for perm_constraints in obj_perm_constraints:
-            if perm_constraints:
-                constraints |= Q(**perm_constraints)
-            else:
-                # Found ObjectPermission with null constraints; allow model-level access
-                constraints = Q()
-                break
+        # Look up the compiled query filter that matches all permitted instances of the specified model
+        constraints = self.get_permission_query(user_obj, perm)
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
@@ -88,6 +88,12 @@ CSV_NO_OBJECT = "NoObject"
 # VarbinaryIPField Represents b'NoObject' as `::4e6f:4f62:6a65:6374`
 VARBINARY_IP_FIELD_REPR_OF_CSV_NO_OBJECT = "::4e6f:4f62:6a65:6374"
 
+# Number of objects retrieved and serialized at a time when streaming a CSV export
+CSV_EXPORT_BATCH_SIZE = 1000
+
+# Number of rows validated and saved at a time when importing CSV data
+CSV_IMPORT_BATCH_SIZE = 1000
+
 
 # For our purposes, COMPOSITE_KEY_SEPARATOR needs to be:
 # 1. Safe in a URL path component (so that we can do URLS like "/dcim/devices/<composite_key>/delete/")
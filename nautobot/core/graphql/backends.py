@@ -0,0 +1,99 @@
+"""GraphQL backend that parses and validates each distinct query only once."""
+
+from collections import OrderedDict
+from functools import partial
+import hashlib
+import threading
+
+from graphql.backend import GraphQLCoreBackend, GraphQLDocument
+from graphql.execution import execute, ExecutionResult
+from graphql.language.base import parse
+from graphql.validation import validate
+
+# Maximum number of parsed and validated GraphQL documents to keep in memory in each process
+GRAPHQL_DOCUMENT_CACHE_SIZE = 512
+
+
+def get_query_hash(query):
+    """Return the SHA-256 hex digest identifying the given GraphQL query string, as used for persisted queries."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _invalid_result(errors, *args, **kwargs):
+    return ExecutionResult(errors=errors, invalid=True)
+
+
+class CachedDocumentBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend caching the documents it produces, keyed by schema and query hash.
+
+    The default `GraphQLCoreBackend` parses the query string every time a document is requested, and validates the
+    query against the schema every time the document is executed. This backend instead parses and validates a query
+    once, and keeps the resulting document (whose `execute()` skips validation) in a per-process LRU cache, so
+    repeatedly executing the same query, such as a saved `GraphQLQuery`, only pays for the execution itself.
+
+    As the cache is keyed by the schema object as well, documents are never reused with a schema other than the one
+    they were validated against. Documents for queries that fail validation aren't cached.
+
+    Cached documents can also be looked up by query hash alone with `get_query()`, allowing clients to send the hash of
+    a previously executed query instead of the full query text ("persisted queries").
+    """
+
+    def __init__(self, executor=None, maxsize=GRAPHQL_DOCUMENT_CACHE_SIZE):
+        super().__init__(executor=executor)
+        self.maxsize = maxsize
+        self._documents = OrderedDict()
+        self._queries = {}
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # The document cache is shared state of the process; don't duplicate it, nor the schemas it references
+        return self
+
+    def document_from_string(self, schema, document_string):
+        if not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        query_hash = get_query_hash(document_string)
+        key = (schema, query_hash)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+        document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        if validation_errors:
+            return GraphQLDocument(
+                schema=schema,
+                document_string=document_string,
+                document_ast=document_ast,
+                execute=partial(_invalid_result, validation_errors),
+            )
+
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(execute, schema, document_ast, **self.execute_params),
+        )
+        with self._lock:
+            self._documents[key] = document
+            self._queries[query_hash] = document_string
+            while len(self._documents) > self.maxsize:
+                (_, evicted_hash), _ = self._documents.popitem(last=False)
+                if not any(cached_hash == evicted_hash for _, cached_hash in self._documents):
+                    self._queries.pop(evicted_hash, None)
+        return document
+
+    def get_query(self, query_hash):
+        """Return the text of a cached query given its hash, or None if it isn't cached."""
+        with self._lock:
+            return self._queries.get(query_hash)
+
+    def clear(self):
+        """Discard all cached documents."""
+        with self._lock:
+            self._documents.clear()
+            self._queries.clear()
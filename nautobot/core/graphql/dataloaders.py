@@ -0,0 +1,119 @@
+"""
+Per-request DataLoaders for GraphQL.
+
+Resolvers of fields that aren't database columns (config context, relationships, computed fields) would otherwise run
+their own queries for each object in a list. Instead, they hand the object to a DataLoader, which collects the objects
+of every such field in the whole GraphQL query and resolves them all together once the executor needs the results,
+so the number of queries grows with the depth of the GraphQL query rather than with the number of objects returned.
+"""
+
+import logging
+
+import graphene_django_optimizer as gql_optimizer
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.models import ComputedField
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of objects looked up in a single query by any DataLoader
+DATALOADER_MAX_BATCH_SIZE = 1000
+
+
+def get_dataloader(info, key, factory):
+    """
+    Return the DataLoader identified by `key` for the current GraphQL execution, calling `factory()` to create it if
+    needed.
+
+    DataLoaders are cached on the request (`info.context`), so that the same loader is shared by every resolver call
+    within a single execution. As the same request may be used to execute several queries (for example by
+    `execute_query()`), the cache is reset whenever a different execution is seen, identified by its `variable_values`
+    dict, so that no results are cached between executions.
+    """
+    context = info.context
+    execution, loaders = getattr(context, "_nautobot_dataloaders", (None, None))
+    if execution is not info.variable_values:
+        loaders = {}
+        try:
+            context._nautobot_dataloaders = (info.variable_values, loaders)
+        except AttributeError:
+            # No request to cache the loaders on; batching can still happen within this resolver call
+            return factory()
+    if key not in loaders:
+        loaders[key] = factory()
+    return loaders[key]
+
+
+class ConfigContextLoader(DataLoader):
+    """Load the rendered config context of many Devices or VirtualMachines, given their PKs, in a fixed number of queries."""
+
+    def __init__(self, model):
+        super().__init__(max_batch_size=DATALOADER_MAX_BATCH_SIZE)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        config_contexts = self.model.objects.filter(pk__in=keys).get_config_contexts()
+        return Promise.resolve([config_contexts.get(key) for key in keys])
+
+
+class RelationshipPeersLoader(DataLoader):
+    """
+    Load the peers of many objects on one side of a Relationship, given the objects.
+
+    The objects are resolved together with `RelationshipModel.bulk_get_relationships()`, which retrieves all of their
+    RelationshipAssociations with one query and their peers with a second one. The peers are returned as a list per
+    object if the peer side of the Relationship has many objects, else as a single object (or None).
+    """
+
+    def __init__(self, relationship, side, info):
+        super().__init__(max_batch_size=DATALOADER_MAX_BATCH_SIZE)
+        self.relationship = relationship
+        self.side = side
+        # Every object in the batch is resolved for the same field of the GraphQL query, hence the same selections
+        self.info = info
+
+    def get_peers(self, queryset):
+        """Return the peer objects of the given queryset, optimized for the fields selected in the GraphQL query."""
+        # https://github.com/nautobot/nautobot/issues/1228
+        # If querying for **only** the ID of the related object, graphene_django_optimizer may raise a TypeError or
+        # AttributeError; in that case fall back to the un-optimized query.
+        try:
+            return list(gql_optimizer.query(queryset, self.info))
+        except (AttributeError, TypeError):
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+            return list(queryset)
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        relationships = type(keys[0]).bulk_get_relationships(
+            keys, relationships=[self.relationship], get_peers=self.get_peers
+        )
+        result_side = RelationshipSideChoices.SIDE_PEER if self.relationship.symmetric else self.side
+
+        results = []
+        has_many = self.relationship.has_many(RelationshipSideChoices.OPPOSITE[self.side])
+        for key in keys:
+            associations = relationships[key.pk][result_side].get(self.relationship, [])
+            peers = [peer for peer in (association.get_peer(key) for association in associations) if peer is not None]
+            if has_many:
+                results.append(peers)
+            else:
+                results.append(peers[0] if peers else None)
+        return Promise.resolve(results)
+
+
+class ComputedFieldLoader(DataLoader):
+    """Render one computed field for many objects at once with `ComputedField.render_many()`."""
+
+    def __init__(self, model, key):
+        super().__init__(max_batch_size=DATALOADER_MAX_BATCH_SIZE)
+        self.model = model
+        self.key = key
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        computed_field = ComputedField.objects.get_for_model(self.model).filter(key=self.key).first()
+        if computed_field is None:
+            logger.warning("Computed Field with key %s does not exist for model %s", self.key, self.model)
+            return Promise.resolve([None] * len(keys))
+        return Promise.resolve(computed_field.render_many(keys))
@@ -2,15 +2,15 @@
 
 import logging
 
+from django.core.exceptions import ValidationError
 import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.dataloaders import ComputedFieldLoader, get_dataloader, RelationshipPeersLoader
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
 from nautobot.core.utils.lookup import get_filterset_for_model
-from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -64,9 +64,10 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
     """
     filterset_class = schema_type._meta.filterset_class
 
-    def resolve_filter(self, *args, **kwargs):
+    def resolve_filter(self, *args, limit=None, offset=None, first=None, after=None, **kwargs):
+        pagination = {"limit": limit, "offset": offset, "first": first, "after": after}
         if not filterset_class:
-            return getattr(self, field_name).all()
+            return paginate_queryset(getattr(self, field_name).all(), **pagination)
 
         # Inverse of substitution logic from get_filtering_args_from_filterset() - transform "_type" back to "type"
         if "_type" in kwargs:
@@ -76,7 +77,7 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
 
         # Check result filter for errors.
         if not resolved_obj.errors:
-            return resolved_obj.qs.all()
+            return paginate_queryset(resolved_obj.qs.all(), **pagination)
 
         errors = {}
 
@@ -110,13 +111,17 @@ def generate_custom_field_resolver(key, resolver_name):
 def generate_computed_field_resolver(name, resolver_name):
     """Generate an instance method for resolving an individual computed field within a given DjangoObjectType.
 
+    The computed field is rendered for all objects of the GraphQL query at once by a `ComputedFieldLoader`.
+
     Args:
         name (str): name of the computed field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
     """
 
     def resolve_computed_field(self, info, **kwargs):
-        return self.get_computed_field(key=name)
+        model = type(self)
+        loader = get_dataloader(info, (ComputedFieldLoader, model, name), lambda: ComputedFieldLoader(model, name))
+        return loader.load(self)
 
     resolve_computed_field.__name__ = resolver_name
     return resolve_computed_field
@@ -125,6 +130,8 @@ def generate_computed_field_resolver(name, resolver_name):
 def generate_relationship_resolver(name, resolver_name, relationship, side, peer_model):
     """Generate function to resolve each custom relationship within each DjangoObjectType.
 
+    The peers of all objects of the GraphQL query are retrieved at once by a `RelationshipPeersLoader`.
+
     Args:
         name (str): name of the custom field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
@@ -134,72 +141,11 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
     """
 
     def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
-        peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
-        if not relationship.symmetric:
-            # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
-        else:
-            # Get objects that are peers for this relationship, regardless of side
-            try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
-        if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+        """Return a list or an object depending on the type of the relationship."""
+        # The same relationship may be queried with different selections in different parts of the GraphQL query
+        key = (RelationshipPeersLoader, relationship.pk, side, id(info.field_asts[0]))
+        loader = get_dataloader(info, key, lambda: RelationshipPeersLoader(relationship, side, info))
+        return loader.load(self)
 
     resolve_relationship.__name__ = resolver_name
     return resolve_relationship
@@ -251,17 +197,64 @@ def generate_list_search_parameters(schema_type):
     search_params = {
         "limit": graphene.Int(),
         "offset": graphene.Int(),
+        "first": graphene.Int(),
+        "after": graphene.ID(),
     }
-    if schema_type._meta.filterset_class is not None:
-        search_params.update(
-            get_filtering_args_from_filterset(
-                schema_type._meta.filterset_class,
-            )
-        )
+    search_params.update(generate_filter_parameters(schema_type))
 
     return search_params
 
 
+def generate_filter_parameters(schema_type):
+    """Generate the filtering query parameters for the list and count resolvers based on a filterset."""
+    if schema_type._meta.filterset_class is None:
+        return {}
+    return get_filtering_args_from_filterset(schema_type._meta.filterset_class)
+
+
+def paginate_queryset(queryset, limit=None, offset=None, first=None, after=None):
+    """
+    Apply the pagination arguments of a list field to the given queryset.
+
+    `limit` and `offset` slice the queryset in its default ordering. As an `OFFSET` requires the database to scan all of
+    the skipped rows, deep pages get progressively slower; `first` and `after` instead paginate by keyset, ordering the
+    queryset by primary key and returning the (first) objects whose primary key is greater than `after`, typically the
+    `id` of the last object of the previous page, so that every page is equally fast to retrieve.
+
+    Args:
+        queryset (QuerySet): Queryset to paginate
+        limit (int): Maximum number of objects to return, in offset mode
+        offset (int): Number of objects to skip, in offset mode
+        first (int): Maximum number of objects to return, in keyset mode
+        after (str): Primary key after which to start returning objects, in keyset mode
+
+    Returns:
+        (QuerySet): The paginated queryset
+    """
+    if first is None and after is None:
+        if offset:
+            queryset = queryset[offset:]
+        if limit:
+            queryset = queryset[:limit]
+        return queryset
+
+    if limit is not None or offset is not None:
+        raise GraphQLError("The `first` and `after` arguments can't be combined with `limit` and `offset`.")
+    if first is not None and first < 0:
+        raise GraphQLError("The `first` argument must not be negative.")
+
+    queryset = queryset.order_by("pk")
+    if after:
+        try:
+            after = queryset.model._meta.pk.to_python(after)
+        except ValidationError:
+            raise GraphQLError(f"Invalid value for the `after` argument: {after!r}")
+        queryset = queryset.filter(pk__gt=after)
+    if first is not None:
+        queryset = queryset[:first]
+    return queryset
+
+
 def generate_single_item_resolver(schema_type, resolver_name):
     """Generate a resolver for a single element of schema_type
 
@@ -286,6 +279,40 @@ def generate_single_item_resolver(schema_type, resolver_name):
     return single_resolver
 
 
+def get_filtered_queryset(schema_type, info, filters):
+    """
+    Return the objects of schema_type that the user can view, filtered with its filterset_class if it has one.
+
+    Args:
+        schema_type (DjangoObjectType): DjangoObjectType for a given model
+        info (ResolveInfo): GraphQL execution info
+        filters (dict): Filtering arguments received by the resolver
+
+    Returns:
+        (QuerySet): The filtered queryset
+    """
+    model = schema_type._meta.model
+    filterset_class = schema_type._meta.filterset_class
+    queryset = model.objects.restrict(info.context.user, "view").all()
+    if filterset_class is None:
+        return queryset
+
+    resolved_obj = filterset_class(filters, queryset)
+
+    # Check result filter for errors.
+    if resolved_obj.errors:
+        errors = {}
+
+        # Build error message from results
+        # Error messages are collected from each filter object
+        for key in resolved_obj.errors:
+            errors[key] = resolved_obj.errors[key]
+
+        # Raising this exception will send the error message in the response of the GraphQL request
+        raise GraphQLError(errors)
+    return resolved_obj.qs.all()
+
+
 def generate_list_resolver(schema_type, resolver_name):
     """
     Generate resolver for a list of schema_type.
@@ -301,39 +328,33 @@ def generate_list_resolver(schema_type, resolver_name):
     Returns:
         (func): Resolver function for list of element
     """
-    model = schema_type._meta.model
-
-    def list_resolver(self, info, limit=None, offset=None, **kwargs):
-        filterset_class = schema_type._meta.filterset_class
-        if filterset_class is not None:
-            resolved_obj = filterset_class(kwargs, model.objects.restrict(info.context.user, "view").all())
 
-            # Check result filter for errors.
-            if resolved_obj.errors:
-                errors = {}
+    def list_resolver(self, info, limit=None, offset=None, first=None, after=None, **kwargs):
+        qs = get_filtered_queryset(schema_type, info, kwargs)
+        qs = paginate_queryset(qs, limit=limit, offset=offset, first=first, after=after)
+        return gql_optimizer.query(qs, info)
 
-                # Build error message from results
-                # Error messages are collected from each filter object
-                for key in resolved_obj.errors:
-                    errors[key] = resolved_obj.errors[key]
+    list_resolver.__name__ = resolver_name
+    return list_resolver
 
-                # Raising this exception will send the error message in the response of the GraphQL request
-                raise GraphQLError(errors)
-            qs = resolved_obj.qs.all()
 
-        else:
-            qs = model.objects.restrict(info.context.user, "view").all()
+def generate_list_count_resolver(schema_type, resolver_name):
+    """
+    Generate resolver for the number of objects of schema_type matching the given filters.
 
-        if offset:
-            qs = qs[offset:]
+    Args:
+        schema_type (DjangoObjectType): DjangoObjectType for a given model
+        resolver_name (str): name of the resolver
 
-        if limit:
-            qs = qs[:limit]
+    Returns:
+        (func): Resolver function for the count of elements
+    """
 
-        return gql_optimizer.query(qs, info)
+    def count_resolver(self, info, **kwargs):
+        return get_filtered_queryset(schema_type, info, kwargs).count()
 
-    list_resolver.__name__ = resolver_name
-    return list_resolver
+    count_resolver.__name__ = resolver_name
+    return count_resolver
 
 
 def generate_attrs_for_schema_type(schema_type):
@@ -351,15 +372,20 @@ def generate_attrs_for_schema_type(schema_type):
     single_item_name = str_to_var_name(model._meta.verbose_name)
     list_name = str_to_var_name(model._meta.verbose_name_plural)
 
-    # Define Attributes for single item and list with their search parameters
+    count_name = f"{list_name}_count"
+
+    # Define Attributes for single item, list and count with their search parameters
     search_params = generate_list_search_parameters(schema_type)
     attrs[single_item_name] = graphene.Field(schema_type, id=graphene.ID())
     attrs[list_name] = graphene.List(schema_type, **search_params)
+    attrs[count_name] = graphene.Int(**generate_filter_parameters(schema_type))
 
-    # Define Resolvers for both single item and list
+    # Define Resolvers for single item, list and count
     single_item_resolver_name = f"{RESOLVER_PREFIX}{single_item_name}"
     list_resolver_name = f"{RESOLVER_PREFIX}{list_name}"
+    count_resolver_name = f"{RESOLVER_PREFIX}{count_name}"
     attrs[single_item_resolver_name] = generate_single_item_resolver(schema_type, single_item_resolver_name)
     attrs[list_resolver_name] = generate_list_resolver(schema_type, list_resolver_name)
+    attrs[count_resolver_name] = generate_list_count_resolver(schema_type, count_resolver_name)
 
     return attrs
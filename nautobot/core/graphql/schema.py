@@ -10,6 +10,7 @@ import graphene
 from graphene.types import generic
 
 from nautobot.circuits.graphql.types import CircuitTerminationType
+from nautobot.core.graphql.dataloaders import ConfigContextLoader, get_dataloader
 from nautobot.core.graphql.generators import (
     generate_attrs_for_schema_type,
     generate_computed_field_resolver,
@@ -352,8 +353,10 @@ def extend_schema_type_config_context(schema_type, model):
     if "local_config_context_data" not in fields_name:
         return schema_type
 
-    def resolve_config_context(self, args):
-        return self.get_config_context()
+    def resolve_config_context(self, info):
+        # Always use the loader, as a `config_context_data` annotation doesn't reflect location inheritance
+        loader = get_dataloader(info, (ConfigContextLoader, model), lambda: ConfigContextLoader(model))
+        return loader.load(self.pk)
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
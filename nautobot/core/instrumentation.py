@@ -0,0 +1,187 @@
+"""
+Instrumentation of the SQL queries run, and time spent, by Nautobot views, GraphQL requests and Jobs.
+
+Views, GraphQL requests and Jobs are wrapped in `instrument()`, which counts and times the SQL queries they run and
+measures their duration, broken down into phases (such as "serializer" and "render") marked with `phase()`. If
+`METRICS_ENABLED` is set, these measurements are published as Prometheus histograms labeled by route and model. If
+`METRICS_QUERY_BUDGET` is set, any request or Job running more SQL queries than that is logged as a warning, along with
+the stacks that ran the first few duplicated queries, which usually point directly at an N+1 query pattern.
+"""
+
+import contextlib
+import contextvars
+import logging
+import os
+import time
+import traceback
+
+from django.conf import settings
+from django.db import connection
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of distinct duplicated SQL queries whose stack is captured, to be logged if the query budget is exceeded
+MAX_DUPLICATE_QUERY_STACKS = 5
+
+# Maximum number of distinct SQL queries tracked when looking for duplicated queries
+MAX_TRACKED_QUERIES = 10000
+
+# Maximum number of stack frames logged per duplicated SQL query
+MAX_STACK_FRAMES = 12
+
+SQL_QUERY_COUNT_METRIC = Histogram(
+    "nautobot_sql_queries",
+    "Number of SQL queries run per Nautobot request or Job.",
+    ["kind", "route", "model"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf")),
+)
+SQL_DURATION_METRIC = Histogram(
+    "nautobot_sql_duration_seconds",
+    "Total time spent running SQL queries per Nautobot request or Job.",
+    ["kind", "route", "model"],
+)
+DURATION_METRIC = Histogram(
+    "nautobot_duration_seconds",
+    "Time spent per Nautobot request or Job, in total and in each phase (serializer, render) of its processing.",
+    ["kind", "route", "model", "phase"],
+)
+
+_current_recorder = contextvars.ContextVar("nautobot_query_recorder", default=None)
+
+# Stack frames from these paths are omitted from the logged stacks of duplicated queries
+_IGNORED_STACK_PATHS = (f"{os.sep}django{os.sep}", __file__)
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording the number and total duration of the SQL queries run.
+
+    If `track_duplicates` is set, it also counts the executions of each distinct SQL statement (before parameter
+    substitution), and captures the stack of the first duplicate execution of up to `MAX_DUPLICATE_QUERY_STACKS` of them.
+    """
+
+    def __init__(self, track_duplicates=False):
+        self.count = 0
+        self.duration = 0.0
+        self.phases = {}
+        self.track_duplicates = track_duplicates
+        self.query_counts = {}
+        self.duplicate_stacks = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            if self.track_duplicates:
+                self._track(sql)
+
+    def _track(self, sql):
+        if sql not in self.query_counts and len(self.query_counts) >= MAX_TRACKED_QUERIES:
+            return
+        count = self.query_counts.get(sql, 0) + 1
+        self.query_counts[sql] = count
+        if count == 2 and len(self.duplicate_stacks) < MAX_DUPLICATE_QUERY_STACKS:
+            frames = [
+                frame
+                for frame in traceback.extract_stack()
+                if not any(path in frame.filename for path in _IGNORED_STACK_PATHS)
+            ]
+            self.duplicate_stacks[sql] = "".join(traceback.format_list(frames[-MAX_STACK_FRAMES:]))
+
+    def get_duplicates_report(self):
+        """Return a human-readable summary of the duplicated queries, with the stacks that were captured."""
+        return "\n".join(
+            f"{self.query_counts[sql]} executions of: {sql}\n{stack}" for sql, stack in self.duplicate_stacks.items()
+        )
+
+
+def is_enabled():
+    """Return whether any instrumentation is enabled."""
+    return bool(settings.METRICS_ENABLED or settings.METRICS_QUERY_BUDGET)
+
+
+@contextlib.contextmanager
+def instrument(kind, route, model=None):
+    """
+    Context manager recording the SQL queries run and the time spent within it, and reporting them when exiting.
+
+    Instrumentation doesn't nest: if already within `instrument()`, such as when a Job runs a GraphQL query, the
+    outermost call accounts for everything.
+
+    Args:
+        kind (str): Kind of operation being instrumented, such as "api", "ui", "graphql" or "job"
+        route (str): Name of the route (i.e. URL pattern) of the request, or of the Job being run
+        model (type): Model the request or Job is about, if any
+
+    Yields:
+        (QueryRecorder): The recorder of the SQL queries, or None if instrumentation is disabled
+    """
+    if not is_enabled() or _current_recorder.get() is not None:
+        yield None
+        return
+
+    budget = settings.METRICS_QUERY_BUDGET
+    recorder = QueryRecorder(track_duplicates=bool(budget))
+    token = _current_recorder.set(recorder)
+    start = time.perf_counter()
+    try:
+        with connection.execute_wrapper(recorder):
+            yield recorder
+    finally:
+        duration = time.perf_counter() - start
+        _current_recorder.reset(token)
+        route = route or "unknown"
+        model = model._meta.label_lower if model is not None else ""
+        if settings.METRICS_ENABLED:
+            SQL_QUERY_COUNT_METRIC.labels(kind, route, model).observe(recorder.count)
+            SQL_DURATION_METRIC.labels(kind, route, model).observe(recorder.duration)
+            DURATION_METRIC.labels(kind, route, model, "total").observe(duration)
+            for phase_name, phase_duration in recorder.phases.items():
+                DURATION_METRIC.labels(kind, route, model, phase_name).observe(phase_duration)
+        if budget and recorder.count > budget:
+            logger.warning(
+                "%s %s ran %d SQL queries, exceeding the budget of %d, spending %.3fs in SQL out of %.3fs in total.%s",
+                kind,
+                route,
+                recorder.count,
+                budget,
+                recorder.duration,
+                duration,
+                f"\nDuplicated queries:\n{recorder.get_duplicates_report()}" if recorder.duplicate_stacks else "",
+            )
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Context manager adding the time spent within it to the given phase of the current `instrument()`, if any."""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.phases[name] = recorder.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def get_route(request):
+    """Return the name of the route that the given request was resolved to."""
+    resolver_match = getattr(request, "resolver_match", None)
+    return resolver_match.view_name if resolver_match is not None else None
+
+
+def render_response(response):
+    """
+    Render a lazily-rendered response (such as a REST API or template response) within the current `instrument()`, so
+    that the time spent rendering it is recorded as the "render" phase.
+    """
+    if _current_recorder.get() is not None and getattr(response, "is_rendered", True) is False:
+        with phase("render"):
+            response.render()
+    return response
@@ -1,15 +1,22 @@
+import functools
+import tempfile
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.http import QueryDict
+from django.test.client import RequestFactory
+from rest_framework import exceptions as drf_exceptions
 
+from nautobot.core.api.csv_import import CSVImporter
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.utils import get_serializer_for_model, serialize_queryset_in_batches
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
-from nautobot.extras.jobs import ChoiceVar, Job, ObjectVar, RunJobTaskFailed, StringVar
+from nautobot.extras.jobs import ChoiceVar, FileVar, Job, ObjectVar, RunJobTaskFailed, StringVar, TextVar
 from nautobot.extras.models import ExportTemplate, GitRepository
 
 name = "System Jobs"
@@ -176,10 +183,86 @@ class ExportObjectList(Job):
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
             # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
             # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
-            self.create_file(filename + ".csv", csv_data)
+            get_serializer = functools.partial(serializer_class, context={"request": None}, force_csv=True)
+            # Serialize and render the objects a batch at a time, spooling the CSV to a temporary file,
+            # so that memory usage doesn't grow with the number of objects being exported.
+            with tempfile.TemporaryFile() as csv_file:
+                for row in renderer.render_stream(serialize_queryset_in_batches(queryset, get_serializer), model=model):
+                    csv_file.write(row.encode("utf-8"))
+                self.create_file(filename + ".csv", csv_file)
+
+
+class ImportObjects(Job):
+    """System Job to import CSV data to create a set of objects."""
+
+    content_type = ObjectVar(
+        model=ContentType,
+        description="Type of objects to import",
+        label="Content Type",
+    )
+    csv_data = TextVar(
+        label="CSV Data",
+        required=False,
+    )
+    csv_file = FileVar(
+        label="CSV File",
+        required=False,
+    )
+
+    class Meta:
+        name = "Import Objects"
+        has_sensitive_variables = False
+        # Importing large amounts of data may take substantial processing time
+        soft_time_limit = 1800
+        time_limit = 2000
+
+    def run(self, *, content_type, csv_data=None, csv_file=None):
+        if not self.user.has_perm(f"{content_type.app_label}.add_{content_type.model}"):
+            self.logger.error('User "%s" does not have permission to create %s objects', self.user, content_type.model)
+            raise PermissionDenied("User does not have create permissions on the requested content-type")
+
+        if csv_file:
+            csv_data = csv_file.read().decode("utf-8")
+        if not csv_data:
+            self.logger.error("Either csv_data or csv_file must be provided")
+            raise RunJobTaskFailed("No CSV data provided")
+
+        model = content_type.model_class()
+        serializer_class = get_serializer_for_model(model)
+        self.logger.debug("Found serializer class: `%s`", serializer_class.__name__)
+        # Some serializers expect to find the requesting user in their context
+        request = RequestFactory().request(SERVER_NAME="import_objects")
+        request.user = self.user
+        importer = CSVImporter(serializer_class, context={"request": request})
+
+        try:
+            data = importer.parse(csv_data)
+        except drf_exceptions.ParseError as exc:
+            self.logger.error("Unable to parse CSV data: %s", exc)
+            raise RunJobTaskFailed("Invalid CSV data") from exc
+
+        self.logger.info(
+            "Importing %d rows of %s. This may take some time.", len(data), model._meta.verbose_name_plural
+        )
+
+        def log_progress(rows_processed, rows_total):
+            self.logger.info("Processed %d of %d rows", rows_processed, rows_total)
+
+        with transaction.atomic():
+            new_objs = importer.run(data, progress_callback=log_progress)
+            if importer.errors:
+                for row, field, err in importer.errors:
+                    self.logger.error("Row %d: `%s`: `%s`", row, field, err)
+                raise RunJobTaskFailed("CSV import failed, no objects were created")
+
+            # Enforce object-level permissions
+            queryset = model.objects.restrict(self.user, "add")
+            if queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
+                self.logger.error("Object import failed due to object-level permissions violation")
+                raise PermissionDenied("User does not have create permissions on some of the requested objects")
+
+        self.logger.info("Created %d %s", len(new_objs), model._meta.verbose_name_plural)
 
 
-jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun]
+jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects]
 register_jobs(*jobs)
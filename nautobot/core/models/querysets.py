@@ -1,4 +1,4 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -124,17 +124,11 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            attrs = Q()
-            for perm_attrs in user._object_perm_cache[permission_required]:
-                if isinstance(perm_attrs, list):
-                    for p in perm_attrs:
-                        attrs |= Q(**p)
-                elif perm_attrs:
-                    attrs |= Q(**perm_attrs)
-                else:
-                    # Any permission with null constraints grants access to _all_ instances
-                    attrs = Q()
-                    break
+            # The constraints are compiled once and cached along with the user's permissions; see ObjectPermissionBackend
+            if hasattr(user, "_object_perm_queries"):
+                attrs = user._object_perm_queries[permission_required]
+            else:
+                attrs = permissions.compile_permission_constraints(user._object_perm_cache[permission_required])
             qs = self.filter(attrs)
 
         return qs
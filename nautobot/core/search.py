@@ -0,0 +1,154 @@
+"""Execution of the global search across all searchable models."""
+
+from collections import namedtuple
+from concurrent.futures import as_completed, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import functools
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.utils import OperationalError
+from django.urls import resolve, reverse
+
+from nautobot.core.constants import SEARCH_MAX_RESULTS
+from nautobot.core.utils.lookup import get_route_for_model, get_searchable_models
+from nautobot.extras.models import SearchDocument
+from nautobot.extras.utils import get_search_indexed_models, is_search_index_enabled
+
+logger = logging.getLogger(__name__)
+
+# The classes needed to find and display the global search results of a searchable model
+SearchTarget = namedtuple("SearchTarget", ["model", "queryset", "filterset", "table", "list_url"])
+
+# The global search results of a single model. `results` holds at most SEARCH_MAX_RESULTS objects; `has_more` is True
+# if there are more matching objects than that. `timed_out` is True if the model couldn't be searched in time.
+SearchResult = namedtuple("SearchResult", ["target", "results", "has_more", "timed_out"])
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_targets():
+    """
+    Return a list of the SearchTargets of all searchable models, in the order in which their results are displayed.
+
+    Each target is resolved once per process, by reverse-looking up the model's list URL, then the view or UIViewSet
+    corresponding to that URL, and finally the queryset, filterset and table classes it uses.
+    """
+    targets = []
+    for model in get_searchable_models():
+        list_url = reverse(get_route_for_model(model, "list"))
+        view_func = resolve(list_url).func
+        # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
+        view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
+        targets.append(
+            SearchTarget(
+                model=model,
+                queryset=view_or_viewset.queryset,
+                # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
+                filterset=getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None)),
+                # For a UIViewSet, .table_class, for an ObjectListView, .table.
+                table=getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None)),
+                list_url=list_url,
+            )
+        )
+    return targets
+
+
+def _get_executor():
+    """Return the thread pool shared by all global searches in this process, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.SEARCH_MAX_WORKERS, thread_name_prefix="search")
+        return _executor
+
+
+def search_model(target, user, value, timeout=None):
+    """
+    Return the SearchResult of the objects of a single searchable model that match `value` and that `user` may view.
+
+    Only the first SEARCH_MAX_RESULTS + 1 matching objects are retrieved, which is enough to tell whether there are more,
+    rather than counting all of them. If `timeout` (in seconds) is given, and the database is PostgreSQL, the query is
+    cancelled once it has run for that long.
+    """
+    queryset = target.queryset.restrict(user, "view")
+    if is_search_index_enabled() and target.model in get_search_indexed_models():
+        queryset = SearchDocument.objects.search(queryset, value)
+    else:
+        queryset = target.filterset({"q": value}, queryset=queryset).qs
+
+    if timeout and connection.vendor == "postgresql" and not connection.in_atomic_block:
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL statement_timeout = %s", [int(timeout * 1000)])
+                results = list(queryset[: SEARCH_MAX_RESULTS + 1])
+        except OperationalError as exc:
+            logger.warning("Global search of %s timed out: %s", target.model._meta.verbose_name_plural, exc)
+            return SearchResult(target=target, results=[], has_more=False, timed_out=True)
+    else:
+        results = list(queryset[: SEARCH_MAX_RESULTS + 1])
+    return SearchResult(
+        target=target,
+        results=results[:SEARCH_MAX_RESULTS],
+        has_more=len(results) > SEARCH_MAX_RESULTS,
+        timed_out=False,
+    )
+
+
+def _search_model_in_thread(target, user, value, timeout):
+    """Run `search_model()` in a worker thread, which uses (and may afterwards close) its own database connection."""
+    close_old_connections()
+    try:
+        return search_model(target, user, value, timeout=timeout)
+    finally:
+        close_old_connections()
+
+
+def iter_search_results(user, value, model_names=None):
+    """
+    Search all (or the given) searchable models for `value`, yielding the SearchResult of each model as it completes.
+
+    With SEARCH_MAX_WORKERS greater than 1, models are searched concurrently on a thread pool shared by all searches,
+    so that the total time taken is close to that of the slowest model rather than the sum of all of them. Any model
+    whose search hasn't completed within SEARCH_MODEL_TIMEOUT seconds yields an empty, `timed_out` result.
+
+    Args:
+        user (User): user performing the search, whose view permissions are enforced
+        value (str): search term
+        model_names (list): only search the models with these (lowercase) model names (optional)
+    """
+    targets = [
+        target for target in get_search_targets() if model_names is None or target.model._meta.model_name in model_names
+    ]
+    timeout = settings.SEARCH_MODEL_TIMEOUT
+
+    if settings.SEARCH_MAX_WORKERS <= 1:
+        for target in targets:
+            yield search_model(target, user, value, timeout=timeout)
+        return
+
+    executor = _get_executor()
+    futures = {executor.submit(_search_model_in_thread, target, user, value, timeout): target for target in targets}
+    pending = set(futures)
+    deadline = time.monotonic() + timeout if timeout else None
+    try:
+        for future in as_completed(futures, timeout=deadline - time.monotonic() if deadline else None):
+            pending.discard(future)
+            yield future.result()
+    except FuturesTimeoutError:
+        for future in pending:
+            future.cancel()
+            target = futures[future]
+            logger.warning("Global search of %s timed out", target.model._meta.verbose_name_plural)
+            yield SearchResult(target=target, results=[], has_more=False, timed_out=True)
+
+
+def get_search_results(user, value, model_names=None):
+    """Search all (or the given) searchable models for `value`, returning their SearchResults in display order."""
+    order = {target.model: index for index, target in enumerate(get_search_targets())}
+    return sorted(iter_search_results(user, value, model_names), key=lambda result: order[result.target.model])
@@ -96,6 +96,8 @@ LOG_DEPRECATION_WARNINGS = is_truthy(os.getenv("NAUTOBOT_LOG_DEPRECATION_WARNING
 MAINTENANCE_MODE = is_truthy(os.getenv("NAUTOBOT_MAINTENANCE_MODE", "False"))
 # Metrics
 METRICS_ENABLED = is_truthy(os.getenv("NAUTOBOT_METRICS_ENABLED", "False"))
+# Log a warning for every request or Job running more SQL queries than this (0 to disable)
+METRICS_QUERY_BUDGET = int(os.getenv("NAUTOBOT_METRICS_QUERY_BUDGET", "0"))
 
 # Napalm
 NAPALM_ARGS = {}
@@ -130,6 +132,13 @@ SANITIZER_PATTERNS = [
     ),
 ]
 
+# Look up global search results with the SearchDocument index (PostgreSQL only) rather than by searching each model
+SEARCH_INDEX_ENABLED = is_truthy(os.getenv("NAUTOBOT_SEARCH_INDEX_ENABLED", "False"))
+# Maximum number of searchable models to search concurrently, per process, in the global search (1 to disable)
+SEARCH_MAX_WORKERS = int(os.getenv("NAUTOBOT_SEARCH_MAX_WORKERS", "4"))
+# Number of seconds after which the global search stops waiting for the results of any model (0 to disable)
+SEARCH_MODEL_TIMEOUT = float(os.getenv("NAUTOBOT_SEARCH_MODEL_TIMEOUT", "10"))
+
 # Storage
 STORAGE_BACKEND = None
 STORAGE_CONFIG = {}
@@ -157,6 +166,10 @@ TEST_PERFORMANCE_BASELINE_FILE = os.getenv(
     "NAUTOBOT_TEST_PERFORMANCE_BASELINE_FILE", "nautobot/core/tests/performance_baselines.yml"
 )
 
+# Maximum number of concurrent webhook requests to any single destination (host and port) across all workers.
+# Deliveries beyond this limit are retried shortly afterward. 0 means unlimited.
+WEBHOOK_MAX_CONCURRENT_REQUESTS = int(os.getenv("NAUTOBOT_WEBHOOK_MAX_CONCURRENT_REQUESTS", "0"))
+
 #
 # Django Prometheus
 #
@@ -586,6 +599,30 @@ CONSTANCE_CONFIG = {
         help_text="Number of days to retain object changelog history.\nSet this to 0 to retain changes indefinitely.",
         field_type=int,
     ),
+    "CONFIG_CONTEXT_CACHE_TIMEOUT": ConstanceConfigItem(
+        default=0,
+        help_text="Rendered config context cache timeout in seconds. This is the amount of time that the rendered config "
+        "context of a Device or Virtual Machine will be cached in Django cache backend. A cached config context is only "
+        "used as long as neither the object itself nor any ConfigContext, ConfigContextSchema or assignment it may depend "
+        "on has changed since it was rendered. The cache is not used if CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED is set. "
+        "Set to 0 to disable caching.",
+        field_type=int,
+    ),
+    "COMPUTED_FIELD_CACHE_TIMEOUT": ConstanceConfigItem(
+        default=0,
+        help_text="Rendered computed field cache timeout in seconds. This is the amount of time that the rendered value "
+        "of a computed field for an object will be cached in Django cache backend. A cached value is only used as long "
+        "as neither the object itself nor the computed field has changed since it was rendered, so this should only be "
+        "enabled if computed field templates don't depend on any related objects. Set to 0 to disable caching.",
+        field_type=int,
+    ),
+    "COMPUTED_FIELD_RENDER_TIMEOUT": ConstanceConfigItem(
+        default=10,
+        help_text="Maximum number of seconds to spend rendering a computed field for the rows of a table in the web UI. "
+        "Once exceeded, the computed field's fallback value is displayed for any remaining rows. REST API, GraphQL and "
+        "export data are always fully rendered. Set to 0 to disable this limit.",
+        field_type=int,
+    ),
     "DEVICE_NAME_AS_NATURAL_KEY": ConstanceConfigItem(
         default=False,
         help_text="Device names are not guaranteed globally-unique by Nautobot but in practice they often are. "
@@ -695,7 +732,13 @@ CONSTANCE_CONFIG_FIELDSETS = {
     "Installation Metrics": ["DEPLOYMENT_ID"],
     "Natural Keys": ["DEVICE_NAME_AS_NATURAL_KEY", "LOCATION_NAME_AS_NATURAL_KEY"],
     "Pagination": ["PAGINATE_COUNT", "MAX_PAGE_SIZE", "PER_PAGE_DEFAULTS"],
-    "Performance": ["DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT", "JOB_CREATE_FILE_MAX_SIZE"],
+    "Performance": [
+        "CONFIG_CONTEXT_CACHE_TIMEOUT",
+        "COMPUTED_FIELD_CACHE_TIMEOUT",
+        "COMPUTED_FIELD_RENDER_TIMEOUT",
+        "DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT",
+        "JOB_CREATE_FILE_MAX_SIZE",
+    ],
     "Rack Elevation Rendering": ["RACK_ELEVATION_DEFAULT_UNIT_HEIGHT", "RACK_ELEVATION_DEFAULT_UNIT_WIDTH"],
     "Release Checking": ["RELEASE_CHECK_URL", "RELEASE_CHECK_TIMEOUT"],
     "User Interface": ["SUPPORT_MESSAGE"],
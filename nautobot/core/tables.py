@@ -367,6 +367,10 @@ class ContentTypesColumn(django_tables2.ManyToManyColumn):
 class ComputedFieldColumn(django_tables2.Column):
     """
     Display computed fields in the appropriate format.
+
+    The computed fields of all of the records displayed by the table are rendered together, with
+    `CustomFieldModel.prefetch_computed_fields()`, when the first record is rendered, subject to
+    `COMPUTED_FIELD_RENDER_TIMEOUT`.
     """
 
     def __init__(self, computedfield, *args, **kwargs):
@@ -377,8 +381,23 @@ class ComputedFieldColumn(django_tables2.Column):
 
         super().__init__(*args, **kwargs)
 
-    def render(self, record):
-        return self.computedfield.render({"obj": record})
+    @staticmethod
+    def prefetch_computed_fields(table, record):
+        """Render the computed field of every ComputedFieldColumn of the table for all records displayed by it."""
+        rows = table.page.object_list if hasattr(table, "page") else table.rows
+        records = [row.record for row in rows]
+        if not any(row_record is record for row_record in records):
+            records = [record]
+        computed_fields = [
+            column.column.computedfield for column in table.columns if isinstance(column.column, ComputedFieldColumn)
+        ]
+        type(record).prefetch_computed_fields(records, computed_fields=computed_fields, time_limit=True)
+
+    def render(self, record, table):  # pylint: disable=arguments-differ
+        prefetched = getattr(record, "prefetched_computed_fields", None)
+        if prefetched is None or self.computedfield.key not in prefetched:
+            self.prefetch_computed_fields(table, record)
+        return record.prefetched_computed_fields[self.computedfield.key]
 
 
 class CustomFieldColumn(django_tables2.Column):
@@ -414,32 +433,38 @@ class CustomFieldColumn(django_tables2.Column):
 class RelationshipColumn(django_tables2.Column):
     """
     Display relationship association instances in the appropriate format.
-    """
 
-    # Add [] to empty_values so when there is no relationship associations i.e. [], "—" is returned automatically.
-    empty_values = (None, "", [])
+    The relationship associations of all of the records displayed by the table are resolved together, with
+    `RelationshipModel.prefetch_relationships()`, when the first record is rendered.
+    """
 
     def __init__(self, relationship, side, *args, **kwargs):
         self.relationship = relationship
         self.side = side
         self.peer_side = choices.RelationshipSideChoices.OPPOSITE[side]
         kwargs.setdefault("verbose_name", relationship.get_label(side))
-        kwargs.setdefault("accessor", Accessor("associations"))
+        # The associations are looked up in render(), so the accessor only needs to provide a non-empty value
+        kwargs.setdefault("accessor", Accessor("pk"))
         super().__init__(orderable=False, *args, **kwargs)
 
-    def render(self, record, value):  # pylint: disable=arguments-differ
-        # Filter the relationship associations by the relationship instance.
-        # Since associations accessor returns all the relationship associations regardless of the relationship.
-        value = [v for v in value if v.relationship == self.relationship]
-        if not self.relationship.symmetric:
-            if self.side == choices.RelationshipSideChoices.SIDE_SOURCE:
-                value = [v for v in value if v.source_id == record.id]
-            else:
-                value = [v for v in value if v.destination_id == record.id]
+    @staticmethod
+    def prefetch_relationships(table, record):
+        """Resolve the relationships of every RelationshipColumn of the table for all records displayed by it."""
+        rows = table.page.object_list if hasattr(table, "page") else table.rows
+        records = [row.record for row in rows]
+        if not any(row_record is record for row_record in records):
+            records = [record]
+        relationships = [
+            column.column.relationship for column in table.columns if isinstance(column.column, RelationshipColumn)
+        ]
+        type(record).prefetch_relationships(records, relationships=relationships)
+
+    def render(self, record, table):  # pylint: disable=arguments-differ
+        if getattr(record, "prefetched_relationships", None) is None:
+            self.prefetch_relationships(table, record)
 
-        # Handle Symmetric Relationships
-        # List `value` could be empty here [] after the filtering from above
-        if len(value) < 1:
+        value = record.get_relationships(include_hidden=True)[self.side].get(self.relationship, [])
+        if not value:
             return "—"
 
         # Handle Relationships on the many side.
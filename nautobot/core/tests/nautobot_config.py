@@ -54,5 +54,9 @@ CELERY_BROKER_URL = "memory://"
 # Metrics need to enabled in this config as overriding them with override_settings will not actually enable them
 METRICS_ENABLED = True
 
+CONFIG_CONTEXT_CACHE_TIMEOUT = 0
+COMPUTED_FIELD_CACHE_TIMEOUT = 0
+# Worker threads use their own database connections, which can't see the data of a test's uncommitted transaction
+SEARCH_MAX_WORKERS = 1
 DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT = 0
 CONTENT_TYPE_CACHE_TIMEOUT = 0
@@ -1,4 +1,5 @@
 import csv
+import functools
 from io import BytesIO, StringIO
 import json
 from unittest import skip
@@ -8,7 +9,9 @@ from constance.test import override_config
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings, RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.exceptions import ParseError
@@ -16,10 +19,11 @@ from rest_framework.settings import api_settings
 
 from nautobot.circuits.models import Provider
 from nautobot.core import testing
+from nautobot.core.api import utils as api_utils
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
 from nautobot.core.api.versioning import NautobotAPIVersioning
-from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
+from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR, SEARCH_MAX_RESULTS
 from nautobot.dcim import models as dcim_models
 from nautobot.dcim.api import serializers as dcim_serializers
 from nautobot.extras import choices, models as extras_models
@@ -180,6 +184,48 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Paginate by cursor, following the next and previous links, and check all records are returned in order."""
+        expected_ids = [str(pk) for pk in Provider.objects.order_by("pk").values_list("pk", flat=True)]
+        self.assertGreater(len(expected_ids), 3)
+
+        response = self.client.get(f"{self.url}?cursor=&limit=3", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsNone(response.data["count"])
+        self.assertIsNone(response.data["previous"])
+        ids = [result["id"] for result in response.data["results"]]
+        self.assertEqual(len(ids), 3)
+        pages = [response.data]
+        while response.data["next"]:
+            self.assertIn("limit=3", response.data["next"])
+            response = self.client.get(response.data["next"], **self.header)
+            self.assertHttpStatus(response, 200)
+            ids.extend(result["id"] for result in response.data["results"])
+            pages.append(response.data)
+        self.assertEqual(ids, expected_ids)
+
+        # Walk back to the first page
+        response = self.client.get(pages[-1]["previous"], **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["results"], pages[-2]["results"])
+
+        # Count only when requested
+        response = self.client.get(f"{self.url}?cursor=&count=true", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], len(expected_ids))
+        self.assertEqual(len(response.data["results"]), min(len(expected_ids), settings.PAGINATE_COUNT))
+
+        # Filtering still applies
+        provider = Provider.objects.order_by("pk").last()
+        response = self.client.get(f"{self.url}?cursor=&name={provider.name}", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["id"] for result in response.data["results"]], [str(provider.pk)])
+
+        # Invalid cursor
+        response = self.client.get(f"{self.url}?cursor=invalid", **self.header)
+        self.assertHttpStatus(response, 404)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -509,6 +555,24 @@ class NautobotCSVRendererTest(TestCase):
         self.assertIn("parent__name", read_data)
         self.assertEqual(read_data["parent__name"], location_type.parent.name)
 
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_render_stream(self):
+        """The streamed CSV of batches of serialized objects should match the CSV of all objects rendered at once."""
+        request = RequestFactory().get(reverse("dcim-api:location-list"), ACCEPT="text/csv")
+        setattr(request, "accepted_media_type", ["text/csv"])
+        queryset = dcim_models.Location.objects.all()
+        self.assertGreater(queryset.count(), 3)
+        get_serializer = functools.partial(
+            dcim_serializers.LocationSerializer, context={"request": request, "depth": 0}
+        )
+
+        renderer = NautobotCSVRenderer()
+        expected = renderer.render(get_serializer(queryset, many=True).data)
+        records = api_utils.serialize_queryset_in_batches(queryset, get_serializer, batch_size=3)
+        self.assertEqual("".join(renderer.render_stream(records, model=dcim_models.Location)), expected)
+
+        self.assertEqual(list(renderer.render_stream([], model=dcim_models.Location)), [])
+
 
 class BaseModelSerializerTest(TestCase):
     """
@@ -577,6 +641,43 @@ class BaseModelSerializerTest(TestCase):
         )
 
 
+class SerializerRelatedLookupsTestCase(testing.APITestCase):
+    """Test that related objects to serialize are loaded according to the serializer's fields."""
+
+    def test_get_related_lookups(self):
+        request = RequestFactory().get("/", {"depth": 1})
+        serializer = dcim_serializers.DeviceSerializer(context={"depth": 1, "request": request})
+        select_related, prefetch_related = serializer.get_related_lookups()
+        # Nested serializers and the related objects that their own natural_slug needs
+        self.assertIn("location", select_related)
+        self.assertIn("device_type", select_related)
+        self.assertIn("device_type__manufacturer", select_related)
+        self.assertIn("tags", prefetch_related)
+        # Not relations
+        self.assertNotIn("name", select_related | prefetch_related)
+        self.assertNotIn("custom_fields", select_related | prefetch_related)
+
+        serializer = dcim_serializers.DeviceSerializer(context={"depth": 0, "request": RequestFactory().get("/")})
+        select_related, prefetch_related = serializer.get_related_lookups()
+        # Only the PKs of related objects are needed at depth 0, except for the natural_slug
+        self.assertNotIn("role", select_related)
+        self.assertIn("tags", prefetch_related)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_constant_query_count(self):
+        """The number of queries for a page of devices at depth 1 shouldn't depend on the number of devices."""
+        url = reverse("dcim-api:device-list")
+        self.assertGreater(dcim_models.Device.objects.count(), 5)
+        query_counts = []
+        for limit in (2, 5):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(f"{url}?depth=1&limit={limit}", **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertEqual(len(response.data["results"]), limit)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+
 class WritableNestedSerializerTest(testing.APITestCase):
     """
     Test the operation of WritableNestedSerializer using VLANSerializer as our test subject.
@@ -922,3 +1023,27 @@ class NewUIGetMenuAPIViewTestCase(testing.APITestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, expected_response)
+
+
+class GlobalSearchViewTestCase(testing.APITestCase):
+    def test_search_streams_results_per_model(self):
+        """Assert that the results of each searched model are streamed as a line of JSON, truncated with `has_more`."""
+        self.add_permissions("circuits.view_provider")
+        for i in range(SEARCH_MAX_RESULTS + 1):
+            Provider.objects.create(name=f"Global Search Provider {i}")
+
+        url = reverse("ui-api:search")
+        response = self.client.get(f"{url}?q=Global+Search+Provider&obj_type=provider", **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["model"], "circuits.provider")
+        self.assertTrue(lines[0]["has_more"])
+        self.assertFalse(lines[0]["timed_out"])
+        self.assertEqual(len(lines[0]["results"]), SEARCH_MAX_RESULTS)
+        self.assertTrue(all(result["display"].startswith("Global Search Provider") for result in lines[0]["results"]))
+
+    def test_search_requires_query(self):
+        response = self.client.get(reverse("ui-api:search"), **self.header)
+        self.assertEqual(response.status_code, 400)
@@ -453,3 +453,55 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         url = reverse("ipam-api:prefix-detail", kwargs={"pk": self.prefixes[0].pk})
         response = self.client.delete(url, format="json", **self.header)
         self.assertEqual(response.status_code, 204)
+
+
+class ObjectPermissionCacheTestCase(TestCase):
+    """Test the caching of the ObjectPermissions granted to a user across requests."""
+
+    def setUp(self):
+        super().setUp()
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"name": "Location 1"},
+            actions=["view"],
+        )
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        self.group = Group.objects.create(name="Test Group")
+        self.group.user_set.add(self.user)
+        self.obj_perm.groups.add(self.group)
+
+    def test_permissions_cached_across_user_instances(self):
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
+
+        # A new instance of the same user, as loaded by each request, doesn't query its permissions again
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("dcim.view_location"))
+            self.assertFalse(user.has_perm("dcim.change_location"))
+            Location.objects.restrict(user, "view")
+
+        self.assertEqual(
+            str(Location.objects.restrict(user, "view").query), str(Location.objects.filter(name="Location 1").query)
+        )
+
+    def test_cache_invalidated_by_permission_changes(self):
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.change_location"))
+
+        self.obj_perm.actions = ["view", "change"]
+        self.obj_perm.save()
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.change_location"))
+
+        self.obj_perm.object_types.clear()
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
+
+    def test_cache_invalidated_by_group_changes(self):
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
+
+        self.user.groups.remove(self.group)
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
+
+        self.user.groups.add(self.group)
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
+
+        self.group.delete()
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.view_location"))
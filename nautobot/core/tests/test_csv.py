@@ -1,11 +1,17 @@
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 
+from nautobot.core.api.csv_import import CSVImporter
 from nautobot.core.constants import CSV_NO_OBJECT, CSV_NULL_TYPE, VARBINARY_IP_FIELD_REPR_OF_CSV_NO_OBJECT
-from nautobot.dcim.api.serializers import DeviceSerializer
+from nautobot.dcim.api.serializers import DeviceSerializer, LocationSerializer
 from nautobot.dcim.models.devices import Device, DeviceType
-from nautobot.dcim.models.locations import Location
+from nautobot.dcim.models.locations import Location, LocationType
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.models import ObjectChange
 from nautobot.extras.models.roles import Role
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.models.tags import Tag
@@ -254,7 +260,7 @@ class CSVParsingRelatedTestCase(TestCase):
         self.client.force_login(user)
         response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
         self.assertEqual(response.status_code, 200)
-        response_data = response.content.decode(response.charset)
+        response_data = response.getvalue().decode(response.charset)
 
         # Replace Device Name
         import_data = response_data.replace("TestDevice1", "TestDevice3").replace("TestDevice2", "")
@@ -285,3 +291,70 @@ class CSVParsingRelatedTestCase(TestCase):
             tenant=self.device2.tenant,
         )
         self.assertEqual(device4.tags.count(), 0)
+
+
+class CSVImporterTestCase(TestCase):
+    def setUp(self):
+        self.user = UserFactory.create(is_superuser=True, is_active=True)
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+        self.status = Status.objects.get_for_model(Location).first()
+        parent_type = LocationType.objects.create(name="Importer Parent Type")
+        child_type = LocationType.objects.create(name="Importer Child Type", parent=parent_type)
+        child_type.content_types.add(ContentType.objects.get_for_model(Device))
+        Location.objects.create(name="Importer Root A", location_type=parent_type, status=self.status)
+
+    def _import(self, csv_rows, **kwargs):
+        importer = CSVImporter(LocationSerializer, context={"request": self.request}, **kwargs)
+        csv_text = "name,location_type,status,parent\n" + "\n".join(csv_rows) + "\n"
+        with web_request_context(self.user):
+            new_objs = importer.run(importer.parse(csv_text))
+        return importer, new_objs
+
+    def test_bulk_create(self):
+        """Valid, independent rows should be created in bulk, with change logging."""
+        with mock.patch.object(CSVImporter, "_import_rows") as import_rows:
+            importer, new_objs = self._import(
+                [
+                    f"Importer Root B,Importer Parent Type,{self.status.name},",
+                    f"Importer Child 1,Importer Child Type,{self.status.name},Importer Root A",
+                    f"Importer Child 2,Importer Child Type,{self.status.name},Importer Root A",
+                ]
+            )
+        import_rows.assert_not_called()
+        self.assertEqual(importer.errors, [])
+        self.assertEqual([obj.name for obj in new_objs], ["Importer Root B", "Importer Child 1", "Importer Child 2"])
+        root_a = Location.objects.get(name="Importer Root A")
+        self.assertEqual(Location.objects.filter(parent=root_a).count(), 2)
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_id__in=[obj.pk for obj in new_objs], action=ObjectChangeActionChoices.ACTION_CREATE
+            ).count(),
+            3,
+        )
+
+    def test_rows_depending_on_earlier_rows(self):
+        """Rows referencing objects created by earlier rows of the same chunk should still be imported."""
+        importer, new_objs = self._import(
+            [
+                f"Importer Root C,Importer Parent Type,{self.status.name},",
+                f"Importer Child 3,Importer Child Type,{self.status.name},Importer Root C",
+            ]
+        )
+        self.assertEqual(importer.errors, [])
+        self.assertEqual(len(new_objs), 2)
+        self.assertEqual(Location.objects.get(name="Importer Child 3").parent.name, "Importer Root C")
+
+    def test_errors_reported_per_row(self):
+        """Invalid rows, including duplicates within a chunk, should be reported without affecting other rows."""
+        importer, new_objs = self._import(
+            [
+                f"Importer Child 4,Importer Child Type,{self.status.name},Importer Root A",
+                "Importer Child 5,Importer Child Type,No Such Status,Importer Root A",
+                f"Importer Child 4,Importer Child Type,{self.status.name},Importer Root A",
+                f"Importer Child 6,Importer Child Type,{self.status.name},Importer Root A",
+            ],
+            batch_size=2,
+        )
+        self.assertEqual([obj.name for obj in new_objs], ["Importer Child 4", "Importer Child 6"])
+        self.assertEqual([(row, field) for row, field, _ in importer.errors], [(2, "status"), (3, "non_field_errors")])
@@ -1,25 +1,31 @@
 import random
 import types
-from unittest import skip
+from unittest import mock, skip
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
 from graphql import get_default_backend, GraphQLError
 from graphql.error.located_error import GraphQLLocatedError
+from graphql.validation import validate
+from promise import Promise
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.backends import CachedDocumentBackend, get_query_hash
+from nautobot.core.graphql.dataloaders import ComputedFieldLoader, RelationshipPeersLoader
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
@@ -60,6 +66,7 @@ from nautobot.dcim.models import (
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import (
     ChangeLoggedModel,
+    ComputedField,
     ConfigContext,
     CustomField,
     GraphQLQuery,
@@ -154,6 +161,37 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         resp = execute_saved_query("GQL 2", user=self.user, variables={"name": "location-1"}).to_dict()
         self.assertFalse(resp["data"].get("error"))
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_cached_document_backend(self):
+        """Ensure that a query is parsed and validated only once, then served from the document cache."""
+        backend = CachedDocumentBackend(maxsize=1)
+        query = "{ query: locations {name} }"
+        request = RequestFactory().post("/graphql/")
+        request.user = self.user
+        with mock.patch("nautobot.core.graphql.backends.validate", wraps=validate) as mock_validate:
+            document = backend.document_from_string(self.SCHEMA, query)
+            self.assertIs(backend.document_from_string(self.SCHEMA, query), document)
+            result = document.execute(context_value=request)
+            self.assertEqual(mock_validate.call_count, 1)
+        self.assertEqual(len(result.data["query"]), Location.objects.count())
+        self.assertEqual(backend.get_query(get_query_hash(query)), query)
+
+        # Invalid queries aren't cached, and still report their errors upon execution
+        invalid_document = backend.document_from_string(self.SCHEMA, "{ locations { nonexistent_field } }")
+        self.assertTrue(invalid_document.execute(context_value=request).invalid)
+        self.assertIs(backend.document_from_string(self.SCHEMA, query), document)
+
+        # Least recently used documents are evicted once the cache is full
+        backend.document_from_string(self.SCHEMA, "{ locations {id} }")
+        self.assertIsNone(backend.get_query(get_query_hash(query)))
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, query), document)
+
+    def test_saved_query_hash(self):
+        """Ensure that saving a query records its hash and loads it into the document cache."""
+        saved_query = GraphQLQuery.objects.get(name="GQL 1")
+        self.assertEqual(saved_query.query_hash, get_query_hash(saved_query.query))
+        self.assertEqual(get_default_backend().get_query(saved_query.query_hash), saved_query.query)
+
     def test_graphql_types_registry(self):
         """Ensure models with graphql feature are registered in the graphene_django registry."""
         graphene_django_registry = get_global_registry()
@@ -168,7 +206,8 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         schema = self.SCHEMA.introspect()
         graphql_fields = schema["__schema"]["types"][0]["fields"]
         for graphql_field in graphql_fields:
-            if graphql_field["type"]["kind"] == "LIST" or graphql_field["name"] == "content_type":
+            # Skip lists and counts of objects
+            if graphql_field["type"]["kind"] in ("LIST", "SCALAR") or graphql_field["name"] == "content_type":
                 continue
             with self.subTest(f"Testing graphql url field for {graphql_field['name']}"):
                 graphene_object_type_definition = self.SCHEMA.get_type(graphql_field["type"]["name"])
@@ -678,6 +717,40 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         self.assertEqual(location_names, ["Location 1"])
         self.assertEqual(rack_names, ["Rack 1-1", "Rack 1-2"])
 
+    def test_graphql_persisted_query(self):
+        """Validate a query can be executed by sending its hash instead of the query itself."""
+        GraphQLQuery.objects.create(name="Racks", query=self.get_racks_query)
+        query_hash = get_query_hash(self.get_racks_query)
+        get_default_backend().clear()
+
+        # Saved query, looked up in the database
+        response = self.clients[2].post(self.api_url, {"id": query_hash}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [item["name"] for item in response.data["data"]["racks"]]
+        self.assertEqual(names, ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
+
+        # Apollo client format, looked up in the document cache
+        payload = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+        response = self.clients[0].post(self.api_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [item["name"] for item in response.data["data"]["racks"]]
+        self.assertEqual(names, ["Rack 1-1", "Rack 1-2"])
+
+        # Query and matching hash
+        payload = {"query": self.get_locations_racks_query, "id": get_query_hash(self.get_locations_racks_query)}
+        response = self.clients[0].post(self.api_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Unknown hash
+        response = self.clients[2].post(self.api_url, {"id": get_query_hash("{ racks { id } }")}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["message"], "PersistedQueryNotFound")
+
+        # Query and mismatched hash
+        payload = {"query": self.get_locations_racks_query, "id": query_hash}
+        response = self.clients[2].post(self.api_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_graphql_query_format(self):
         """Validate application/graphql query is working properly."""
         self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.tokens[2].key}")
@@ -1204,6 +1277,90 @@ query {
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_batched(self):
+        """The config contexts of all devices in a list should be retrieved with a single query."""
+        with CaptureQueriesContext(connection) as captured:
+            result = self.execute_query("query { devices { name config_context } }")
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["devices"]), Device.objects.count())
+        for item in result.data["devices"]:
+            self.assertEqual(item["config_context"], Device.objects.get(name=item["name"]).get_config_context())
+        config_context_queries = [
+            query for query in captured.captured_queries if "extras_configcontext" in query["sql"]
+        ]
+        self.assertEqual(len(config_context_queries), 1)
+
+        # The same request can be used again without seeing stale results
+        device = Device.objects.get(name=result.data["devices"][0]["name"])
+        device.local_config_context_data = {"local": True}
+        device.save()
+        result = self.execute_query(f'query {{ device(id: "{device.pk}") {{ config_context }} }}')
+        self.assertTrue(result.data["device"]["config_context"]["local"])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_inherited_from_ancestor_location(self):
+        """A config context assigned to an ancestor of a device's location should be included in its config_context."""
+        location_status = Status.objects.get_for_model(Location).first()
+        parent_type = LocationType.objects.create(name="Config Context Parent Type")
+        child_type = LocationType.objects.create(name="Config Context Child Type", parent=parent_type)
+        child_type.content_types.add(ContentType.objects.get_for_model(Device))
+        parent = Location.objects.create(
+            name="Config Context Parent", location_type=parent_type, status=location_status
+        )
+        child = Location.objects.create(
+            name="Config Context Child", location_type=child_type, parent=parent, status=location_status
+        )
+        device = Device.objects.create(
+            name="Config Context Device",
+            device_type=self.device_type1,
+            role=self.device_role1,
+            location=child,
+            status=self.device_statuses[0],
+        )
+        config_context = ConfigContext.objects.create(name="Parent Location Context", weight=100, data={"a": 1})
+        config_context.locations.add(parent)
+
+        result = self.execute_query(f'query {{ devices(name: "{device.name}") {{ config_context }} }}')
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data["devices"][0]["config_context"], device.get_config_context())
+        self.assertEqual(result.data["devices"][0]["config_context"]["a"], 1)
+
+    def test_relationship_peers_loader(self):
+        """The peers of many objects should be retrieved with one query for associations and one for peers."""
+        devices = [self.device1, self.device2, self.device3, self.upsdevice1]
+
+        loader = RelationshipPeersLoader(self.relationship_m2ms_1, "source", None)
+        with self.assertNumQueries(2):
+            # Loads are only batched once the event loop runs, as it does during GraphQL execution
+            peers = Promise.resolve(None).then(lambda _: loader.load_many(devices)).get()
+        self.assertEqual(set(peers[0]), {self.device2, self.device3})
+        self.assertEqual(set(peers[1]), {self.device1, self.device3})
+        self.assertEqual(set(peers[2]), {self.device1, self.device2})
+        self.assertEqual(peers[3], [])
+
+        loader = RelationshipPeersLoader(self.relationship_o2o_1, "source", None)
+        with self.assertNumQueries(2):
+            peers = Promise.resolve(None).then(lambda _: loader.load_many(devices)).get()
+        self.assertEqual(peers, [self.virtualmachine, None, None, None])
+
+    def test_computed_field_loader(self):
+        """A computed field should be rendered for many objects with a single query."""
+        ComputedField.objects.create(
+            content_type=ContentType.objects.get_for_model(Device),
+            key="name_upper",
+            label="Name Upper",
+            template="{{ obj.name | upper }}",
+        )
+        devices = [self.device1, self.device2]
+        loader = ComputedFieldLoader(Device, "name_upper")
+        with self.assertNumQueries(1):
+            values = Promise.resolve(None).then(lambda _: loader.load_many(devices)).get()
+        self.assertEqual(values, [device.name.upper() for device in devices])
+
+        loader = ComputedFieldLoader(Device, "no_such_field")
+        self.assertEqual(loader.load_many(devices).get(), [None, None])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_console_ports_cable_peer(self):
         """Test querying console port terminations for their cable peers"""
@@ -2182,6 +2339,50 @@ query {
         result_2 = self.execute_query(query_all)
         self.assertEqual(len(result_2.data.get("interfaces", [])), 6)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_interface_keyset_pagination(self):
+        query = """\
+query ($first: Int, $after: ID) {
+    interfaces(first: $first, after: $after) {
+        id
+        name
+    }
+}"""
+        expected_ids = [str(pk) for pk in Interface.objects.order_by("pk").values_list("pk", flat=True)]
+        ids = []
+        after = None
+        while True:
+            result = self.execute_query(query, variables={"first": 4, "after": after})
+            self.assertIsNone(result.errors)
+            page = [item["id"] for item in result.data["interfaces"]]
+            if not page:
+                break
+            self.assertLessEqual(len(page), 4)
+            ids.extend(page)
+            after = page[-1]
+        self.assertEqual(ids, expected_ids)
+
+        # Nested lists support keyset pagination as well
+        query = '{ devices(name: "Device 1") { interfaces(first: 1) { id } } }'
+        result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            [item["id"] for item in result.data["devices"][0]["interfaces"]],
+            [str(Interface.objects.filter(device=self.device1).order_by("pk").first().pk)],
+        )
+
+        result = self.execute_query("{ interfaces(first: 2, offset: 2) { id } }")
+        self.assertIsNotNone(result.errors)
+        result = self.execute_query('{ interfaces(after: "not-a-uuid") { id } }')
+        self.assertIsNotNone(result.errors)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_interfaces_count(self):
+        result = self.execute_query('{ interfaces_count device: interfaces_count(device: "Device 1") }')
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data["interfaces_count"], Interface.objects.count())
+        self.assertEqual(result.data["device"], Interface.objects.filter(device=self.device1).count())
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_power_feeds_cable_peer(self):
         """Test querying power feeds for their cable peers"""
@@ -0,0 +1,72 @@
+"""Test the nautobot.core.instrumentation module."""
+
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from nautobot.circuits.models import Provider
+from nautobot.core import instrumentation, testing
+from nautobot.dcim.models import Location
+
+
+class InstrumentationTestCase(testing.TestCase):
+    @override_settings(METRICS_ENABLED=False, METRICS_QUERY_BUDGET=0)
+    def test_disabled(self):
+        with instrumentation.instrument("test", "disabled") as recorder:
+            list(Location.objects.all())
+        self.assertIsNone(recorder)
+
+    @override_settings(METRICS_ENABLED=False, METRICS_QUERY_BUDGET=3)
+    def test_query_budget(self):
+        locations = list(Location.objects.all()[:5])
+        self.assertEqual(len(locations), 5)
+
+        with self.assertLogs("nautobot.core.instrumentation", level="WARNING") as logs:
+            with instrumentation.instrument("test", "budget", model=Location) as recorder:
+                for location in locations:
+                    # Deliberate N+1 query
+                    Location.objects.get(pk=location.pk)
+                # Instrumentation doesn't nest; the outermost recorder sees all queries
+                with instrumentation.instrument("test", "nested") as nested_recorder:
+                    Location.objects.count()
+        self.assertIsNone(nested_recorder)
+        self.assertEqual(recorder.count, 6)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("test budget ran 6 SQL queries, exceeding the budget of 3", logs.output[0])
+        self.assertIn("5 executions of:", logs.output[0])
+        self.assertIn('FROM "dcim_location"', logs.output[0])
+        self.assertIn("test_instrumentation.py", logs.output[0])
+
+        with mock.patch.object(instrumentation.logger, "warning") as mock_warning:
+            with instrumentation.instrument("test", "budget"):
+                Location.objects.count()
+        mock_warning.assert_not_called()
+
+
+class InstrumentationAPITestCase(testing.APITestCase):
+    def get_sample_value(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], METRICS_ENABLED=True, METRICS_QUERY_BUDGET=0)
+    def test_api_metrics(self):
+        labels = {"kind": "api", "route": "circuits-api:provider-list", "model": "circuits.provider"}
+        request_count = self.get_sample_value("nautobot_sql_queries_count", **labels)
+        query_count = self.get_sample_value("nautobot_sql_queries_sum", **labels)
+        serializer_count = self.get_sample_value("nautobot_duration_seconds_count", phase="serializer", **labels)
+        render_count = self.get_sample_value("nautobot_duration_seconds_count", phase="render", **labels)
+
+        response = self.client.get(reverse("circuits-api:provider-list"), **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], Provider.objects.count())
+
+        self.assertEqual(self.get_sample_value("nautobot_sql_queries_count", **labels), request_count + 1)
+        self.assertGreater(self.get_sample_value("nautobot_sql_queries_sum", **labels), query_count)
+        self.assertEqual(
+            self.get_sample_value("nautobot_duration_seconds_count", phase="serializer", **labels),
+            serializer_count + 1,
+        )
+        self.assertEqual(
+            self.get_sample_value("nautobot_duration_seconds_count", phase="render", **labels), render_count + 1
+        )
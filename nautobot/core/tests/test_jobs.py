@@ -110,3 +110,57 @@ class ExportObjectListTest(TransactionTestCase):
         yaml_data = job_result.files.first().file.read().decode("utf-8")
         data = yaml.safe_load(yaml_data)
         self.assertEqual(data["manufacturer"], "Cisco")
+
+
+class ImportObjectsTest(TransactionTestCase):
+    """
+    Test the ImportObjects system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    csv_data = "name,description\nImported Manufacturer 1,First\nImported Manufacturer 2,Second\n"
+
+    def test_import_without_permission(self):
+        """Job should enforce user permissions on the content-type being imported."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            username=self.user.username,  # otherwise run_job_for_testing defaults to a superuser account
+            content_type=ContentType.objects.get_for_model(Manufacturer).pk,
+            csv_data=self.csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_error = JobLogEntry.objects.get(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            log_error.message, f'User "{self.user}" does not have permission to create manufacturer objects'
+        )
+        self.assertFalse(Manufacturer.objects.filter(name__startswith="Imported Manufacturer").exists())
+
+    def test_import_csv_data(self):
+        """Job should create all objects described by the CSV data."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Manufacturer).pk,
+            csv_data=self.csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(Manufacturer.objects.get(name="Imported Manufacturer 1").description, "First")
+        self.assertEqual(Manufacturer.objects.get(name="Imported Manufacturer 2").description, "Second")
+        self.assertTrue(
+            JobLogEntry.objects.filter(job_result=job_result, message="Processed 2 of 2 rows").exists(),
+        )
+
+    def test_import_with_errors(self):
+        """Job should report per-row errors and not create any objects if any row is invalid."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Manufacturer).pk,
+            csv_data=self.csv_data + "Imported Manufacturer 1,Duplicate\n",
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_error = JobLogEntry.objects.get(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertIn("Row 3: `name`", log_error.message)
+        self.assertFalse(Manufacturer.objects.filter(name__startswith="Imported Manufacturer").exists())
@@ -0,0 +1,71 @@
+"""Test the nautobot.core.search module."""
+
+import threading
+from unittest import mock
+
+from django.test import override_settings
+
+from nautobot.circuits.models import Provider
+from nautobot.core import search, testing
+from nautobot.tenancy.models import Tenant
+
+
+@override_settings(SEARCH_MAX_WORKERS=4, SEARCH_MODEL_TIMEOUT=10)
+class ConcurrentSearchTestCase(testing.TransactionTestCase):
+    """
+    Test the global search of models on the thread pool.
+
+    This is a TransactionTestCase because each worker thread uses its own database connection, which can only see
+    committed data.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+    def test_search_results(self):
+        """Results of each model are found by the worker threads and returned in display order."""
+        for i in range(search.SEARCH_MAX_RESULTS + 1):
+            Provider.objects.create(name=f"Concurrent Search {i}")
+        Tenant.objects.create(name="Concurrent Search Tenant")
+
+        with mock.patch(
+            "nautobot.core.search.close_old_connections", wraps=search.close_old_connections
+        ) as mock_close_old_connections:
+            results = search.get_search_results(self.user, "Concurrent Search", model_names=["tenant", "provider"])
+
+        order = [target.model for target in search.get_search_targets()]
+        self.assertEqual([result.target.model for result in results], sorted([Tenant, Provider], key=order.index))
+        results_by_model = {result.target.model: result for result in results}
+        self.assertEqual(len(results_by_model[Provider].results), search.SEARCH_MAX_RESULTS)
+        self.assertTrue(results_by_model[Provider].has_more)
+        self.assertEqual([tenant.name for tenant in results_by_model[Tenant].results], ["Concurrent Search Tenant"])
+        self.assertFalse(results_by_model[Tenant].has_more)
+        self.assertFalse(any(result.timed_out for result in results))
+        # Each worker thread's database connection is cleaned up both before and after searching each model
+        self.assertEqual(mock_close_old_connections.call_count, 2 * len(results))
+
+    @override_settings(SEARCH_MODEL_TIMEOUT=0.5)
+    def test_search_timeout(self):
+        """A model whose search doesn't complete in time is reported as timed out, without delaying the others."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        search_model = search.search_model
+
+        def slow_search_model(target, user, value, timeout=None):
+            if target.model is Provider:
+                release.wait(10)
+                return search.SearchResult(target=target, results=[], has_more=False, timed_out=False)
+            return search_model(target, user, value, timeout=timeout)
+
+        with mock.patch("nautobot.core.search.search_model", side_effect=slow_search_model):
+            results = list(search.iter_search_results(self.user, "anything", model_names=["tenant", "provider"]))
+
+        results_by_model = {result.target.model: result for result in results}
+        self.assertEqual(set(results_by_model), {Provider, Tenant})
+        self.assertTrue(results_by_model[Provider].timed_out)
+        self.assertEqual(results_by_model[Provider].results, [])
+        self.assertFalse(results_by_model[Tenant].timed_out)
+        # The timed out model is yielded last, once the others have completed
+        self.assertIs(results[-1].target.model, Provider)
@@ -1,3 +1,4 @@
+from unittest import mock
 import uuid
 
 from django import forms as django_forms
@@ -12,7 +13,7 @@ from nautobot.circuits import models as circuits_models
 from nautobot.core import exceptions, forms, settings_funcs
 from nautobot.core.api import utils as api_utils
 from nautobot.core.models import fields as core_fields, utils as models_utils
-from nautobot.core.utils import data as data_utils, filtering, lookup, requests
+from nautobot.core.utils import cache as cache_utils, data as data_utils, filtering, lookup, requests
 from nautobot.core.utils.migrations import update_object_change_ct_for_replaced_models
 from nautobot.dcim import filters as dcim_filters, forms as dcim_forms, models as dcim_models, tables
 from nautobot.extras import models as extras_models, utils as extras_utils
@@ -157,6 +158,69 @@ class FlattenIterableTest(TestCase):
         self.assertEqual(list(data_utils.flatten_iterable(items)), expected)
 
 
+class BatchedTest(TestCase):
+    """Tests for the `batched()` function."""
+
+    def test_batched(self):
+        self.assertEqual(list(data_utils.batched(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(data_utils.batched(iter(range(4)), 2)), [[0, 1], [2, 3]])
+        self.assertEqual(list(data_utils.batched([], 2)), [])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(data_utils.batched([1, 2], 0))
+
+
+class GenerationLRUCacheTest(TestCase):
+    """Tests for the `generation_lru_cache()` decorator."""
+
+    def setUp(self):
+        self.generation_key = f"test.{uuid.uuid4()}.cache_generation"
+        self.calls = []
+
+        @cache_utils.generation_lru_cache(self.generation_key)
+        def cached_function(value):
+            self.calls.append(value)
+            return value * 2
+
+        self.cached_function = cached_function
+
+    def test_cached_in_process(self):
+        self.assertEqual(self.cached_function(1), 2)
+        self.assertEqual(self.cached_function(1), 2)
+        self.assertEqual(self.calls, [1])
+
+    def test_cache_clear(self):
+        self.cached_function(1)
+        self.cached_function.cache_clear()
+        self.cached_function(1)
+        self.assertEqual(self.calls, [1, 1])
+
+    @mock.patch("nautobot.core.utils.cache.CACHE_GENERATION_CHECK_INTERVAL", 0)
+    def test_invalidated_by_other_process(self):
+        self.cached_function(1)
+        self.cached_function(1)
+        self.assertEqual(self.calls, [1])
+        # Another process invalidating its cache bumps the shared generation without touching this process' cache
+        cache_utils.bump_cache_generation(self.generation_key)
+        self.cached_function(1)
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_check_interval(self):
+        @cache_utils.generation_lru_cache(self.generation_key, check_interval=0)
+        def cached_function(value):
+            self.calls.append(value)
+            return value * 2
+
+        cached_function(1)
+        cached_function(1)
+        self.assertEqual(self.calls, [1])
+        # With a check_interval of 0, the shared generation is checked on every call, never returning stale results
+        cache_utils.bump_cache_generation(self.generation_key)
+        cached_function(1)
+        self.assertEqual(self.calls, [1, 1])
+
+
 class GetFooForModelTest(TestCase):
     """Tests for the various `get_foo_for_model()` functions."""
 
@@ -0,0 +1,73 @@
+"""Helpers for in-process caches that are kept consistent across all Nautobot processes."""
+
+import functools
+import threading
+import time
+
+from django.core.cache import cache
+
+# Minimum number of seconds between checks of the shared generation counter of a `generation_lru_cache`
+CACHE_GENERATION_CHECK_INTERVAL = 1
+
+
+def get_cache_generation(generation_key):
+    """Return the current value of the shared generation counter `generation_key`, or None if it's never been set."""
+    return cache.get(generation_key)
+
+
+def bump_cache_generation(generation_key):
+    """Increment the shared generation counter `generation_key`, invalidating any caches that depend on it."""
+    cache.add(generation_key, 0, timeout=None)
+    return cache.incr(generation_key)
+
+
+def generation_lru_cache(generation_key, maxsize=128, check_interval=None):
+    """
+    Decorator like `functools.lru_cache`, but whose `cache_clear()` invalidates the cache in every process.
+
+    Results are cached in-process as usual; `cache_clear()` additionally increments a generation counter stored in the
+    shared (Redis) cache. Each process compares the shared generation against the one its cache was populated under,
+    at most once every `check_interval` (by default, `CACHE_GENERATION_CHECK_INTERVAL`) seconds, and clears its own
+    cache when they differ.
+
+    Args:
+        generation_key (str): Key of the shared generation counter. Functions caching related data may share a key.
+        maxsize (int): Maximum number of results to cache in each process.
+        check_interval (float): Minimum number of seconds between checks of the shared generation counter. Set this to
+            0 to check it on every call, so that other processes never use stale results.
+    """
+
+    def decorator(func):
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+        lock = threading.Lock()
+        state = {"generation": None, "checked": None}
+
+        def check_generation():
+            now = time.monotonic()
+            interval = CACHE_GENERATION_CHECK_INTERVAL if check_interval is None else check_interval
+            if state["checked"] is not None and now - state["checked"] < interval:
+                return
+            generation = get_cache_generation(generation_key)
+            with lock:
+                state["checked"] = now
+                if generation != state["generation"]:
+                    cached_func.cache_clear()
+                    state["generation"] = generation
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            check_generation()
+            return cached_func(*args, **kwargs)
+
+        def cache_clear():
+            generation = bump_cache_generation(generation_key)
+            with lock:
+                cached_func.cache_clear()
+                state["generation"] = generation
+                state["checked"] = time.monotonic()
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cached_func.cache_info
+        return wrapper
+
+    return decorator
@@ -1,5 +1,7 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
 import uuid
 
 from django.core import validators
@@ -11,6 +13,23 @@ from nautobot.dcim import choices  # TODO move dcim.choices.CableLengthUnitChoic
 UtilizationData = namedtuple("UtilizationData", ["numerator", "denominator"])
 
 
+def batched(iterable, n):
+    """
+    Batch data from the iterable into lists of length n. The last batch may be shorter.
+
+    Equivalent to `itertools.batched()` in Python 3.12+, except that it yields lists rather than tuples.
+
+    :param iterable: The iterable to be batched
+    :param n: Maximum number of items per batch
+    :returns: generator
+    """
+    if n < 1:
+        raise ValueError("n must be at least one")
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+
 def deepmerge(original, new):
     """
     Deep merge two dictionaries (new into original) and return a new dict
@@ -93,12 +112,21 @@ def merge_dicts_without_collision(d1, d2):
     return {**d1, **d2}
 
 
+@lru_cache(maxsize=1024)
+def _compile_jinja2(rendering_engine, template_code):
+    """
+    Compile the given template code once per process, since `render_jinja2` is frequently called repeatedly with the
+    same template (for example, the same webhook body or computed field template for many objects).
+    """
+    return rendering_engine.from_string(template_code)
+
+
 def render_jinja2(template_code, context):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
     """
     rendering_engine = engines["jinja"]
-    template = rendering_engine.from_string(template_code)
+    template = _compile_jinja2(rendering_engine, template_code)
     # For reasons unknown to me, django-jinja2 `template.render()` implicitly calls `mark_safe()` on the rendered text.
     # This is a security risk in general, especially so in our case because we're often using this function to render
     # a user-provided template and don't want to open ourselves up to script injection or similar issues.
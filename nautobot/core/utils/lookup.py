@@ -44,6 +44,19 @@ def get_model_from_name(model_name):
         raise TypeError(exc) from exc
 
 
+def get_searchable_models():
+    """
+    Return the list of model classes included in the global search, in the order in which their results are displayed.
+
+    These are the models listed in the `searchable_models` attribute (if any) of each app's `AppConfig`.
+    """
+    searchable_models = []
+    for app_config in apps.get_app_configs():
+        for model_name in getattr(app_config, "searchable_models", []):
+            searchable_models.append(apps.get_model(app_config.label, model_name))
+    return searchable_models
+
+
 def get_route_for_model(model, action, api=False):
     """
     Return the URL route name for the given model and action. Does not perform any validation.
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
 
 
 def get_permission_for_model(model, action):
@@ -66,3 +67,22 @@ def permission_is_exempt(name):
             return True
 
     return False
+
+
+def compile_permission_constraints(constraints):
+    """
+    Compile a list of ObjectPermission constraint sets into a single `Q` object matching any of them.
+
+    :param constraints: List of constraint dicts, as returned by `ObjectPermission.list_constraints()`
+    """
+    query = Q()
+    for constraint_set in constraints:
+        if isinstance(constraint_set, list):
+            for constraint_subset in constraint_set:
+                query |= Q(**constraint_subset)
+        elif constraint_set:
+            query |= Q(**constraint_set)
+        else:
+            # Any permission with null constraints grants access to _all_ instances
+            return Q()
+    return query
@@ -4,8 +4,8 @@ import sys
 import time
 
 from db_file_storage.views import get_file
-from django.apps import apps
 from django.conf import settings
+from django.contrib import messages
 from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
@@ -13,7 +13,7 @@ from django.http import HttpResponse, HttpResponseForbidden, HttpResponseServerE
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template import loader, RequestContext, Template
 from django.template.exceptions import TemplateDoesNotExist
-from django.urls import resolve, reverse
+from django.urls import reverse
 from django.views.csrf import csrf_failure as _csrf_failure
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME, page_not_found
@@ -25,10 +25,9 @@ from prometheus_client import multiprocess
 from prometheus_client.metrics_core import GaugeMetricFamily
 from prometheus_client.registry import Collector
 
-from nautobot.core.constants import SEARCH_MAX_RESULTS
 from nautobot.core.forms import SearchForm
 from nautobot.core.releases import get_latest_release
-from nautobot.core.utils.lookup import get_route_for_model
+from nautobot.core.search import get_search_results
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.extras.forms import GraphQLQueryForm
 from nautobot.extras.models import FileProxy, GraphQLQuery, Status
@@ -144,49 +143,29 @@ class SearchView(AccessMixin, View):
         results = []
 
         if form.is_valid():
-            # Build the list of (app_label, modelname) tuples, representing all models included in the global search,
-            # based on the `app_config.searchable_models` list (if any) defined by each app
-            searchable_models = []
-            for app_config in apps.get_app_configs():
-                if hasattr(app_config, "searchable_models"):
-                    searchable_models += [(app_config.label, modelname) for modelname in app_config.searchable_models]
-
             if form.cleaned_data["obj_type"]:
                 # Searching for a single type of object
                 obj_types = [form.cleaned_data["obj_type"]]
             else:
                 # Searching all object types
-                obj_types = [model_info[1] for model_info in searchable_models]
+                obj_types = None
 
-            for label, modelname in searchable_models:
-                if modelname not in obj_types:
+            for result in get_search_results(request.user, form.cleaned_data["q"], model_names=obj_types):
+                name = result.target.model._meta.verbose_name_plural
+                if result.timed_out:
+                    messages.warning(request, f"The search of {name} took too long and was cancelled.")
+                if not result.results:
                     continue
-                # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
-                # corresponding to that URL, and finally the queryset, filterset, and table classes needed
-                # to find and display the model search results.
-                url = get_route_for_model(f"{label}.{modelname}", "list")
-                view_func = resolve(reverse(url)).func
-                # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
-                view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
-                queryset = view_or_viewset.queryset.restrict(request.user, "view")
-                # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
-                filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
-                # For a UIViewSet, .table_class, for an ObjectListView, .table.
-                table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
-
                 # Construct the results table for this object type
-                filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
-                table = table(filtered_queryset, orderable=False)
-                table.paginate(per_page=SEARCH_MAX_RESULTS)
-
-                if table.page:
-                    results.append(
-                        {
-                            "name": queryset.model._meta.verbose_name_plural,
-                            "table": table,
-                            "url": f"{reverse(url)}?q={form.cleaned_data.get('q')}",
-                        }
-                    )
+                results.append(
+                    {
+                        "name": name,
+                        "table": result.target.table(result.results, orderable=False),
+                        "count": len(result.results),
+                        "has_more": result.has_more,
+                        "url": f"{result.target.list_url}?q={form.cleaned_data.get('q')}",
+                    }
+                )
 
         return render(
             request,
@@ -28,6 +28,7 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from nautobot.core import instrumentation
 from nautobot.core.api.views import BulkDestroyModelMixin, BulkUpdateModelMixin
 from nautobot.core.forms import (
     BootstrapMixin,
@@ -159,10 +160,11 @@ class ObjectPermissionRequiredMixin(AccessMixin):
                 )
             )
 
-        if not self.has_permission():
-            return self.handle_no_permission()
+        with instrumentation.instrument("ui", instrumentation.get_route(request), model=self.queryset.model):
+            if not self.has_permission():
+                return self.handle_no_permission()
 
-        return super().dispatch(request, *args, **kwargs)
+            return instrumentation.render_response(super().dispatch(request, *args, **kwargs))
 
 
 class GetReturnURLMixin:
@@ -287,15 +289,17 @@ class NautobotViewSetMixin(GenericViewSet, AccessMixin, GetReturnURLMixin, FormV
         # If the user is not authenticated or does not have the permission to perform certain actions,
         # DRF NotAuthenticated or PermissionDenied exception can be raised appropriately and handled by self.handle_no_permission() in the UI.
         # initialize_request() also instantiates self.action which is needed for permission checks.
-        api_request = self.initialize_request(request, *args, **kwargs)
-        try:
-            self.check_permissions(api_request)
-        # check_permissions() could raise NotAuthenticated and PermissionDenied Error.
-        # We handle them by a single except statement since self.handle_no_permission() is able to handle both errors
-        except (exceptions.NotAuthenticated, exceptions.PermissionDenied):
-            return self.handle_no_permission()
+        model = getattr(self.queryset, "model", None)
+        with instrumentation.instrument("ui", instrumentation.get_route(request), model=model):
+            api_request = self.initialize_request(request, *args, **kwargs)
+            try:
+                self.check_permissions(api_request)
+            # check_permissions() could raise NotAuthenticated and PermissionDenied Error.
+            # We handle them by a single except statement since self.handle_no_permission() is able to handle both errors
+            except (exceptions.NotAuthenticated, exceptions.PermissionDenied):
+                return self.handle_no_permission()
 
-        return super().dispatch(request, *args, **kwargs)
+            return instrumentation.render_response(super().dispatch(request, *args, **kwargs))
 
     def get_table_class(self):
         # Check if self.table_class is specified in the ModelViewSet before performing subsequent actions
@@ -0,0 +1,283 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.models import Cable, CablePath, FrontPort, RearPort
+from nautobot.dcim.utils import compile_path_node
+
+
+def object_to_node(obj):
+    """
+    Return the `(content type ID, object ID)` tuple identifying the given object within a CableGraph.
+    """
+    return ContentType.objects.get_for_model(obj).pk, obj.pk
+
+
+class CableGraph:
+    """
+    An in-memory index of cables and pass-through mappings, used to trace many CablePaths at once.
+
+    Nodes are `(content type ID, object ID)` tuples. The graph is loaded lazily, one connected component at a time:
+    each hop reached costs a fixed number of bulk queries no matter how many paths pass through it, and tracing itself
+    is performed entirely in memory using the same rules as `CablePath.from_origin()`.
+
+    `exclude_cables` may be used to ignore Cables that are in the process of being deleted.
+    """
+
+    def __init__(self, exclude_cables=None):
+        self.exclude_cables = set(exclude_cables or ())
+
+        self.cable_ct_id = ContentType.objects.get_for_model(Cable).pk
+        self.front_port_ct_id = ContentType.objects.get_for_model(FrontPort).pk
+        self.rear_port_ct_id = ContentType.objects.get_for_model(RearPort).pk
+        self.circuit_termination_ct_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        connected_status = Cable.STATUS_CONNECTED
+        self.connected_status_id = connected_status.pk if connected_status is not None else None
+
+        # {node: (cable_pk, peer_node)}
+        self.cables = {}
+        # {cable_pk: status_pk}
+        self.cable_statuses = {}
+        # {front_port_pk: (rear_port_pk, rear_port_position)}
+        self.front_ports = {}
+        # {rear_port_pk: positions}
+        self.rear_ports = {}
+        # {(rear_port_pk, rear_port_position): front_port_pk}
+        self.rear_port_positions = {}
+        # {circuit_termination_pk: peer_circuit_termination_pk or None}
+        self.circuit_peers = {}
+        # Nodes whose attached cable (if any) is already known
+        self._loaded = set()
+
+    def load(self, nodes):
+        """
+        Load the connected component(s) containing the given nodes into the graph.
+        """
+        pending = set(nodes) - self._loaded
+        while pending:
+            self._loaded.update(pending)
+            peers = self._load_cables(pending)
+            # A termination can only have a single Cable, which we now know for each peer as well
+            self._loaded.update(peers)
+            pending = self._load_pass_throughs(pending | peers) - self._loaded
+
+    def _load_cables(self, nodes):
+        """
+        Load the Cables attached to the given nodes and return the set of their far-end terminations.
+        """
+        peers = set()
+        object_ids = {object_id for _, object_id in nodes}
+        cables = (
+            Cable.objects.filter(Q(termination_a_id__in=object_ids) | Q(termination_b_id__in=object_ids))
+            .exclude(pk__in=self.exclude_cables)
+            .values_list(
+                "pk",
+                "status_id",
+                "termination_a_type_id",
+                "termination_a_id",
+                "termination_b_type_id",
+                "termination_b_id",
+            )
+        )
+        for cable_pk, status_pk, a_type_id, a_id, b_type_id, b_id in cables:
+            termination_a = (a_type_id, a_id)
+            termination_b = (b_type_id, b_id)
+            self.cable_statuses[cable_pk] = status_pk
+            self.cables[termination_a] = (cable_pk, termination_b)
+            self.cables[termination_b] = (cable_pk, termination_a)
+            peers.update((termination_a, termination_b))
+        return peers - nodes
+
+    def _load_pass_throughs(self, nodes):
+        """
+        Load the FrontPort/RearPort mappings and CircuitTermination peers for the given nodes.
+
+        Returns the set of nodes reachable on the far side of each pass-through.
+        """
+        reached = set()
+        front_port_pks = set()
+        rear_port_pks = set()
+        circuit_termination_pks = set()
+        for content_type_id, object_id in nodes:
+            if content_type_id == self.front_port_ct_id and object_id not in self.front_ports:
+                front_port_pks.add(object_id)
+            elif content_type_id == self.rear_port_ct_id and object_id not in self.rear_ports:
+                rear_port_pks.add(object_id)
+            elif content_type_id == self.circuit_termination_ct_id and object_id not in self.circuit_peers:
+                circuit_termination_pks.add(object_id)
+
+        if front_port_pks:
+            for rear_port_pk in FrontPort.objects.filter(pk__in=front_port_pks).values_list("rear_port_id", flat=True):
+                if rear_port_pk not in self.rear_ports:
+                    rear_port_pks.add(rear_port_pk)
+
+        if rear_port_pks:
+            self.rear_ports.update(RearPort.objects.filter(pk__in=rear_port_pks).values_list("pk", "positions"))
+            reached.update((self.rear_port_ct_id, pk) for pk in rear_port_pks)
+            front_ports = FrontPort.objects.filter(rear_port_id__in=rear_port_pks).values_list(
+                "pk", "rear_port_id", "rear_port_position"
+            )
+            for front_port_pk, rear_port_pk, position in front_ports:
+                self.front_ports[front_port_pk] = (rear_port_pk, position)
+                self.rear_port_positions[(rear_port_pk, position)] = front_port_pk
+                reached.add((self.front_port_ct_id, front_port_pk))
+
+        if circuit_termination_pks:
+            circuit_terminations = CircuitTermination.objects.filter(
+                circuit_id__in=CircuitTermination.objects.filter(pk__in=circuit_termination_pks).values("circuit_id")
+            ).values_list("pk", "circuit_id", "term_side")
+            sides = {}
+            for pk, circuit_pk, term_side in circuit_terminations:
+                sides[(circuit_pk, term_side)] = pk
+            for (circuit_pk, term_side), pk in sides.items():
+                peer_side = "Z" if term_side == "A" else "A"
+                self.circuit_peers[pk] = sides.get((circuit_pk, peer_side))
+                reached.add((self.circuit_termination_ct_id, pk))
+
+        return reached
+
+    def trace(self, origin):
+        """
+        Trace the path originating from the given node.
+
+        Returns a dict of CablePath field values, or None if the origin has no Cable attached.
+        """
+        self.load([origin])
+        if origin not in self.cables:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while node in self.cables:
+            if node in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node)
+            cable_pk, peer_termination = self.cables[node]
+            if self.cable_statuses[cable_pk] != self.connected_status_id:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append((self.cable_ct_id, cable_pk))
+            peer_type_id, peer_id = peer_termination
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_ct_id:
+                path.append(peer_termination)
+                rear_port_pk, position = self.front_ports[peer_id]
+                if self.rear_ports[rear_port_pk] > 1:
+                    position_stack.append(position)
+                node = (self.rear_port_ct_id, rear_port_pk)
+                path.append(node)
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_ct_id:
+                path.append(peer_termination)
+
+                # Determine the peer FrontPort's position
+                if self.rear_ports[peer_id] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_pk = self.rear_port_positions.get((peer_id, position))
+                if front_port_pk is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_ct_id, front_port_pk)
+                path.append(node)
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_ct_id:
+                peer_circuit_termination_pk = self.circuit_peers.get(peer_id)
+                # A Circuit Termination does not require a peer.
+                if peer_circuit_termination_pk is None:
+                    destination = peer_termination
+                    break
+                node = (self.circuit_termination_ct_id, peer_circuit_termination_pk)
+                path.append(peer_termination)
+                path.append(node)
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer_termination
+                break
+
+        return {
+            "path": [compile_path_node(*path_node) for path_node in path],
+            "destination_type_id": destination[0] if destination else None,
+            "destination_id": destination[1] if destination else None,
+            "is_active": is_active and destination is not None,
+            "is_split": is_split,
+        }
+
+    def rebuild(self, origins):
+        """
+        Trace the CablePaths for all of the given origin nodes and write any changes to the database.
+
+        New paths are created with `bulk_create()`, changed paths are updated in place with `bulk_update()`, and paths
+        whose origin is no longer cabled are deleted.
+
+        Returns a `(created, updated, deleted)` tuple of counts.
+        """
+        origins = set(origins)
+        if not origins:
+            return 0, 0, 0
+        self.load(origins)
+
+        existing_paths = {}
+        for cable_path in CablePath.objects.filter(origin_id__in={object_id for _, object_id in origins}):
+            origin = (cable_path.origin_type_id, cable_path.origin_id)
+            if origin in origins:
+                existing_paths[origin] = cable_path
+
+        to_create = []
+        to_update = []
+        to_delete = []
+        for origin in origins:
+            traced = self.trace(origin)
+            cable_path = existing_paths.get(origin)
+            if traced is None:
+                if cable_path is not None:
+                    to_delete.append(cable_path.pk)
+            elif cable_path is None:
+                to_create.append(CablePath(origin_type_id=origin[0], origin_id=origin[1], **traced))
+            elif any(getattr(cable_path, field_name) != value for field_name, value in traced.items()):
+                for field_name, value in traced.items():
+                    setattr(cable_path, field_name, value)
+                to_update.append(cable_path)
+
+        with transaction.atomic():
+            if to_delete:
+                CablePath.objects.filter(pk__in=to_delete).delete()
+            if to_update:
+                CablePath.objects.bulk_update(
+                    to_update, ["path", "destination_type", "destination_id", "is_active", "is_split"]
+                )
+            if to_create:
+                CablePath.objects.bulk_create(to_create)
+                # Record a direct reference to each new CablePath on its originating object, as CablePath.save() does
+                origins_by_type = defaultdict(list)
+                for cable_path in to_create:
+                    origins_by_type[cable_path.origin_type_id].append(cable_path)
+                for origin_type_id, cable_paths in origins_by_type.items():
+                    model = ContentType.objects.get_for_id(origin_type_id).model_class()
+                    model.objects.bulk_update(
+                        [model(pk=cable_path.origin_id, _path_id=cable_path.pk) for cable_path in cable_paths],
+                        ["_path"],
+                    )
+
+        return len(to_create), len(to_update), len(to_delete)
@@ -1,8 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from django.core.management.color import no_style
-from django.db import connection
+from django.db import connections
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cable_graph import CableGraph
 from nautobot.dcim.models import (
     CablePath,
     ConsolePort,
@@ -12,7 +18,9 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
+
+# Cache key under which the progress of an interrupted `--force` run is recorded
+CHECKPOINT_CACHE_KEY = "dcim.trace_paths.checkpoint"
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -24,6 +32,44 @@ ENDPOINT_MODELS = (
     PowerPort,
 )
 
+# CableGraph used by the current process; each worker process builds its own
+_graph = None
+
+# Database connections inherited by a forked worker process from its parent, which must be neither used nor closed
+_inherited_connections = []
+
+
+def _init_worker():
+    global _graph
+    _graph = CableGraph()
+
+
+def _init_worker_process():
+    """
+    Initialize a forked worker process.
+
+    The parent process may have (re)opened its database connections before forking this worker. The worker must not
+    use those inherited sockets, nor close them (which would terminate the parent's database session), so it sets
+    them aside, keeping a reference so that they're never garbage-collected, and opens its own connections as needed.
+    Worker processes exit without running finalizers, so the inherited connections are never closed.
+    """
+    for conn in connections.all():
+        if conn.connection is not None:
+            _inherited_connections.append(conn.connection)
+            conn.connection = None
+    _init_worker()
+
+
+def _trace_batch(content_type_id, origin_ids):
+    """
+    Retrace the paths originating from the given objects of a single model.
+
+    Returns a `(created, updated, deleted)` tuple of counts.
+    """
+    if _graph is None:
+        _init_worker()
+    return _graph.rebuild((content_type_id, pk) for pk in origin_ids)
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in Nautobot"
@@ -41,59 +87,128 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to trace paths with (default: 1)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of path origins to trace and write per batch (default: 1000)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            dest="resume",
+            help="Resume an interrupted --force recalculation from its last checkpoint",
+        )
 
-    def draw_progress_bar(self, percentage):
+    def draw_progress_bar(self, percentage, rate=None):
         """
         Draw a simple progress bar 20 increments wide illustrating the specified percentage.
         """
         bar_size = int(percentage / 5)
-        self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
+        rate = f" ({int(rate)}/s)" if rate is not None else ""
+        self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%{rate}", ending="")
 
     def handle(self, *model_names, **options):
-        # If --force was passed, first delete all existing CablePaths
+        checkpoint = {}
         if options["force"]:
-            cable_paths = CablePath.objects.all()
-            paths_count = cable_paths.count()
+            if options["resume"]:
+                checkpoint = cache.get(CHECKPOINT_CACHE_KEY) or {}
+                if checkpoint:
+                    self.stdout.write("Resuming recalculation of all cable paths from the last checkpoint")
 
             # Prompt the user to confirm recalculation of all paths
-            if paths_count and not options["no_input"]:
+            paths_count = CablePath.objects.count()
+            if paths_count and not checkpoint and not options["no_input"]:
                 self.stdout.write(self.style.ERROR("WARNING: Forcing recalculation of all cable paths."))
-                self.stdout.write(
-                    f"This will delete and recalculate all {paths_count} existing cable paths. Are you sure?"
-                )
+                self.stdout.write(f"This will recalculate all {paths_count} existing cable paths. Are you sure?")
                 confirmation = input("Type yes to confirm: ")
                 if confirmation != "yes":
                     self.stdout.write(self.style.SUCCESS("Aborting"))
                     return
 
-            # Delete all existing CablePath instances
-            self.stdout.write(f"Deleting {paths_count} existing cable paths...")
-            deleted_count, _ = CablePath.objects.all().delete()
-            self.stdout.write((self.style.SUCCESS(f"  Deleted {deleted_count} paths")))
-
-            # Reinitialize the model's PK sequence
-            self.stdout.write("Resetting database sequence for CablePath model")
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
-            with connection.cursor() as cursor:
-                for sql in sequence_sql:
-                    cursor.execute(sql)
-
-        # Retrace paths
-        for model in ENDPOINT_MODELS:
-            origins = model.objects.filter(cable__isnull=False)
-            if not options["force"]:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
-                self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
-                continue
-            self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+        executor = None
+        if options["workers"] > 1:
+            # Workers are forked lazily, once the first batch is submitted; see _init_worker_process()
+            executor = ProcessPoolExecutor(
+                max_workers=options["workers"],
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker_process,
+            )
+        else:
+            _init_worker()
+
+        try:
+            for model in ENDPOINT_MODELS:
+                self.trace_model_paths(model, executor, checkpoint, **options)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
+        if options["force"]:
+            cache.delete(CHECKPOINT_CACHE_KEY)
         self.stdout.write(self.style.SUCCESS("Finished."))
+
+    def trace_model_paths(self, model, executor, checkpoint, **options):
+        """
+        Retrace the paths originating from all cabled instances of the given endpoint model, in batches.
+
+        Existing paths are updated in place, so every path remains valid (if not yet current) while a `--force`
+        recalculation is in progress. The last completed batch is recorded as a checkpoint to resume from.
+        """
+        label = model._meta.label_lower
+        content_type_id = ContentType.objects.get_for_model(model).pk
+        origins = model.objects.filter(cable__isnull=False).order_by("pk")
+        if not options["force"]:
+            origins = origins.filter(_path__isnull=True)
+        elif label in checkpoint:
+            origins = origins.filter(pk__gt=checkpoint[label])
+        origin_ids = list(origins.values_list("pk", flat=True))
+        origins_count = len(origin_ids)
+
+        if options["force"]:
+            # Remove any paths from origins that are no longer cabled
+            stale_paths = CablePath.objects.filter(origin_type_id=content_type_id).exclude(
+                origin_id__in=model.objects.filter(cable__isnull=False).values("pk")
+            )
+            deleted_count, _ = stale_paths.delete()
+            if deleted_count:
+                self.stdout.write(f"Deleted {deleted_count} stale {model._meta.verbose_name} paths")
+
+        if not origins_count:
+            self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
+            return
+        self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
+
+        batches = [origin_ids[i : i + options["batch_size"]] for i in range(0, origins_count, options["batch_size"])]
+        if executor is not None:
+            results = executor.map(_trace_batch, [content_type_id] * len(batches), batches)
+        else:
+            results = (_trace_batch(content_type_id, batch) for batch in batches)
+
+        start_time = time.monotonic()
+        traced_count = 0
+        totals = [0, 0, 0]
+        # Results are yielded in order, so once a batch is reported every batch before it is also complete
+        for batch, counts in zip(batches, results):
+            traced_count += len(batch)
+            totals = [total + count for total, count in zip(totals, counts)]
+            if options["force"]:
+                checkpoint[label] = batch[-1]
+                cache.set(CHECKPOINT_CACHE_KEY, checkpoint, timeout=None)
+            elapsed = time.monotonic() - start_time
+            self.draw_progress_bar(traced_count * 100 / origins_count, traced_count / elapsed if elapsed else None)
+
+        created, updated, deleted = totals
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n  Retraced {traced_count} {model._meta.verbose_name_plural} "
+                f"({created} created, {updated} updated, {deleted} deleted)"
+            )
+        )
@@ -461,6 +461,10 @@ class BaseInterface(RelationshipModel):
         help_text="Assigned bridge interface",
     )
 
+    # save() only defaults the status (which validated data always includes) and clears the tagged VLANs of existing
+    # interfaces, so new interfaces may be created in bulk, e.g. by CSV import, without calling it.
+    bulk_create_safe_save = True
+
     class Meta:
         abstract = True
 
@@ -8,6 +8,7 @@ from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .cable_graph import CableGraph, object_to_node
 from .models import (
     Cable,
     CablePath,
@@ -29,28 +30,17 @@ def create_cablepath(node, rebuild=True):
 
     rebuild (bool) - Used to refresh paths where this node is not an endpoint.
     """
-    cp = CablePath.from_origin(node)
-    if cp:
-        try:
-            cp.save()
-        except Exception as e:
-            print(node, node.pk)
-            raise e
+    origins = {object_to_node(node)}
     if rebuild:
-        rebuild_paths(node)
+        origins.update(CablePath.objects.filter(path__contains=node).values_list("origin_type_id", "origin_id"))
+    CableGraph().rebuild(origins)
 
 
 def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
-
-    with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+    CableGraph().rebuild(CablePath.objects.filter(path__contains=obj).values_list("origin_type_id", "origin_id"))
 
 
 #
@@ -225,11 +215,14 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
 
     # Create/update cable paths
     if created:
+        origins = set()
         for termination in (instance.termination_a, instance.termination_b):
             if isinstance(termination, PathEndpoint):
-                create_cablepath(termination)
-            else:
-                rebuild_paths(termination)
+                origins.add(object_to_node(termination))
+            origins.update(
+                CablePath.objects.filter(path__contains=termination).values_list("origin_type_id", "origin_id")
+            )
+        CableGraph().rebuild(origins)
     elif instance.status != instance._orig_status:
         # We currently don't support modifying either termination of an existing Cable. (This
         # may change in the future.) However, we do need to capture status changes and update
@@ -260,18 +253,9 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b.save()
 
     # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    CableGraph(exclude_cables=[instance.pk]).rebuild(
+        CablePath.objects.filter(path__contains=instance).values_list("origin_type_id", "origin_id")
+    )
 
 
 #
@@ -1,8 +1,15 @@
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.core.testing import TransactionTestCase
+from nautobot.dcim.cable_graph import CableGraph, object_to_node
+from nautobot.dcim.management.commands.trace_paths import CHECKPOINT_CACHE_KEY
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -1494,3 +1501,155 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_303_cable_graph_traces_in_memory(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C5-- [RP2] [FP2:1] --C3-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C4-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 5)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=2)
+        frontports = [
+            FrontPort.objects.create(
+                device=self.device,
+                name=f"Front Port {rearport.name[-1]}:{position}",
+                rear_port=rearport,
+                rear_port_position=position,
+            )
+            for rearport in (rearport1, rearport2)
+            for position in (1, 2)
+        ]
+        for interface, frontport in zip(interfaces, frontports):
+            Cable(termination_a=interface, termination_b=frontport, status=self.status).save()
+        Cable(termination_a=rearport1, termination_b=rearport2, status=self.status_planned).save()
+        self.assertEqual(CablePath.objects.count(), 4)
+
+        graph = CableGraph()
+        graph.load(object_to_node(interface) for interface in interfaces)
+        with self.assertNumQueries(0):
+            traced_paths = [graph.trace(object_to_node(interface)) for interface in interfaces]
+
+        for interface, traced in zip(interfaces, traced_paths):
+            interface.refresh_from_db()
+            expected = CablePath.from_origin(interface)
+            self.assertEqual(traced["path"], expected.path)
+            self.assertEqual(traced["destination_id"], expected.destination.pk)
+            self.assertFalse(traced["is_active"])
+            self.assertFalse(traced["is_split"])
+
+            cablepath = CablePath.objects.get(pk=interface._path_id)
+            self.assertEqual(cablepath.path, expected.path)
+            self.assertEqual(cablepath.destination, expected.destination)
+
+        # Retracing unchanged paths is a no-op
+        self.assertEqual(graph.rebuild(object_to_node(interface) for interface in interfaces), (0, 0, 0))
+
+    def test_304_trace_paths_command(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name="Interface 1", status=self.interface_status)
+        interface2 = Interface.objects.create(device=self.device, name="Interface 2", status=self.interface_status)
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=1)
+        frontport1 = FrontPort.objects.create(
+            device=self.device,
+            name="Front Port 1",
+            rear_port=rearport1,
+            rear_port_position=1,
+        )
+        cable1 = Cable(termination_a=interface1, termination_b=frontport1, status=self.status)
+        cable1.save()
+        cable2 = Cable(termination_a=rearport1, termination_b=interface2, status=self.status)
+        cable2.save()
+
+        # Missing paths are traced
+        CablePath.objects.all().delete()
+        call_command("trace_paths", stdout=StringIO())
+        self.assertPathExists(
+            origin=interface1,
+            destination=interface2,
+            path=(cable1, frontport1, rearport1, cable2),
+            is_active=True,
+        )
+        self.assertEqual(CablePath.objects.count(), 2)
+
+        # Forced recalculation retraces existing paths in place
+        path_pks = set(CablePath.objects.values_list("pk", flat=True))
+        CablePath.objects.update(is_active=False)
+        call_command("trace_paths", "--force", "--no-input", "--batch-size", "1", stdout=StringIO())
+        self.assertEqual(set(CablePath.objects.filter(is_active=True).values_list("pk", flat=True)), path_pks)
+
+    def test_305_trace_paths_command_resume(self):
+        """
+        [IF1] --C1-- [IF2]
+        [IF3] --C2-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 5)
+        ]
+        Cable(termination_a=interfaces[0], termination_b=interfaces[1], status=self.status).save()
+        Cable(termination_a=interfaces[2], termination_b=interfaces[3], status=self.status).save()
+        self.assertEqual(CablePath.objects.count(), 4)
+
+        # Simulate a --force run interrupted after retracing the paths of the first two interfaces (by pk)
+        interface_pks = sorted(interface.pk for interface in interfaces)
+        CablePath.objects.update(is_active=False)
+        CablePath.objects.filter(origin_id__in=interface_pks[:2]).update(is_active=True)
+        cache.set(CHECKPOINT_CACHE_KEY, {"dcim.interface": interface_pks[1]}, timeout=None)
+
+        out = StringIO()
+        call_command("trace_paths", "--force", "--resume", "--no-input", "--batch-size", "1", stdout=out)
+        self.assertIn("Resuming recalculation of all cable paths from the last checkpoint", out.getvalue())
+        self.assertIn("Retracing 2 cabled interfaces", out.getvalue())
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 4)
+        # A completed run removes its checkpoint
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+
+
+class TracePathsWorkersTestCase(TransactionTestCase):
+    """
+    Test the trace_paths command with multiple worker processes, which need their own committed view of the database.
+    """
+
+    def test_trace_paths_command_workers(self):
+        location_type = LocationType.objects.create(name="Campus")
+        location = Location.objects.create(
+            name="Location 1",
+            location_type=location_type,
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        manufacturer = Manufacturer.objects.create(name="Manufacturer 1")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Test Device")
+        device_role = Role.objects.create(name="Device Role 1")
+        device_role.content_types.add(ContentType.objects.get_for_model(Device))
+        device = Device.objects.create(
+            location=location,
+            device_type=device_type,
+            role=device_role,
+            name="Test Device",
+            status=Status.objects.get_for_model(Device).first(),
+        )
+        interface_status = Status.objects.get_for_model(Interface).first()
+        interfaces = [
+            Interface.objects.create(device=device, name=f"Interface {i}", status=interface_status) for i in range(8)
+        ]
+        cable_status = Status.objects.get_for_model(Cable).get(name="Connected")
+        for interface_a, interface_b in zip(interfaces[::2], interfaces[1::2]):
+            Cable(termination_a=interface_a, termination_b=interface_b, status=cable_status).save()
+
+        CablePath.objects.all().delete()
+        call_command("trace_paths", "--workers", "2", "--batch-size", "2", stdout=StringIO())
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 8)
+        for interface in Interface.objects.all():
+            self.assertIsNotNone(interface._path_id)
+
+        # The parent process's own database connection remains usable after the workers have run
+        path_pks = set(CablePath.objects.values_list("pk", flat=True))
+        CablePath.objects.update(is_active=False)
+        call_command("trace_paths", "--force", "--no-input", "--workers", "2", "--batch-size", "3", stdout=StringIO())
+        self.assertEqual(set(CablePath.objects.filter(is_active=True).values_list("pk", flat=True)), path_pks)
@@ -1,11 +1,11 @@
 import logging
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import Q, QuerySet
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import JSONField
 from rest_framework.reverse import reverse
-from rest_framework.serializers import ValidationError
+from rest_framework.serializers import ListSerializer, ValidationError
 
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.mixins import WritableSerializerMixin
@@ -106,6 +106,8 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
                 }`
         """
         data = {}
+        if getattr(value, "prefetched_relationships", None) is None:
+            self.prefetch_relationships(value)
         relationships_data = value.get_relationships(include_hidden=True)
         for this_side, relationships in relationships_data.items():
             for relationship, associations in relationships.items():
@@ -166,6 +168,19 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
         logger.debug("to_representation(%s) -> %s", value, data)
         return data
 
+    def prefetch_relationships(self, value):
+        """
+        Resolve the relationships of all objects being serialized together with `value` at once.
+
+        When `value` is one of a list of objects being serialized, `RelationshipModel.prefetch_relationships()` is
+        applied to the whole list, rather than looking up the relationships of each object in turn.
+        """
+        list_serializer = getattr(self.parent, "parent", None)
+        instances = getattr(list_serializer, "instance", None) if isinstance(list_serializer, ListSerializer) else None
+        if not isinstance(instances, (list, QuerySet)) or not any(instance is value for instance in instances):
+            instances = [value]
+        type(value).prefetch_relationships(list(instances))
+
     def build_nested_field(self, field_name, relation_info, nested_depth):
         return nested_serializer_factory(relation_info, nested_depth)
 
@@ -157,23 +157,29 @@ class ComputedFieldViewSet(NotesViewSetMixin, ModelViewSet):
 class ConfigContextQuerySetMixin:
     """
     Used by views that work with config context models (device and virtual machine).
-    Provides a get_queryset() method which deals with adding the config context
-    data annotation or not.
+    Provides a get_serializer() method which renders the config context of all serialized objects at once, if requested.
     """
 
-    def get_queryset(self):
+    def get_serializer(self, *args, **kwargs):
         """
-        Build the proper queryset based on the request context
-
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
-
-        Else, return the base queryset.
+        If the `include` query param includes `config_context`, render the config context of all the objects to be
+        serialized with ConfigContextModelQuerySet.get_config_contexts(), rather than for each object in turn.
         """
-        queryset = super().get_queryset()
         request = self.get_serializer_context()["request"]
-        if request is not None and "config_context" in request.query_params.get("include", []):
-            return queryset.annotate_config_context_data()
-        return queryset
+        if (
+            args
+            and kwargs.get("many")
+            and request is not None
+            and "config_context" in request.query_params.get("include", [])
+        ):
+            objects = list(args[0])
+            config_contexts = self.queryset.model.objects.filter(
+                pk__in=[obj.pk for obj in objects]
+            ).get_config_contexts()
+            for obj in objects:
+                obj.rendered_config_context = config_contexts.get(obj.pk)
+            args = (objects, *args[1:])
+        return super().get_serializer(*args, **kwargs)
 
 
 class ConfigContextViewSet(NotesViewSetMixin, ModelViewSet):
@@ -48,6 +48,18 @@ JOB_LOG_MAX_ABSOLUTE_URL_LENGTH = 255
 CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL = 400
 CHANGELOG_MAX_OBJECT_REPR = 200
 
+# Default number of pending ObjectChange records buffered by a ChangeContext with `defer_object_changes=True`
+CHANGELOG_DEFERRED_OBJECT_CHANGES_BUFFER_SIZE = 1000
+
+# Number of ObjectChange records for which webhooks and job hooks are dispatched together at the end of a change context
+CHANGELOG_EVENT_DISPATCH_BATCH_SIZE = 1000
+
+# Shared generation counter of the cached rendered config contexts, incremented whenever any of them may be stale
+CONFIG_CONTEXT_CACHE_GENERATION_KEY = "extras.configcontext.cache_generation"
+
+# Number of DynamicGroups whose membership of a changed object is evaluated together in a single query
+DYNAMIC_GROUP_MEMBERSHIP_EVALUATION_BATCH_SIZE = 100
+
 # JobResult custom Celery kwargs
 JOB_RESULT_CUSTOM_CELERY_KWARGS = (
     "nautobot_job_profile",
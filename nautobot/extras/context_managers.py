@@ -3,12 +3,42 @@ import uuid
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test.client import RequestFactory
 
+from nautobot.core.utils.data import batched
 from nautobot.extras.choices import ObjectChangeEventContextChoices
+from nautobot.extras.constants import (
+    CHANGELOG_DEFERRED_OBJECT_CHANGES_BUFFER_SIZE,
+    CHANGELOG_EVENT_DISPATCH_BATCH_SIZE,
+    CHANGELOG_MAX_OBJECT_REPR,
+)
 from nautobot.extras.models import ObjectChange
 from nautobot.extras.signals import change_context_state
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.webhooks import enqueue_webhooks_for_object_changes
+
+
+class _TransactionScope:
+    """
+    Marker registered with `transaction.on_commit()` for the atomic block(s) in which deferred ObjectChanges were recorded.
+
+    Django discards `on_commit` callbacks registered inside a savepoint that is rolled back, so a scope is still valid
+    when it either already ran (the transaction committed) or is still pending on the connection.
+    """
+
+    def __init__(self, using=None):
+        self.using = using
+        self.committed = False
+
+    def __call__(self):
+        self.committed = True
+
+    def is_valid(self):
+        if self.committed:
+            return True
+        connection = transaction.get_connection(self.using)
+        return any(entry[1] is self for entry in connection.run_on_commit)
 
 
 class ChangeContext:
@@ -18,14 +48,31 @@ class ChangeContext:
     one will be generated to relate any changes to this transaction. Convenience
     classes are provided for each context.
 
+    When `defer_object_changes` is True, ObjectChange records are buffered in memory instead of being written to the
+    database as each signal fires. Repeated changes to the same object are coalesced in the buffer, and the pending
+    records are written with `bulk_create()`/`bulk_update()` when the buffer reaches `object_change_buffer_size` or
+    when the enclosing `change_logging()` block exits. Changes recorded inside a transaction savepoint that is later
+    rolled back are discarded from the buffer, matching the non-deferred behavior.
+
     :param user: User object
     :param request: WSGIRequest object to retrieve user from django rest framework after authentication is performed
     :param context: Context of the transaction, must match a choice in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param context_detail: Optional extra details about the transaction (ex: the plugin name that initiated the change)
     :param change_id: Optional uuid object to uniquely identify the transaction. One will be generated if not supplied
+    :param defer_object_changes: Optional boolean to buffer ObjectChange records and write them in bulk
+    :param object_change_buffer_size: Optional maximum number of buffered ObjectChange records before they are flushed
     """
 
-    def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None):
+    def __init__(
+        self,
+        user=None,
+        request=None,
+        context=None,
+        context_detail="",
+        change_id=None,
+        defer_object_changes=False,
+        object_change_buffer_size=CHANGELOG_DEFERRED_OBJECT_CHANGES_BUFFER_SIZE,
+    ):
         self.request = request
         self.user = user
 
@@ -42,16 +89,128 @@ class ChangeContext:
 
         self.context_detail = context_detail
 
+        # A caller-supplied change_id may already have ObjectChanges recorded against it in the database
+        self._has_stored_object_changes = change_id is not None
         self.change_id = change_id
         if self.change_id is None:
             self.change_id = uuid.uuid4()
 
+        self.defer_object_changes = defer_object_changes
+        self.object_change_buffer_size = object_change_buffer_size
+        # Most recent pending ObjectChange, keyed by (content type pk, object pk, user pk)
+        self._deferred_object_changes = {}
+        # Pending ObjectChanges to create or update, keyed by ObjectChange pk, with the _TransactionScope they belong to
+        self._deferred_creates = {}
+        self._deferred_updates = {}
+        self._transaction_scopes = {}
+
     def get_user(self):
         """Return self.user if set, otherwise return self.request.user"""
         if self.user is not None:
             return self.user
         return self.request.user
 
+    def get_most_recent_object_change(self, instance, user):
+        """
+        Return the most recent ObjectChange recorded in this context for the given object and user, or None.
+
+        Pending deferred records are consulted first, so that repeated changes to the same object do not require
+        any database queries.
+        """
+        content_type = ContentType.objects.get_for_model(instance)
+        key = (content_type.pk, instance.pk, getattr(user, "pk", None))
+        if key in self._deferred_object_changes:
+            objectchange, scope = self._deferred_object_changes[key]
+            if scope is None or scope.is_valid():
+                return objectchange
+            self._discard_rolled_back_object_changes()
+
+        if self.defer_object_changes and not self._has_stored_object_changes:
+            return None
+
+        return (
+            ObjectChange.objects.filter(
+                changed_object_type=content_type,
+                changed_object_id=instance.pk,
+                user=user,
+                request_id=self.change_id,
+            )
+            .order_by("-time")
+            .first()
+        )
+
+    def save_object_change(self, objectchange):
+        """Save the given ObjectChange, or buffer it for a later bulk write if deferring object changes."""
+        if not self.defer_object_changes:
+            objectchange.save()
+            self._has_stored_object_changes = True
+            return
+
+        # Replicate the denormalization normally performed by ObjectChange.save(), which bulk_create() bypasses
+        if not objectchange.user_name:
+            objectchange.user_name = objectchange.user.username if objectchange.user else "Undefined"
+        if not objectchange.object_repr:
+            objectchange.object_repr = str(objectchange.changed_object)[:CHANGELOG_MAX_OBJECT_REPR]
+
+        scope = self._get_transaction_scope()
+        if objectchange._state.adding:
+            self._deferred_creates[objectchange.pk] = (objectchange, scope)
+        elif objectchange.pk not in self._deferred_creates:
+            self._deferred_updates[objectchange.pk] = (objectchange, scope)
+        key = (objectchange.changed_object_type_id, objectchange.changed_object_id, objectchange.user_id)
+        self._deferred_object_changes[key] = (objectchange, scope)
+
+        if len(self._deferred_creates) + len(self._deferred_updates) >= self.object_change_buffer_size:
+            self.flush_object_changes()
+
+    def flush_object_changes(self):
+        """Write any buffered ObjectChange records to the database."""
+        self._discard_rolled_back_object_changes()
+        if self._deferred_creates:
+            ObjectChange.objects.bulk_create(
+                [objectchange for objectchange, _ in self._deferred_creates.values()],
+                batch_size=self.object_change_buffer_size,
+            )
+            self._has_stored_object_changes = True
+        if self._deferred_updates:
+            ObjectChange.objects.bulk_update(
+                [objectchange for objectchange, _ in self._deferred_updates.values()],
+                ["action", "object_data", "object_data_v2"],
+                batch_size=self.object_change_buffer_size,
+            )
+        self._deferred_object_changes = {}
+        self._deferred_creates = {}
+        self._deferred_updates = {}
+        self._transaction_scopes = {}
+
+    def _get_transaction_scope(self):
+        """Return the _TransactionScope for the current atomic block, or None when running in autocommit mode."""
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            return None
+        savepoint_ids = tuple(connection.savepoint_ids)
+        scope = self._transaction_scopes.get(savepoint_ids)
+        if scope is None or not scope.is_valid():
+            scope = _TransactionScope()
+            transaction.on_commit(scope)
+            self._transaction_scopes[savepoint_ids] = scope
+        return scope
+
+    def _discard_rolled_back_object_changes(self):
+        """Drop buffered records whose enclosing transaction or savepoint has been rolled back."""
+        invalid_scopes = {scope for scope in self._transaction_scopes.values() if not scope.is_valid()}
+        if not invalid_scopes:
+            return
+        for pending in (self._deferred_object_changes, self._deferred_creates, self._deferred_updates):
+            for key, (_, scope) in list(pending.items()):
+                if scope in invalid_scopes:
+                    del pending[key]
+        self._transaction_scopes = {
+            savepoint_ids: scope
+            for savepoint_ids, scope in self._transaction_scopes.items()
+            if scope not in invalid_scopes
+        }
+
 
 class JobChangeContext(ChangeContext):
     """ChangeContext for changes made by jobs"""
@@ -91,15 +250,63 @@ def change_logging(change_context):
 
     try:
         yield
+    except Exception:
+        # Changes made in autocommit mode before the exception are still persisted, so their deferred ObjectChanges
+        # must be as well; inside an atomic block the pending transaction is about to be rolled back instead.
+        if not transaction.get_connection().in_atomic_block:
+            change_context.flush_object_changes()
+        raise
+    else:
+        # Write any ObjectChange records that were deferred during the block
+        change_context.flush_object_changes()
     finally:
         # Reset change logging state. This is necessary to avoid recording any errant
         # changes during test cleanup.
         change_context_state.reset(prev_state)
 
 
+@contextmanager
+def deferred_object_changes():
+    """
+    Temporarily buffer the ObjectChange records of the active change context and write them in bulk on exit.
+
+    This is useful for code that changes many objects within a single request or Job, such as bulk imports, without
+    requiring the entire change context to be created with `defer_object_changes=True`. It has no effect if there is
+    no active change context, or if the active change context already defers its ObjectChanges.
+
+    Example usage:
+
+    >>> with deferred_object_changes():
+    ...     for location in locations:
+    ...         location.validated_save()
+    """
+    change_context = change_context_state.get()
+    if change_context is None or change_context.defer_object_changes:
+        yield
+        return
+
+    change_context.defer_object_changes = True
+    try:
+        yield
+    except Exception:
+        # As in change_logging(), only changes made in autocommit mode will survive the exception
+        if not transaction.get_connection().in_atomic_block:
+            change_context.flush_object_changes()
+        raise
+    else:
+        change_context.flush_object_changes()
+    finally:
+        change_context.defer_object_changes = False
+
+
 @contextmanager
 def web_request_context(
-    user, context_detail="", change_id=None, context=ObjectChangeEventContextChoices.CONTEXT_ORM, request=None
+    user,
+    context_detail="",
+    change_id=None,
+    context=ObjectChangeEventContextChoices.CONTEXT_ORM,
+    request=None,
+    defer_object_changes=False,
 ):
     """
     Emulate the context of an HTTP request, which provides functions like change logging and webhook processing
@@ -124,8 +331,10 @@ def web_request_context(
     :param context: Optional string value of the generated change log entries' "change_context" field, defaults to ObjectChangeEventContextChoices.CONTEXT_ORM.
         Valid choices are in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param request: Optional web request instance, one will be generated if not supplied
+    :param defer_object_changes: Optional boolean to buffer ObjectChange records and write them in bulk at the end of
+        the context, which greatly reduces the number of database queries when changing many objects
     """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
+    from nautobot.extras.jobs import enqueue_job_hooks_for_object_changes  # prevent circular import
 
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
@@ -143,12 +352,20 @@ def web_request_context(
     if request is None:
         request = RequestFactory().request(SERVER_NAME="web_request_context")
         request.user = user
-    change_context = valid_contexts[context](request=request, context_detail=context_detail, change_id=change_id)
+    change_context = valid_contexts[context](
+        request=request,
+        context_detail=context_detail,
+        change_id=change_id,
+        defer_object_changes=defer_object_changes,
+    )
     try:
         with change_logging(change_context):
             yield request
     finally:
         # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+        object_changes = ObjectChange.objects.filter(request_id=change_context.change_id).select_related(
+            "changed_object_type", "user"
+        )
+        for object_changes_batch in batched(object_changes.iterator(), CHANGELOG_EVENT_DISPATCH_BATCH_SIZE):
+            enqueue_job_hooks_for_object_changes(object_changes_batch)
+            enqueue_webhooks_for_object_changes(object_changes_batch)
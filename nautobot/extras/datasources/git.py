@@ -2,6 +2,7 @@
 
 from collections import defaultdict, namedtuple
 from contextlib import suppress
+import functools
 import logging
 import mimetypes
 import os
@@ -18,6 +19,7 @@ from git import InvalidGitRepositoryError, Repo
 import yaml
 
 from nautobot.core.celery import app as celery_app
+from nautobot.core.utils.cache import bump_cache_generation
 from nautobot.core.utils.git import GitRepo
 from nautobot.dcim.models import Device, DeviceType, Location, Platform
 from nautobot.extras.choices import (
@@ -25,6 +27,7 @@ from nautobot.extras.choices import (
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
+from nautobot.extras.constants import CONFIG_CONTEXT_CACHE_GENERATION_KEY
 from nautobot.extras.models import (
     ConfigContext,
     ConfigContextSchema,
@@ -220,6 +223,10 @@ def refresh_git_config_contexts(repository_record, job_result, delete=False):
         update_git_config_contexts(repository_record, job_result)
     else:
         delete_git_config_contexts(repository_record, job_result)
+    # Make sure that no rendered config context cached before this refresh is used any longer, including any cached by
+    # a concurrent request before the refresh is committed
+    bump_cache_generation(CONFIG_CONTEXT_CACHE_GENERATION_KEY)
+    transaction.on_commit(functools.partial(bump_cache_generation, CONFIG_CONTEXT_CACHE_GENERATION_KEY))
 
 
 def update_git_config_contexts(repository_record, job_result):
@@ -1506,6 +1506,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_size",
         )
 
     def clean(self):
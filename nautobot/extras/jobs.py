@@ -22,7 +22,7 @@ from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -33,6 +33,7 @@ from kombu.utils.uuid import uuid
 import netaddr
 import yaml
 
+from nautobot.core import instrumentation
 from nautobot.core.celery import app as celery_app
 from nautobot.core.celery.task import Task
 from nautobot.core.forms import (
@@ -42,7 +43,7 @@ from nautobot.core.forms import (
 )
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.lookup import get_model_from_name
-from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices, ObjectChangeEventContextChoices
+from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeEventContextChoices
 from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.forms import JobForm
 from nautobot.extras.models import (
@@ -53,6 +54,7 @@ from nautobot.extras.models import (
     ObjectChange,
 )
 from nautobot.extras.utils import ChangeLoggedModelsQuery, task_queues_as_choices
+from nautobot.extras.webhooks import ACTION_FLAGS, index_hooks_by_content_type_and_action
 from nautobot.ipam.formfields import IPAddressFormField, IPNetworkFormField
 from nautobot.ipam.validators import (
     MaxPrefixLengthValidator,
@@ -129,7 +131,9 @@ class BaseJob(Task):
         else:
             change_context = ObjectChangeEventContextChoices.CONTEXT_JOB
 
-        with web_request_context(user=self.user, context_detail=self.class_path, context=change_context):
+        with web_request_context(
+            user=self.user, context_detail=self.class_path, context=change_context
+        ), instrumentation.instrument("job", self.class_path):
             if self.celery_kwargs.get("nautobot_job_profile", False) is True:
                 import cProfile
 
@@ -306,7 +310,7 @@ class BaseJob(Task):
 
         # Cleanup FileProxy objects
         file_fields = list(self._get_file_vars())
-        file_ids = [kwargs[f] for f in file_fields]
+        file_ids = [kwargs[f] for f in file_fields if kwargs.get(f)]
         if file_ids:
             self._delete_file_proxies(*file_ids)
 
@@ -835,7 +839,8 @@ class BaseJob(Task):
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with, or a binary file-like object
+                (such as a `tempfile.TemporaryFile`) containing the content, for content too large to hold in memory.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -845,13 +850,17 @@ class BaseJob(Task):
         """
         if isinstance(content, str):
             content = content.encode("utf-8")
+        if isinstance(content, bytes):
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
+        else:
+            actual_size = content.seek(0, os.SEEK_END)
+            content.seek(0)
+            file = File(content, name=filename)
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
-        actual_size = len(content)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1210,30 +1219,52 @@ def get_job(class_path):
         return None
 
 
-def enqueue_job_hooks(object_change):
+def enqueue_job_hooks(object_change, job_hooks=None):
     """
     Find job hook(s) assigned to this changed object type + action and enqueue them
     to be processed
+
+    Args:
+        object_change (ObjectChange): The change to run job hooks for
+        job_hooks (iterable): Optional candidate JobHooks to consider instead of querying the database; these must
+            already be filtered to enabled JobHooks matching this object's content type and action
     """
 
     # Job hooks cannot trigger other job hooks
     if object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
         return
 
-    # Determine whether this type of object supports job hooks
-    content_type = object_change.changed_object_type
-    if content_type not in ChangeLoggedModelsQuery().as_queryset():
-        return
+    if job_hooks is None:
+        # Determine whether this type of object supports job hooks
+        content_type = object_change.changed_object_type
+        if content_type not in ChangeLoggedModelsQuery().as_queryset():
+            return
 
-    # Retrieve any applicable job hooks
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    job_hooks = JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+        # Retrieve any applicable job hooks
+        action_flag = ACTION_FLAGS[object_change.action]
+        job_hooks = JobHook.objects.filter(
+            content_types=content_type, enabled=True, **{action_flag: True}
+        ).select_related("job")
 
     # Enqueue the jobs related to the job_hooks
     for job_hook in job_hooks:
         job_model = job_hook.job
         JobResult.enqueue_job(job_model, object_change.user, object_change=object_change.pk)
+
+
+def enqueue_job_hooks_for_object_changes(object_changes):
+    """
+    Enqueue job hooks for many ObjectChanges at once, such as all of the changes made in a single change context.
+
+    All enabled JobHooks are loaded once and matched in memory against each change, rather than being queried per change.
+    """
+    job_hooks_index = index_hooks_by_content_type_and_action(
+        JobHook.objects.filter(enabled=True).select_related("job").prefetch_related("content_types")
+    )
+    if not job_hooks_index:
+        return
+
+    for object_change in object_changes:
+        job_hooks = job_hooks_index.get((object_change.changed_object_type_id, object_change.action))
+        if job_hooks:
+            enqueue_job_hooks(object_change, job_hooks=job_hooks)
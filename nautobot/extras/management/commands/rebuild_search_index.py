@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, DatabaseError
+
+from nautobot.core.utils.lookup import get_model_from_name
+from nautobot.extras.models import SearchDocument
+from nautobot.extras.utils import create_search_index, get_search_indexed_models, is_search_index_enabled
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index (SearchDocuments) for all, or the given, searchable models."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label.ModelName",
+            nargs="*",
+            help="One or more specific models to rebuild the index of",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to index per batch (default: 1000)",
+        )
+
+    def handle(self, *model_names, **options):
+        if not is_search_index_enabled():
+            self.stdout.write(
+                self.style.NOTICE(
+                    "SEARCH_INDEX_ENABLED is not set, or the database isn't PostgreSQL; the index is unused"
+                )
+            )
+        else:
+            # The migration that adds SearchDocuments skips the trigram index if pg_trgm couldn't be created then
+            try:
+                create_search_index(connection)
+            except DatabaseError as exc:
+                raise CommandError(f"Unable to create the global search index: {exc}") from exc
+
+        indexed_models = sorted(get_search_indexed_models(), key=lambda model: model._meta.label_lower)
+        if model_names:
+            models = []
+            for model_name in model_names:
+                try:
+                    model = get_model_from_name(model_name)
+                except TypeError as exc:
+                    raise CommandError(str(exc)) from exc
+                if model not in indexed_models:
+                    raise CommandError(f"{model._meta.label} is not included in the global search index")
+                models.append(model)
+        else:
+            models = indexed_models
+
+        for model in models:
+            self.stdout.write(f"Indexing {model._meta.verbose_name_plural}...", ending="")
+            count = SearchDocument.objects.rebuild_for_model(model, batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f" {count} indexed"))
+
+        self.stdout.write(self.style.SUCCESS("Finished."))
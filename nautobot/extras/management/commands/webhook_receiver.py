@@ -1,4 +1,4 @@
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import sys
 
 from django.core.management.base import BaseCommand
@@ -7,6 +7,8 @@ request_counter = 1
 
 
 class WebhookHandler(BaseHTTPRequestHandler):
+    # Support persistent connections, as Nautobot reuses connections when sending multiple webhooks to a receiver
+    protocol_version = "HTTP/1.1"
     show_headers = True
 
     def __getattr__(self, item):
@@ -25,9 +27,11 @@ class WebhookHandler(BaseHTTPRequestHandler):
         global request_counter
 
         # Send a 200 response regardless of the request content
+        response_body = b"Webhook received!\n"
         self.send_response(200)
+        self.send_header("Content-Length", str(len(response_body)))
         self.end_headers()
-        self.wfile.write(b"Webhook received!\n")
+        self.wfile.write(response_body)
 
         request_counter += 1
 
@@ -74,7 +78,7 @@ class Command(BaseCommand):
         WebhookHandler.show_headers = not options["no_headers"]
 
         self.stdout.write(f"Listening on port http://localhost:{port}. Stop with {quit_command}.")
-        httpd = HTTPServer(("localhost", port), WebhookHandler)
+        httpd = ThreadingHTTPServer(("localhost", port), WebhookHandler)
 
         try:
             httpd.serve_forever()
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.25 on 2026-10-18 05:30
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0103_add_db_indexes_to_object_change"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_size",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Maximum number of events to send in a single request. Set this higher than 1 only if the receiver accepts batched requests, in which case the template context contains a list of <code>events</code>, each with the usual context data, rather than a single event.",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+    ]
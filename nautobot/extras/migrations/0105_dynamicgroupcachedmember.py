@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-18 05:29
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0104_webhook_batch_size"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DynamicGroupCachedMember",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("member_id", models.UUIDField(db_index=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cached_members",
+                        to="extras.dynamicgroup",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["group", "member_id"],
+                "unique_together": {("group", "member_id")},
+            },
+        ),
+    ]
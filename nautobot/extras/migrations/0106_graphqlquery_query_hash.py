@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:16
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_query_hash(apps, schema_editor):
+    """Compute the `query_hash` of all existing saved GraphQL queries."""
+    GraphQLQuery = apps.get_model("extras", "GraphQLQuery")
+    for graphql_query in GraphQLQuery.objects.all():
+        graphql_query.query_hash = hashlib.sha256(graphql_query.query.encode("utf-8")).hexdigest()
+        graphql_query.save()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0105_dynamicgroupcachedmember"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="graphqlquery",
+            name="query_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(populate_query_hash, migrations.RunPython.noop),
+    ]
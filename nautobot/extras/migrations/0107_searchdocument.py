@@ -0,0 +1,65 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:40
+
+import uuid
+
+from django.db import DatabaseError, migrations, models
+import django.db.models.deletion
+
+from nautobot.extras.utils import create_search_index
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    On PostgreSQL, index the text of search documents for substring matching with a trigram GIN index.
+
+    The index is only used with SEARCH_INDEX_ENABLED, so if the pg_trgm extension it needs can't be created, the migration
+    carries on without it; `nautobot-server rebuild_search_index` creates the index once the extension is available.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        create_search_index(schema_editor.connection)
+    except DatabaseError as exc:
+        print(f"\n    Skipping creation of the global search index: {exc}")
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS extras_searchdocument_text_upper_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0106_graphqlquery_query_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("text", models.TextField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["content_type", "object_id"],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
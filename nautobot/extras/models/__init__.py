@@ -1,7 +1,7 @@
 from .change_logging import ChangeLoggedModel, ObjectChange
 from .customfields import ComputedField, CustomField, CustomFieldChoice, CustomFieldModel
 from .datasources import GitRepository
-from .groups import DynamicGroup, DynamicGroupMembership
+from .groups import DynamicGroup, DynamicGroupCachedMember, DynamicGroupMembership
 from .jobs import (
     Job,
     JobButton,
@@ -28,6 +28,7 @@ from .models import (
 )
 from .relationships import Relationship, RelationshipAssociation, RelationshipModel
 from .roles import Role, RoleField
+from .search import SearchDocument
 from .secrets import Secret, SecretsGroup, SecretsGroupAssociation
 from .statuses import Status, StatusField, StatusModel
 from .tags import Tag, TaggedItem
@@ -43,6 +44,7 @@ __all__ = (
     "CustomFieldModel",
     "CustomLink",
     "DynamicGroup",
+    "DynamicGroupCachedMember",
     "DynamicGroupMembership",
     "ExportTemplate",
     "ExternalIntegration",
@@ -66,6 +68,7 @@ __all__ = (
     "RoleField",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchDocument",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
@@ -189,11 +189,15 @@ class ObjectChange(BaseModel):
             return related_changes.restrict(user, permission)
         return related_changes
 
-    def get_snapshots(self):
+    def get_snapshots(self, prior_change=None, lookup_prior_change=True):
         """
         Return a dictionary with the changed object's serialized data before and after this change
         occurred and a key with a shallow diff of those dictionaries.
 
+        Args:
+            prior_change (ObjectChange): The previous change to this object, if it has already been retrieved
+            lookup_prior_change (bool): If True and `prior_change` is not provided, query for the previous change
+
         Returns:
         {
             "prechange": dict(),
@@ -207,7 +211,9 @@ class ObjectChange(BaseModel):
         prechange = None
         postchange = None
 
-        prior_change = self.get_prev_change()
+        # The prior change is irrelevant for a create, so skip the lookup in that case
+        if prior_change is None and lookup_prior_change and self.action != ObjectChangeActionChoices.ACTION_CREATE:
+            prior_change = self.get_prev_change()
 
         if self.action != ObjectChangeActionChoices.ACTION_CREATE and prior_change is not None:
             prechange = prior_change.object_data_v2
@@ -1,11 +1,12 @@
 from collections import OrderedDict
 from datetime import date, datetime
-from functools import lru_cache
 import logging
 import re
+import time
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator, ValidationError
@@ -33,6 +34,8 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.models.validators import validate_regex
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.templatetags.helpers import render_markdown
+from nautobot.core.utils.cache import generation_lru_cache
+from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.data import render_jinja2
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
@@ -46,7 +49,7 @@ logger = logging.getLogger(__name__)
 class ComputedFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
-    @lru_cache(maxsize=128)
+    @generation_lru_cache("extras.computedfield.cache_generation", maxsize=1024)
     def get_for_model(self, model):
         """
         Return all ComputedFields assigned to the given model.
@@ -114,6 +117,62 @@ class ComputedField(BaseModel, ChangeLoggedModel, NotesMixin):
             logger.warning("Failed to render computed field %s: %s", self.key, exc)
             return self.fallback_value
 
+    def get_cache_key(self, obj):
+        """Return the key under which the value of this computed field for the given object is cached."""
+        return f"{self.__class__.__name__}.{self.pk}.{obj.pk}"
+
+    def render_many(self, objects, time_limit=False):
+        """
+        Render this computed field for each of the given objects in turn, and return the list of rendered values.
+
+        If `COMPUTED_FIELD_CACHE_TIMEOUT` is set, the rendered values are cached, and a cached value is used for as long
+        as neither this ComputedField nor the object itself has been updated since it was rendered.
+
+        If `time_limit` is True, once rendering has taken longer than `COMPUTED_FIELD_RENDER_TIMEOUT` seconds in total,
+        the `fallback_value` is returned for all of the remaining objects instead, so that a slow template can't stall a
+        whole table. This is only suitable for display purposes, as the values returned are then incomplete.
+        """
+        objects = list(objects)
+        values = {}
+
+        cache_timeout = get_settings_or_config("COMPUTED_FIELD_CACHE_TIMEOUT")
+        cache_keys = {}
+        if cache_timeout:
+            cache_keys = {
+                index: self.get_cache_key(obj)
+                for index, obj in enumerate(objects)
+                if getattr(obj, "last_updated", None) is not None
+            }
+            cached = cache.get_many(cache_keys.values())
+            for index, cache_key in cache_keys.items():
+                version, value = cached.get(cache_key, (None, None))
+                if version == (self.last_updated, objects[index].last_updated):
+                    values[index] = value
+
+        render_timeout = get_settings_or_config("COMPUTED_FIELD_RENDER_TIMEOUT") if time_limit else None
+        deadline = time.monotonic() + render_timeout if render_timeout else None
+        to_cache = {}
+        for index, obj in enumerate(objects):
+            if index in values:
+                continue
+            if deadline is not None and time.monotonic() > deadline:
+                remaining = [i for i in range(index, len(objects)) if i not in values]
+                logger.warning(
+                    "Rendering computed field %s took longer than %s seconds; using its fallback value for %d objects",
+                    self.key,
+                    render_timeout,
+                    len(remaining),
+                )
+                values.update((i, self.fallback_value) for i in remaining)
+                break
+            values[index] = self.render(context={"obj": obj})
+            if index in cache_keys:
+                to_cache[cache_keys[index]] = ((self.last_updated, obj.last_updated), values[index])
+
+        if to_cache:
+            cache.set_many(to_cache, timeout=cache_timeout)
+        return [values[index] for index in range(len(objects))]
+
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
@@ -270,6 +329,8 @@ class CustomFieldModel(models.Model):
         Get a computed field for this model, lookup via key.
         Returns the template of this field if render is False, otherwise returns the rendered value.
         """
+        if render and key in (getattr(self, "prefetched_computed_fields", None) or {}):
+            return self.prefetched_computed_fields[key]
         try:
             computed_field = ComputedField.objects.get_for_model(self).get(key=key)
         except ComputedField.DoesNotExist:
@@ -283,6 +344,8 @@ class CustomFieldModel(models.Model):
         """
         Return a dictionary of all computed fields and their rendered values for this model.
         Keys are the `key` value of each field. If label_as_key is True, `label` values of each field are used as keys.
+
+        Values already rendered by `prefetch_computed_fields()` are used rather than rendering them again.
         """
         computed_fields_dict = {}
         computed_fields = ComputedField.objects.get_for_model(self)
@@ -290,15 +353,42 @@ class CustomFieldModel(models.Model):
             computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
         if not computed_fields:
             return {}
+        prefetched = getattr(self, "prefetched_computed_fields", None) or {}
         for cf in computed_fields:
-            computed_fields_dict[cf.label if label_as_key else cf.key] = cf.render(context={"obj": self})
+            if cf.key in prefetched:
+                value = prefetched[cf.key]
+            else:
+                value = cf.render(context={"obj": self})
+            computed_fields_dict[cf.label if label_as_key else cf.key] = value
         return computed_fields_dict
 
+    @classmethod
+    def prefetch_computed_fields(cls, instances, computed_fields=None, time_limit=False):
+        """
+        Render the computed fields of many instances of this model at once with `ComputedField.render_many()`.
+
+        The rendered values are stored as `prefetched_computed_fields` on each instance, as a dict keyed by the `key` of
+        each computed field, where they are used by `get_computed_field()` and `get_computed_fields()`.
+
+        Args:
+            instances (list): instances of this model
+            computed_fields (list): only render these ComputedFields (optional, defaults to all ComputedFields)
+            time_limit (bool): apply `COMPUTED_FIELD_RENDER_TIMEOUT` to the rendering of each computed field
+        """
+        if computed_fields is None:
+            computed_fields = ComputedField.objects.get_for_model(cls)
+        for instance in instances:
+            if getattr(instance, "prefetched_computed_fields", None) is None:
+                instance.prefetched_computed_fields = {}
+        for computed_field in computed_fields:
+            for instance, value in zip(instances, computed_field.render_many(instances, time_limit=time_limit)):
+                instance.prefetched_computed_fields[computed_field.key] = value
+
 
 class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
-    @lru_cache(maxsize=128)
+    @generation_lru_cache("extras.customfield.cache_generation", maxsize=1024)
     def get_for_model(self, model, exclude_filter_disabled=False):
         """
         Return all CustomFields assigned to the given model.
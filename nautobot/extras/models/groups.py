@@ -1,14 +1,13 @@
 """Dynamic Groups Models."""
 
 import logging
-import pickle
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 import django_filters
 
@@ -324,38 +323,58 @@ class DynamicGroup(OrganizationalModel):
 
     @property
     def members_cache_key(self):
-        """Return the cache key for this group's members."""
-        return f"{self.__class__.__name__}.{self.id}.members_cached"
+        """
+        Return the cache key used to track the freshness of this group's cached members.
+
+        This is deliberately distinct from the key that previously held the cached members queryset itself, any leftover
+        value of which would otherwise be mistaken for a fresh (but still empty) `DynamicGroupCachedMember` table.
+        """
+        return f"{self.__class__.__name__}.{self.id}.members_cache_fresh"
 
     @property
     def members_cached(self):
-        """Return the member objects for this group, cached if available."""
+        """
+        Return the member objects for this group, using the cached membership table if it is up to date.
 
-        unpickled_query = None
-        try:
-            cached_query = cache.get(self.members_cache_key)
-            if cached_query is not None:
-                unpickled_query = pickle.loads(cached_query)  # noqa: S301  # suspicious-pickle-usage -- we know, but we control what's in the DB
-        except pickle.UnpicklingError:
-            logger.warning("Failed to unpickle cached members for %s", self)
-        finally:
-            if unpickled_query is None:
-                unpickled_query = self.members.all()
-                cached_query = pickle.dumps(unpickled_query)  # Explicitly pickle the query to evaluate it.
-                cache.set(
-                    self.members_cache_key, cached_query, get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
-                )
-
-        return unpickled_query
+        The cached membership is stored in the database as `DynamicGroupCachedMember` records, and is recomputed if
+        it has been more than `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT` seconds since it was last refreshed.
+        """
+        if not get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT"):
+            # Caching is disabled
+            return self.members
+
+        if cache.get(self.members_cache_key) is None:
+            return self.update_cached_members()
+
+        return self._get_cached_members_queryset()
+
+    def _get_cached_members_queryset(self):
+        """Return a queryset of this group's members as recorded in the cached membership table."""
+        return self.model.objects.filter(pk__in=DynamicGroupCachedMember.objects.filter(group=self).values("member_id"))
 
     def update_cached_members(self):
         """
         Update the cached members of the groups. Also returns the updated cached members.
+
+        Only the differences between the current members and the previously cached members are written.
         """
+        members = set(self.members.values_list("pk", flat=True))
+        cached_members = DynamicGroupCachedMember.objects.filter(group=self)
+
+        with transaction.atomic():
+            previous_members = set(cached_members.values_list("member_id", flat=True))
+            removed_members = previous_members - members
+            if removed_members:
+                cached_members.filter(member_id__in=removed_members).delete()
+            DynamicGroupCachedMember.objects.bulk_create(
+                [DynamicGroupCachedMember(group=self, member_id=pk) for pk in members - previous_members],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
 
-        cache.delete(self.members_cache_key)
+        cache.set(self.members_cache_key, True, get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT"))
 
-        return self.members_cached
+        return self._get_cached_members_queryset()
 
     def has_member(self, obj, use_cache=False):
         """
@@ -365,7 +384,8 @@ class DynamicGroup(OrganizationalModel):
 
         Args:
             obj (django.db.models.Model): The object to check for membership.
-            use_cache (bool, optional): Whether to use the cache and run the query directly. Defaults to False.
+            use_cache (bool, optional): Whether to use the cached membership table instead of evaluating the
+                group's filter. Defaults to False.
 
         Returns:
             bool: True if the object is a member of this group, otherwise False.
@@ -382,10 +402,12 @@ class DynamicGroup(OrganizationalModel):
         if not use_cache and ContentType.objects.get_for_model(obj).id != self.content_type_id:
             return False
 
-        if not use_cache:
+        if not use_cache or not get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT"):
             return self.members.filter(pk=obj.pk).exists()
-        else:
-            return obj in list(self.members_cached)
+
+        if cache.get(self.members_cache_key) is None:
+            self.update_cached_members()
+        return DynamicGroupCachedMember.objects.filter(group=self, member_id=obj.pk).exists()
 
     @property
     def count(self):
@@ -1029,3 +1051,22 @@ class DynamicGroupMembership(BaseModel):
 
         if self.group in self.parent_group.get_ancestors():
             raise ValidationError({"group": "Cannot add ancestor as a child"})
+
+
+class DynamicGroupCachedMember(BaseModel):
+    """
+    Cached record of an object being a member of a DynamicGroup.
+
+    This is a materialized copy of `DynamicGroup.members`, maintained by `DynamicGroup.update_cached_members()`, that
+    allows membership checks and "which groups contain this object" lookups to be performed as indexed queries.
+    """
+
+    group = models.ForeignKey("extras.DynamicGroup", on_delete=models.CASCADE, related_name="cached_members")
+    member_id = models.UUIDField(db_index=True)
+
+    class Meta:
+        unique_together = ["group", "member_id"]
+        ordering = ["group", "member_id"]
+
+    def __str__(self):
+        return f"{self.group}: {self.member_id}"
@@ -6,6 +6,7 @@ from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
 from django.core.serializers.json import DjangoJSONEncoder
@@ -33,7 +34,12 @@ from nautobot.extras.constants import HTTP_CONTENT_TYPE_JSON
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import NotesMixin
 from nautobot.extras.models.relationships import RelationshipModel
-from nautobot.extras.querysets import ConfigContextQuerySet, NotesQuerySet
+from nautobot.extras.querysets import (
+    ConfigContextQuerySet,
+    get_config_context_cache_generation,
+    get_config_context_cache_timeout,
+    NotesQuerySet,
+)
 from nautobot.extras.utils import extras_features, FeatureQuery, image_upload
 
 # Avoid breaking backward compatibility on anything that might expect these to still be defined here:
@@ -189,11 +195,33 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
             ),
         ]
 
+    @classmethod
+    def get_config_context_cache_key(cls, pk):
+        """Return the key under which the rendered configuration context of the given object is cached."""
+        return f"{cls.__name__}.{pk}.config_context"
+
     def get_config_context(self):
         """
         Return the rendered configuration context for a device or VM.
+
+        If many objects need their configuration context, render them all at once with
+        `ConfigContextModelQuerySet.get_config_contexts()` and set each one as the object's `rendered_config_context`.
+
+        If `CONFIG_CONTEXT_CACHE_TIMEOUT` is set, the rendered configuration context is cached, and the cached value is
+        used for as long as neither this object nor any ConfigContext (or anything it is assigned to) has changed.
         """
+        if hasattr(self, "rendered_config_context"):
+            return self.rendered_config_context
+
+        cache_timeout = 0
         if not hasattr(self, "config_context_data"):
+            cache_timeout = get_config_context_cache_timeout() if getattr(self, "last_updated", None) else 0
+            if cache_timeout:
+                cache_key = self.get_config_context_cache_key(self.pk)
+                version = (get_config_context_cache_generation(), self.last_updated)
+                cached_version, data = cache.get(cache_key, (None, None))
+                if cached_version == version:
+                    return data
             # Annotation not available, so fall back to manually querying for the config context
             config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
         else:
@@ -210,6 +238,9 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         if self.local_config_context_data:
             data = deepmerge(data, self.local_config_context_data)
 
+        if cache_timeout:
+            cache.set(cache_key, (version, data), cache_timeout)
+
         return data
 
     def clean(self):
@@ -648,6 +679,13 @@ class FileProxy(BaseModel):
 class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
     name = models.CharField(max_length=100, unique=True)
     query = models.TextField()
+    query_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="SHA-256 hash of the query, which may be sent to the GraphQL API in place of the query itself",
+    )
     variables = models.JSONField(encoder=DjangoJSONEncoder, default=dict, blank=True)
 
     class Meta:
@@ -656,11 +694,14 @@ class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
         verbose_name_plural = "GraphQL queries"
 
     def save(self, *args, **kwargs):
+        from nautobot.core.graphql.backends import get_query_hash  # avoid circular import
+
         variables = {}
         schema = graphene_settings.SCHEMA
         backend = get_default_backend()
-        # Load query into GraphQL backend
+        # Load query into GraphQL backend; this also parses and validates the query ahead of its first execution
         document = backend.document_from_string(schema, self.query)
+        self.query_hash = get_query_hash(self.query)
 
         # Inspect the parsed document tree (document.document_ast) to retrieve the query (operation) definition(s)
         # that define one or more variables. For each operation and variable definition, store the variable's
@@ -878,6 +919,13 @@ class Webhook(BaseModel, ChangeLoggedModel, NotesMixin):
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_size = models.PositiveIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text="Maximum number of events to send in a single request. Set this higher than 1 only if the receiver "
+        "accepts batched requests, in which case the template context contains a list of <code>events</code>, each "
+        "with the usual context data, rather than a single event.",
+    )
 
     class Meta:
         ordering = ("name",)
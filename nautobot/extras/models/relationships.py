@@ -1,4 +1,4 @@
-from functools import lru_cache
+from collections import defaultdict
 import logging
 
 from django import forms
@@ -21,6 +21,7 @@ from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import AutoSlugField, slugify_dashes_to_underscores
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.templatetags.helpers import bettertitle
+from nautobot.core.utils.cache import generation_lru_cache
 from nautobot.core.utils.lookup import get_filterset_for_model, get_route_for_model
 from nautobot.extras.choices import RelationshipRequiredSideChoices, RelationshipSideChoices, RelationshipTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
@@ -59,12 +60,22 @@ class RelationshipModel(models.Model):
 
     @property
     def associations(self):
+        prefetched = getattr(self, "prefetched_relationships", None)
+        if prefetched is not None:
+            associations = {}
+            for relationships in prefetched.values():
+                for relationship_associations in relationships.values():
+                    associations.update((association.pk, association) for association in relationship_associations)
+            return list(associations.values())
         return list(self.source_for_associations.all()) + list(self.destination_for_associations.all())
 
     def get_relationships(self, include_hidden=False, advanced_ui=None):
         """
         Return a dictionary of RelationshipAssociation querysets for all custom relationships
 
+        If `prefetched_relationships` has been set on this instance (see `prefetch_relationships()`), lists of the
+        prefetched RelationshipAssociations are returned instead of querysets.
+
         Returns:
             (dict): `{
                     "source": {
@@ -81,6 +92,18 @@ class RelationshipModel(models.Model):
                     },
                 }`
         """
+        prefetched = getattr(self, "prefetched_relationships", None)
+        if prefetched is not None:
+            return {
+                side: {
+                    relationship: associations
+                    for relationship, associations in relationships.items()
+                    if (include_hidden or not relationship.is_hidden_on_side(side))
+                    and (advanced_ui is None or relationship.advanced_ui == advanced_ui)
+                }
+                for side, relationships in prefetched.items()
+            }
+
         src_relationships, dst_relationships = Relationship.objects.get_for_model(self)
         if advanced_ui is not None:
             src_relationships = src_relationships.filter(advanced_ui=advanced_ui)
@@ -133,6 +156,127 @@ class RelationshipModel(models.Model):
 
         return resp
 
+    @classmethod
+    def bulk_get_relationships(cls, instances, relationships=None, get_peers=None):
+        """
+        Bulk equivalent of `get_relationships(include_hidden=True)` for many instances of this model.
+
+        The `source_filter`/`destination_filter` of each Relationship is evaluated with a single query for all of the
+        instances, all of their RelationshipAssociations are retrieved with a single query, and the peer objects with
+        one query per peer model. Each association has both of its ends cached, so `get_peer()` causes no queries.
+
+        Args:
+            instances (list): instances of this model
+            relationships (list): only include these Relationships (optional, defaults to all Relationships)
+            get_peers (callable): given a queryset of peer objects, return an iterable of them; may be used to
+                optimize the query (optional)
+
+        Returns:
+            (dict): `{<instance pk>: <same format as get_relationships(), with lists instead of querysets>}`,
+                with the associations of each Relationship ordered by the ordering of the peer model
+        """
+        instances_by_pk = {instance.pk: instance for instance in instances}
+        results = {
+            pk: {
+                RelationshipSideChoices.SIDE_SOURCE: {},
+                RelationshipSideChoices.SIDE_DESTINATION: {},
+                RelationshipSideChoices.SIDE_PEER: {},
+            }
+            for pk in instances_by_pk
+        }
+        if not instances_by_pk:
+            return results
+
+        model = cls._meta.concrete_model
+        content_type = ContentType.objects.get_for_model(model)
+        src_relationships, dst_relationships = Relationship.objects.get_for_model(model)
+        sides = {
+            RelationshipSideChoices.SIDE_SOURCE: src_relationships,
+            RelationshipSideChoices.SIDE_DESTINATION: dst_relationships,
+        }
+
+        relationships_by_pk = {}
+        for side, side_relationships in sides.items():
+            for relationship in side_relationships:
+                if relationships is not None and relationship not in relationships:
+                    continue
+                relationships_by_pk[relationship.pk] = relationship
+
+                # Determine the instances this relationship is applicable to, based on its filter if any
+                applicable_pks = instances_by_pk.keys()
+                filter_params = getattr(relationship, f"{side}_filter")
+                if filter_params:
+                    filterset = get_filterset_for_model(model)
+                    if filterset:
+                        queryset = filterset(filter_params, model.objects.filter(pk__in=instances_by_pk.keys())).qs
+                        applicable_pks = set(queryset.values_list("pk", flat=True))
+
+                result_side = RelationshipSideChoices.SIDE_PEER if relationship.symmetric else side
+                for pk in applicable_pks:
+                    results[pk][result_side][relationship] = []
+
+        if not relationships_by_pk:
+            return results
+
+        # Retrieve the associations, noting for each the instance and peer it applies to
+        associations = RelationshipAssociation.objects.filter(relationship__in=relationships_by_pk.keys()).filter(
+            Q(source_type=content_type, source_id__in=instances_by_pk.keys())
+            | Q(destination_type=content_type, destination_id__in=instances_by_pk.keys())
+        )
+        peer_ids = defaultdict(set)
+        for association in associations:
+            relationship = relationships_by_pk[association.relationship_id]
+            association.relationship = relationship
+            for side in (RelationshipSideChoices.SIDE_SOURCE, RelationshipSideChoices.SIDE_DESTINATION):
+                pk = getattr(association, f"{side}_id")
+                if getattr(association, f"{side}_type_id") != content_type.pk or pk not in instances_by_pk:
+                    continue
+                result_side = RelationshipSideChoices.SIDE_PEER if relationship.symmetric else side
+                if relationship not in results[pk][result_side]:
+                    # Relationship isn't applicable to this instance, or not on this side
+                    continue
+                RelationshipAssociation._meta.get_field(side).set_cached_value(association, instances_by_pk[pk])
+                peer_side = RelationshipSideChoices.OPPOSITE[side]
+                peer_key = (getattr(association, f"{peer_side}_type_id"), getattr(association, f"{peer_side}_id"))
+                peer_ids[peer_key[0]].add(peer_key[1])
+                results[pk][result_side][relationship].append((peer_key, peer_side, association))
+
+        # Retrieve the peers with one query per peer model
+        peers = {}
+        for peer_type_id, ids in peer_ids.items():
+            peer_model = ContentType.objects.get_for_id(peer_type_id).model_class()
+            if peer_model is None:
+                # Peer is a model from a plugin that is no longer installed
+                continue
+            queryset = peer_model.objects.filter(pk__in=ids)
+            for peer in get_peers(queryset) if get_peers is not None else queryset:
+                peers[(peer_type_id, peer.pk)] = peer
+        peer_order = {peer_key: index for index, peer_key in enumerate(peers)}
+
+        for instance_results in results.values():
+            for side_results in instance_results.values():
+                for relationship, entries in side_results.items():
+                    entries.sort(key=lambda entry: peer_order.get(entry[0], len(peer_order)))
+                    for peer_key, peer_side, association in entries:
+                        # A peer that couldn't be found is cached as None, as dereferencing it would be
+                        field = RelationshipAssociation._meta.get_field(peer_side)
+                        field.set_cached_value(association, peers.get(peer_key))
+                    side_results[relationship] = [association for _, _, association in entries]
+
+        return results
+
+    @classmethod
+    def prefetch_relationships(cls, instances, relationships=None):
+        """
+        Resolve the relationships of many instances of this model at once with `bulk_get_relationships()`.
+
+        The results are stored as `prefetched_relationships` on each instance, where they are used by
+        `get_relationships()`, `get_relationships_data()`, and `associations` instead of querying the database.
+        """
+        results = cls.bulk_get_relationships(instances, relationships=relationships)
+        for instance in instances:
+            instance.prefetched_relationships = results[instance.pk]
+
     def get_relationships_data(self, **kwargs):
         """
         Return a dictionary of relationships with the label and the value or the queryset for each.
@@ -193,7 +337,7 @@ class RelationshipModel(models.Model):
                     resp[side][relationship]["queryset"] = queryset
                 else:
                     resp[side][relationship]["url"] = None
-                    association = queryset.first()
+                    association = next(iter(queryset), None)
                     if not association:
                         continue
 
@@ -329,7 +473,7 @@ class RelationshipModel(models.Model):
 class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
-    @lru_cache(maxsize=128)
+    @generation_lru_cache("extras.relationship.cache_generation", maxsize=1024)
     def get_for_model(self, model, hidden=None):
         """
         Return all Relationships assigned to the given model.
@@ -345,7 +489,7 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
             self.get_for_model_destination(model, hidden=hidden),
         )
 
-    @lru_cache(maxsize=128)
+    @generation_lru_cache("extras.relationship.cache_generation", maxsize=1024)
     def get_for_model_source(self, model, hidden=None):
         """
         Return all Relationships assigned to the given model for the source side only.
@@ -362,7 +506,7 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
             result = result.filter(source_hidden=hidden)
         return result
 
-    @lru_cache(maxsize=128)
+    @generation_lru_cache("extras.relationship.cache_generation", maxsize=1024)
     def get_for_model_destination(self, model, hidden=None):
         """
         Return all Relationships assigned to the given model for the destination side only.
@@ -543,6 +687,18 @@ class Relationship(BaseModel, ChangeLoggedModel, NotesMixin):
 
         return None
 
+    def is_hidden_on_side(self, side):
+        """Return True if this relationship is hidden on the given side, source, destination, or peer."""
+
+        if side not in VALID_SIDES:
+            raise ValueError(f"side value can only be: {','.join(VALID_SIDES)}")
+
+        # Peer "side" implies symmetric relationship, which is shown if shown on either side
+        if side == RelationshipSideChoices.SIDE_PEER:
+            return self.source_hidden and self.destination_hidden
+
+        return getattr(self, f"{side}_hidden")
+
     def has_many(self, side):
         """Return True if the given side of the relationship can support multiple objects."""
 
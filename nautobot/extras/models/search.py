@@ -0,0 +1,32 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from nautobot.core.models import BaseManager, BaseModel
+from nautobot.extras.querysets import SearchDocumentQuerySet
+
+#
+# Global search
+#
+
+
+class SearchDocument(BaseModel):
+    """
+    Denormalized text of the searchable fields of an object included in the global search.
+
+    Maintained by signals when `SEARCH_INDEX_ENABLED` is set (and by the `rebuild_search_index` management command), so
+    that the global search can find matching objects with an indexed lookup against a single table, rather than
+    scanning the tables of each searchable model (and any related tables) in turn.
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    text = models.TextField()
+
+    objects = BaseManager.from_queryset(SearchDocumentQuerySet)()
+
+    class Meta:
+        unique_together = ["content_type", "object_id"]
+        ordering = ["content_type", "object_id"]
+
+    def __str__(self):
+        return f"{self.content_type}: {self.object_id}"
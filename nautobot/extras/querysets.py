@@ -1,14 +1,27 @@
+from collections import OrderedDict
+import random
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db.models import F, Model, OuterRef, Q, Subquery
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import Exists, F, FloatField, Func, Model, OuterRef, Q, Subquery, Value
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import JSONObject
 from django_celery_beat.managers import ExtendedQuerySet
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
 from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.core.utils.cache import get_cache_generation
 from nautobot.core.utils.config import get_settings_or_config
+from nautobot.core.utils.data import batched, deepmerge
+from nautobot.extras.constants import (
+    CONFIG_CONTEXT_CACHE_GENERATION_KEY,
+    DYNAMIC_GROUP_MEMBERSHIP_EVALUATION_BATCH_SIZE,
+)
 from nautobot.extras.models.tags import TaggedItem
+from nautobot.extras.utils import get_search_direct_filter, get_search_fields
 
 
 class ConfigContextQuerySet(RestrictedQuerySet):
@@ -70,6 +83,51 @@ class ConfigContextQuerySet(RestrictedQuerySet):
         return queryset
 
 
+def get_config_context_cache_timeout():
+    """Return the number of seconds to cache rendered config contexts for, or 0 if they mustn't be cached."""
+    if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+        # Dynamic Group membership may change without the object, or anything it's assigned to, being changed
+        return 0
+    return get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT")
+
+
+def get_config_context_cache_generation():
+    """Return the current generation of the cached rendered config contexts, which any cached value must match."""
+    generation = get_cache_generation(CONFIG_CONTEXT_CACHE_GENERATION_KEY)
+    if generation is None:
+        # Start from a random generation, so that if the counter gets evicted from the cache, values cached under a
+        # previous generation are never mistaken for current ones.
+        cache.add(CONFIG_CONTEXT_CACHE_GENERATION_KEY, random.getrandbits(48), timeout=None)
+        generation = get_cache_generation(CONFIG_CONTEXT_CACHE_GENERATION_KEY)
+    return generation
+
+
+def _get_tree_ancestors(model, pks):
+    """
+    Look up the ancestors of the given nodes of a tree model, walking up the tree one level at a time.
+
+    Returns:
+        (dict): `{pk: {pk, parent pk, grandparent pk, ...}}` for each of the given `pks`
+    """
+    parents = {}
+    to_fetch = set(pks) - {None}
+    while to_fetch:
+        fetched = dict(model.objects.without_tree_fields().filter(pk__in=to_fetch).values_list("pk", "parent"))
+        parents.update(fetched)
+        to_fetch = {parent for parent in fetched.values() if parent is not None and parent not in parents}
+
+    ancestors = {}
+    for pk in pks:
+        if pk is None:
+            continue
+        ancestors[pk] = set()
+        node = pk
+        while node is not None and node not in ancestors[pk]:
+            ancestors[pk].add(node)
+            node = parents.get(node)
+    return ancestors
+
+
 class ConfigContextModelQuerySet(RestrictedQuerySet):
     """
     QuerySet manager used by models which support ConfigContext (device and virtual machine).
@@ -90,7 +148,8 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         we include "weight" and "name" into the result so that we can sort it within Python to ensure correctness.
 
         TODO This method does not accurately reflect location inheritance because of the reasons stated in _get_config_context_filters()
-        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
+        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead,
+        or get_config_contexts() to render the config context of many objects at once.
         """
         from nautobot.extras.models import ConfigContext
 
@@ -111,6 +170,144 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
             )
         ).distinct()
 
+    def get_config_contexts(self):
+        """
+        Render the config context of every object in this queryset, with a number of queries independent of their count.
+
+        ConfigContexts are matched exactly as by `ConfigContextQuerySet.get_for_object()`: through all the ancestors of
+        each object's location and tenant group, and through Dynamic Group membership if
+        `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is set. To do so, the assignments of all active ConfigContexts are
+        loaded once, and the ancestors of all the locations and tenant groups involved are looked up together, one
+        level of their tree at a time. The matching ConfigContexts are then merged for each object in Python.
+
+        If `CONFIG_CONTEXT_CACHE_TIMEOUT` is set, the config contexts that are still current in the cache are used
+        instead, and only the others are rendered (and then cached).
+
+        Returns:
+            (dict): `{pk: rendered config context}` for every object in this queryset
+        """
+        from nautobot.dcim.models import Location
+        from nautobot.extras.models import ConfigContext, DynamicGroup
+        from nautobot.tenancy.models import TenantGroup
+
+        if self.model._meta.model_name == "device":
+            location_field = "location"
+        else:
+            location_field = "cluster__location"
+        # ConfigContext assignment field name -> lookup of the object's corresponding attribute
+        assignment_lookups = {
+            "roles": "role",
+            "device_types": "device_type",
+            "platforms": "platform",
+            "cluster_groups": "cluster__cluster_group",
+            "clusters": "cluster",
+            "device_redundancy_groups": "device_redundancy_group",
+            "tenants": "tenant",
+        }
+        for assignment, lookup in list(assignment_lookups.items()):
+            try:
+                self.model._meta.get_field(lookup.split("__")[0])
+            except FieldDoesNotExist:
+                # e.g. a VirtualMachine has no device_type, so it only matches ConfigContexts without device_types
+                del assignment_lookups[assignment]
+
+        objects = list(
+            self.order_by().values(
+                "pk",
+                "last_updated",
+                "local_config_context_data",
+                location_field,
+                "tenant__tenant_group",
+                *assignment_lookups.values(),
+            )
+        )
+        rendered = {}
+        cache_timeout = get_config_context_cache_timeout()
+        if cache_timeout:
+            generation = get_config_context_cache_generation()
+            cache_keys = {obj["pk"]: self.model.get_config_context_cache_key(obj["pk"]) for obj in objects}
+            cached = cache.get_many(cache_keys.values())
+            for obj in objects:
+                version, data = cached.get(cache_keys[obj["pk"]], (None, None))
+                if version == (generation, obj["last_updated"]):
+                    rendered[obj["pk"]] = data
+            objects = [obj for obj in objects if obj["pk"] not in rendered]
+        if not objects:
+            return rendered
+        pks = [obj["pk"] for obj in objects]
+
+        locations = _get_tree_ancestors(Location, {obj[location_field] for obj in objects})
+        tenant_groups = _get_tree_ancestors(TenantGroup, {obj["tenant__tenant_group"] for obj in objects})
+        tags = {pk: set() for pk in pks}
+        for object_id, tag_id in TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model), object_id__in=pks
+        ).values_list("object_id", "tag_id"):
+            tags[object_id].add(tag_id)
+
+        # For each active ConfigContext, the set of assigned PKs for each of its non-empty assignment fields
+        config_contexts = OrderedDict(
+            (pk, {"data": data, "assignments": {}})
+            for pk, data in ConfigContext.objects.filter(is_active=True)
+            .order_by("weight", "name")
+            .values_list("pk", "data")
+        )
+        assignments = [
+            "locations",
+            "roles",
+            "device_types",
+            "platforms",
+            "cluster_groups",
+            "clusters",
+            "device_redundancy_groups",
+            "tenant_groups",
+            "tenants",
+            "tags",
+        ]
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            assignments.append("dynamic_groups")
+        for assignment in assignments:
+            for config_context_pk, assigned_pk in (
+                ConfigContext.objects.filter(is_active=True).order_by().values_list("pk", f"{assignment}__pk")
+            ):
+                if assigned_pk is not None:
+                    config_contexts[config_context_pk]["assignments"].setdefault(assignment, set()).add(assigned_pk)
+
+        dynamic_groups = {pk: set() for pk in pks}
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            dynamic_group_pks = set().union(
+                *(context["assignments"].get("dynamic_groups", ()) for context in config_contexts.values())
+            )
+            for dynamic_group in DynamicGroup.objects.filter(pk__in=dynamic_group_pks):
+                for member_pk in dynamic_group.members.filter(pk__in=pks).values_list("pk", flat=True):
+                    dynamic_groups[member_pk].add(dynamic_group.pk)
+
+        for obj in objects:
+            attributes = {
+                "locations": locations.get(obj[location_field], ()),
+                "tenant_groups": tenant_groups.get(obj["tenant__tenant_group"], ()),
+                "tags": tags[obj["pk"]],
+                "dynamic_groups": dynamic_groups[obj["pk"]],
+                **{assignment: {obj[lookup]} for assignment, lookup in assignment_lookups.items()},
+            }
+            data = OrderedDict()
+            for config_context in config_contexts.values():
+                if all(
+                    not assigned_pks.isdisjoint(attributes.get(assignment, ()))
+                    for assignment, assigned_pks in config_context["assignments"].items()
+                ):
+                    data = deepmerge(data, config_context["data"])
+            if obj["local_config_context_data"]:
+                data = deepmerge(data, obj["local_config_context_data"])
+            rendered[obj["pk"]] = data
+
+        if cache_timeout:
+            cache.set_many(
+                {cache_keys[obj["pk"]]: ((generation, obj["last_updated"]), rendered[obj["pk"]]) for obj in objects},
+                cache_timeout,
+            )
+
+        return rendered
+
     def _get_config_context_filters(self):
         """
         This method is constructing the set of Q objects for the specific object types.
@@ -174,7 +371,7 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
 
         Args:
             obj: The object to seek dynamic groups membership by.
-            use_cache: If True, use the cache and query the database directly.
+            use_cache: If True, use the cached membership table rather than evaluating each group's filter.
         """
         if not isinstance(obj, Model):
             raise TypeError(f"{obj} is not an instance of Django Model class")
@@ -183,6 +380,26 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
         # optimize the query.
         eligible_groups = self._get_eligible_dynamic_groups(obj, use_cache=use_cache)
 
+        if use_cache and get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT"):
+            eligible_groups = list(eligible_groups)
+            if not eligible_groups:
+                return []
+
+            # Refresh the cached membership of any groups whose cache has expired, then look up all of the groups
+            # containing this object from the cached membership table with a single query.
+            fresh_cache_keys = cache.get_many([dynamic_group.members_cache_key for dynamic_group in eligible_groups])
+            for dynamic_group in eligible_groups:
+                if dynamic_group.members_cache_key not in fresh_cache_keys:
+                    dynamic_group.update_cached_members()
+
+            my_group_pks = set(
+                self.filter(
+                    pk__in=[dynamic_group.pk for dynamic_group in eligible_groups],
+                    cached_members__member_id=obj.pk,
+                ).values_list("pk", flat=True)
+            )
+            return [dynamic_group for dynamic_group in eligible_groups if dynamic_group.pk in my_group_pks]
+
         # Filter down to matching groups.
         my_groups = []
         for dynamic_group in list(eligible_groups):
@@ -204,6 +421,77 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
+    def update_cached_members_for_object(self, obj):
+        """
+        Re-evaluate the given object against the filters of the eligible `DynamicGroup` objects and add it to or
+        remove it from their cached membership in place, rather than recomputing the membership of each group.
+
+        Only groups whose cached membership is still current are updated; any others will be fully recomputed the
+        next time their cached members are accessed.
+
+        Args:
+            obj: The object that was created or updated.
+        """
+        if not isinstance(obj, Model):
+            raise TypeError(f"{obj} is not an instance of Django Model class")
+
+        eligible_groups = list(self._get_eligible_dynamic_groups(obj, use_cache=True))
+        if not eligible_groups:
+            return
+
+        fresh_cache_keys = cache.get_many([dynamic_group.members_cache_key for dynamic_group in eligible_groups])
+        dynamic_groups = [
+            dynamic_group for dynamic_group in eligible_groups if dynamic_group.members_cache_key in fresh_cache_keys
+        ]
+        if not dynamic_groups:
+            return
+
+        # Groups of groups derive their members from their children through `generate_members_query()`, so look up
+        # which groups have children up front instead of checking each group's `members` individually.
+        group_of_groups_pks = set(
+            self.filter(
+                pk__in=[dynamic_group.pk for dynamic_group in dynamic_groups], children__isnull=False
+            ).values_list("pk", flat=True)
+        )
+
+        # Evaluate the object's membership in each group as an `EXISTS` subquery, many groups per query.
+        member_group_pks = set()
+        for dynamic_groups_batch in batched(dynamic_groups, DYNAMIC_GROUP_MEMBERSHIP_EVALUATION_BATCH_SIZE):
+            membership_subqueries = {}
+            for dynamic_group in dynamic_groups_batch:
+                if dynamic_group.pk in group_of_groups_pks:
+                    members = dynamic_group.get_group_queryset()
+                else:
+                    members = dynamic_group.get_queryset()
+                if not members.query.is_empty():
+                    membership_subqueries[f"in_{dynamic_group.pk.hex}"] = Exists(members.filter(pk=OuterRef("pk")))
+            if not membership_subqueries:
+                continue
+
+            membership = (
+                obj._meta.model.objects.filter(pk=obj.pk)
+                .annotate(**membership_subqueries)
+                .values(*membership_subqueries)
+                .first()
+            )
+            if membership is None:
+                continue
+            for dynamic_group in dynamic_groups_batch:
+                if membership.get(f"in_{dynamic_group.pk.hex}"):
+                    member_group_pks.add(dynamic_group.pk)
+
+        cached_member_model = self.model._meta.get_field("cached_members").related_model
+        cached_member_model.objects.filter(
+            member_id=obj.pk,
+            group__in=[
+                dynamic_group.pk for dynamic_group in dynamic_groups if dynamic_group.pk not in member_group_pks
+            ],
+        ).delete()
+        cached_member_model.objects.bulk_create(
+            [cached_member_model(group_id=pk, member_id=obj.pk) for pk in member_group_pks],
+            ignore_conflicts=True,
+        )
+
     @classmethod
     def _get_eligible_dynamic_groups_cache_key(cls, obj):
         """
@@ -256,6 +544,104 @@ class NotesQuerySet(RestrictedQuerySet):
         return self.filter(assigned_object_id=obj.pk, assigned_object_type=content_type)
 
 
+def _flatten_search_values(values):
+    """Yield the string form of each of the given values, descending into any lists and dicts among them."""
+    for value in values:
+        if value is None or value == "" or isinstance(value, bool):
+            continue
+        if isinstance(value, dict):
+            yield from _flatten_search_values(value.values())
+        elif isinstance(value, (list, tuple)):
+            yield from _flatten_search_values(value)
+        else:
+            yield str(value)
+
+
+class SearchDocumentQuerySet(RestrictedQuerySet):
+    """Queryset for `SearchDocument` objects."""
+
+    def search(self, queryset, value):
+        """
+        Filter the given queryset to the objects whose SearchDocument contains `value`, best matches first.
+
+        Like the `icontains` predicates of a SearchFilter, `value` is matched case-insensitively anywhere in the
+        document; this is served by the trigram index of the document text rather than by scanning the model's table.
+        Objects are ranked by the similarity of `value` to the closest matching word (or words) of their document.
+
+        The SearchFilter's other predicates, such as `{"id": "iexact"}`, are matched directly with their own lookups;
+        objects matched only by those have no rank, and are listed first as the most exact matches.
+        """
+        content_type = ContentType.objects.get_for_model(queryset.model)
+        documents = self.filter(content_type=content_type, text__icontains=value)
+        rank = (
+            documents.filter(object_id=OuterRef("pk"))
+            # pg_trgm's word_similarity(); Django's TrigramWordSimilarity is only available as of Django 4.0
+            .annotate(rank=Func(Value(value), F("text"), function="word_similarity", output_field=FloatField()))
+            .values("rank")[:1]
+        )
+        query = Q(pk__in=documents.values("object_id"))
+        direct_filter = get_search_direct_filter(queryset.model)
+        if direct_filter is not None:
+            query |= direct_filter.generate_query(value=value)
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return (
+            queryset.filter(query)
+            .distinct()
+            .annotate(search_rank=Subquery(rank))
+            .order_by(F("search_rank").desc(nulls_first=True), *ordering)
+        )
+
+    def get_document_texts(self, model, pks):
+        """
+        Return the text of the SearchDocument of each of the given objects of `model` that exists, keyed by PK.
+
+        A document is made up of the values of the fields returned by `get_search_fields()` and the values of the
+        object's custom fields, one per line. The object's PK is deliberately excluded, as a substring match of it would
+        match unrelated objects; it's matched exactly by `search()` instead.
+        """
+        search_fields = get_search_fields(model)
+        local_fields = [field_name for field_name in search_fields if LOOKUP_SEP not in field_name]
+        if hasattr(model, "_custom_field_data"):
+            local_fields.append("_custom_field_data")
+        queryset = model.objects.filter(pk__in=pks).order_by()
+
+        values = {}
+        for pk, *row in queryset.values_list("pk", *local_fields):
+            values[pk] = set(_flatten_search_values(row))
+        # Fields spanning a relationship may have many values per object, so query each one separately rather than
+        # retrieving the cartesian product of all of them
+        for field_name in search_fields:
+            if LOOKUP_SEP in field_name:
+                for pk, value in queryset.values_list("pk", field_name):
+                    values[pk].update(_flatten_search_values([value]))
+        return {pk: "\n".join(sorted(object_values)) for pk, object_values in values.items()}
+
+    def update_for_objects(self, model, pks):
+        """
+        Bring the SearchDocuments of the given objects of `model` up to date, deleting those of any deleted objects.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        texts = self.get_document_texts(model, pks)
+        with transaction.atomic():
+            self.filter(content_type=content_type, object_id__in=pks).delete()
+            self.bulk_create(
+                [self.model(content_type=content_type, object_id=pk, text=text) for pk, text in texts.items()]
+            )
+
+    def rebuild_for_model(self, model, batch_size=1000):
+        """
+        Rebuild the SearchDocuments of all objects of `model`, `batch_size` objects at a time.
+
+        Returns the number of objects indexed.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        self.filter(content_type=content_type).exclude(object_id__in=model.objects.values("pk")).delete()
+        pks = list(model.objects.order_by().values_list("pk", flat=True))
+        for batch in batched(pks, batch_size):
+            self.update_for_objects(model, batch)
+        return len(pks)
+
+
 class JobQuerySet(RestrictedQuerySet):
     """
     Extend the standard queryset with a get_for_class_path method.
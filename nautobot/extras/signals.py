@@ -1,5 +1,6 @@
 import contextvars
 from datetime import timedelta
+import functools
 import logging
 import os
 import secrets
@@ -8,7 +9,6 @@ import shutil
 from db_file_storage.model_utils import delete_file
 from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
-from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
@@ -19,22 +19,31 @@ from django.utils import timezone
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 
 from nautobot.core.celery import app, import_jobs_as_celery_tasks
+from nautobot.core.utils.cache import bump_cache_generation
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
-from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
+from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL, CONFIG_CONTEXT_CACHE_GENERATION_KEY
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
+    ConfigContextSchema,
     CustomField,
     DynamicGroup,
+    DynamicGroupCachedMember,
     DynamicGroupMembership,
     GitRepository,
     JobResult,
     ObjectChange,
     Relationship,
+    SearchDocument,
+    Tag,
+    TaggedItem,
 )
 from nautobot.extras.querysets import NotesQuerySet
+from nautobot.extras.registry import registry
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
-from nautobot.extras.utils import refresh_job_model_from_job_class
+from nautobot.extras.utils import get_search_indexed_models, is_search_index_enabled, refresh_job_model_from_job_class
 
 # thread safe change context state variable
 change_context_state = contextvars.ContextVar("change_context_state", default=None)
@@ -64,7 +73,13 @@ def _get_user_if_authenticated(user, instance):
 @receiver(m2m_changed)
 @receiver(post_delete)
 def invalidate_lru_cache(sender, **kwargs):
-    """Invalidate the LRU cache for ComputedFields, CustomFields and Relationships."""
+    """
+    Invalidate the LRU cache for ComputedFields, CustomFields and Relationships.
+
+    The caches are invalidated in all Nautobot processes, not just this one; see `generation_lru_cache`. They're
+    invalidated again once the current transaction is committed, so that a concurrent request can't cache the objects
+    as they were before the change while the transaction is in progress.
+    """
     if sender is CustomField.content_types.through:
         manager = CustomField.objects
     elif sender in (ComputedField, CustomField, Relationship):
@@ -81,6 +96,48 @@ def invalidate_lru_cache(sender, **kwargs):
     for method in cached_methods:
         if hasattr(manager, method):
             getattr(manager, method).cache_clear()
+            transaction.on_commit(getattr(manager, method).cache_clear)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config_context_dependencies():
+    """Return the models whose changes may change the rendered config context of any Device or VirtualMachine."""
+    many_to_many_fields = ConfigContext._meta.many_to_many
+    return frozenset(
+        [
+            ConfigContext,
+            ConfigContextSchema,
+            *(field.remote_field.through for field in many_to_many_fields),
+            *(field.related_model for field in many_to_many_fields),
+        ]
+    )
+
+
+@receiver(post_save)
+@receiver(m2m_changed)
+@receiver(post_delete)
+def invalidate_config_context_cache(sender, instance, **kwargs):
+    """
+    Invalidate the cached rendered config contexts of all Devices and VirtualMachines, in all Nautobot processes.
+
+    This is done whenever a ConfigContext or ConfigContextSchema changes, or any object that ConfigContexts can be
+    assigned to (such as a Location, whose ancestors would change along with its parent), or the tags of a Device or
+    VirtualMachine. Any other change to a Device or VirtualMachine updates its `last_updated`, which is part of the
+    version of its own cached config context.
+
+    The cache is invalidated again once the current transaction is committed, so that a concurrent request can't cache
+    a config context rendered from the data as it was before the change while the transaction is in progress.
+    """
+    if sender is TaggedItem:
+        # post_save/post_delete of a TaggedItem, or m2m_changed of the tags of an object (or of the objects of a Tag)
+        tagged_model = instance.content_type.model_class() if isinstance(instance, TaggedItem) else type(instance)
+        if tagged_model is None or not (tagged_model is Tag or issubclass(tagged_model, ConfigContextModel)):
+            return
+    elif sender not in _get_config_context_dependencies():
+        return
+
+    bump_cache_generation(CONFIG_CONTEXT_CACHE_GENERATION_KEY)
+    transaction.on_commit(functools.partial(bump_cache_generation, CONFIG_CONTEXT_CACHE_GENERATION_KEY))
 
 
 @receiver(post_save)
@@ -109,36 +166,29 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
 
     # Record an ObjectChange if applicable
     if hasattr(instance, "to_objectchange"):
-        user = _get_user_if_authenticated(change_context_state.get().get_user(), instance)
+        change_context = change_context_state.get()
+        user = _get_user_if_authenticated(change_context.get_user(), instance)
         # save a copy of this instance's field cache so it can be restored after serialization
         # to prevent unexpected behavior when chaining multiple signal handlers
         original_cache = instance._state.fields_cache.copy()
 
         # If a change already exists for this change_id, user, and object, update it instead of creating a new one.
         # If the object was deleted then recreated with the same pk (don't do this), change the action to update.
-        related_changes = ObjectChange.objects.filter(
-            changed_object_type=ContentType.objects.get_for_model(instance),
-            changed_object_id=instance.pk,
-            user=user,
-            request_id=change_context_state.get().change_id,
-        )
+        most_recent_change = change_context.get_most_recent_object_change(instance, user)
         objectchange = instance.to_objectchange(action)
-        if related_changes.exists():
-            most_recent_change = related_changes.order_by("-time").first()
+        if most_recent_change is not None:
             if most_recent_change.action == ObjectChangeActionChoices.ACTION_DELETE:
                 most_recent_change.action = ObjectChangeActionChoices.ACTION_UPDATE
             most_recent_change.object_data = objectchange.object_data
             most_recent_change.object_data_v2 = objectchange.object_data_v2
-            most_recent_change.save()
+            change_context.save_object_change(most_recent_change)
             objectchange = most_recent_change
         else:
             objectchange.user = user
-            objectchange.request_id = change_context_state.get().change_id
-            objectchange.change_context = change_context_state.get().context
-            objectchange.change_context_detail = change_context_state.get().context_detail[
-                :CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
-            ]
-            objectchange.save()
+            objectchange.request_id = change_context.change_id
+            objectchange.change_context = change_context.context
+            objectchange.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+            change_context.save_object_change(objectchange)
 
         # restore field cache
         instance._state.fields_cache = original_cache
@@ -170,7 +220,8 @@ def _handle_deleted_object(sender, instance, **kwargs):
 
     # Record an ObjectChange if applicable
     if hasattr(instance, "to_objectchange"):
-        user = _get_user_if_authenticated(change_context_state.get().get_user(), instance)
+        change_context = change_context_state.get()
+        user = _get_user_if_authenticated(change_context.get_user(), instance)
 
         # save a copy of this instance's field cache so it can be restored after serialization
         # to prevent unexpected behavior when chaining multiple signal handlers
@@ -179,32 +230,23 @@ def _handle_deleted_object(sender, instance, **kwargs):
         # if a change already exists for this change_id, user, and object, update it instead of creating a new one
         # except in the case that the object was created and deleted in the same change_id
         # we don't want to create a delete change for an object that never existed
-        related_changes = ObjectChange.objects.filter(
-            changed_object_type=ContentType.objects.get_for_model(instance),
-            changed_object_id=instance.pk,
-            user=user,
-            request_id=change_context_state.get().change_id,
-        )
+        most_recent_change = change_context.get_most_recent_object_change(instance, user)
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         save_new_objectchange = True
-        if related_changes.exists():
-            most_recent_change = related_changes.order_by("-time").first()
-            if most_recent_change.action != ObjectChangeActionChoices.ACTION_CREATE:
-                most_recent_change.action = ObjectChangeActionChoices.ACTION_DELETE
-                most_recent_change.object_data = objectchange.object_data
-                most_recent_change.object_data_v2 = objectchange.object_data_v2
-                most_recent_change.save()
-                objectchange = most_recent_change
-                save_new_objectchange = False
+        if most_recent_change is not None and most_recent_change.action != ObjectChangeActionChoices.ACTION_CREATE:
+            most_recent_change.action = ObjectChangeActionChoices.ACTION_DELETE
+            most_recent_change.object_data = objectchange.object_data
+            most_recent_change.object_data_v2 = objectchange.object_data_v2
+            change_context.save_object_change(most_recent_change)
+            objectchange = most_recent_change
+            save_new_objectchange = False
 
         if save_new_objectchange:
             objectchange.user = user
-            objectchange.request_id = change_context_state.get().change_id
-            objectchange.change_context = change_context_state.get().context
-            objectchange.change_context_detail = change_context_state.get().context_detail[
-                :CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
-            ]
-            objectchange.save()
+            objectchange.request_id = change_context.change_id
+            objectchange.change_context = change_context.context
+            objectchange.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+            change_context.save_object_change(objectchange)
 
         # restore field cache
         instance._state.fields_cache = original_cache
@@ -369,6 +411,63 @@ post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+@receiver(post_save)
+@receiver(m2m_changed)
+@receiver(post_delete)
+def dynamic_group_update_cached_members_for_object(sender, instance, raw=False, **kwargs):
+    """
+    When an object that supports Dynamic Groups is created, updated or deleted, update its cached group memberships.
+
+    Only the changed object is re-evaluated against each group, rather than recomputing the groups' entire membership.
+    """
+    if raw:
+        return
+
+    if kwargs.get("action", "post_add") not in ("post_add", "post_remove", "post_clear"):
+        # m2m_changed is sent both before and after the change; we only care about the latter
+        return
+
+    if kwargs.get("reverse"):
+        # The instance is the other side of the many-to-many relationship (e.g. a Tag)
+        return
+
+    if instance._meta.model_name not in registry["model_features"]["dynamic_groups"].get(instance._meta.app_label, []):
+        return
+
+    if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+        # Caching is disabled, so there's nothing to do
+        return
+
+    if "created" in kwargs or "action" in kwargs:
+        DynamicGroup.objects.update_cached_members_for_object(instance)
+    else:
+        DynamicGroupCachedMember.objects.filter(member_id=instance.pk).delete()
+
+
+#
+# Global search
+#
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def update_search_document(sender, instance, raw=False, **kwargs):
+    """
+    When an object included in the global search is created, updated or deleted, update its SearchDocument.
+
+    Changes to related objects whose fields are included in the document are picked up the next time the object itself
+    is saved, or by the `rebuild_search_index` management command.
+    """
+    if raw or not is_search_index_enabled():
+        return
+
+    model = instance._meta.concrete_model
+    if model not in get_search_indexed_models():
+        return
+
+    SearchDocument.objects.update_for_objects(model, [instance.pk])
+
+
 #
 # Jobs
 #
@@ -1040,6 +1040,7 @@ class WebhookTable(BaseTable):
             "type_delete",
             "ssl_verification",
             "ca_file_path",
+            "batch_size",
         )
         default_columns = (
             "pk",
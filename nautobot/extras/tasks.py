@@ -1,9 +1,15 @@
+from contextlib import contextmanager
 from logging import getLogger
+import threading
+import time
+from urllib.parse import urlsplit
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import transaction
 from jinja2.exceptions import TemplateError
+from prometheus_client import Counter, Gauge, Histogram
 import requests
 
 from nautobot.core.celery import nautobot_task
@@ -100,24 +106,108 @@ def provision_field(field_id, content_type_pk_set):
     return True
 
 
-@nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+# Outbound webhook delivery metrics, labeled by destination (the `host[:port]` of the webhook's payload URL)
+WEBHOOK_REQUEST_DURATION = Histogram(
+    "nautobot_webhook_request_duration_seconds",
+    "Duration of outbound webhook requests.",
+    ["destination", "status"],
+)
+WEBHOOK_REQUESTS_IN_FLIGHT = Gauge(
+    "nautobot_webhook_requests_in_flight",
+    "Number of outbound webhook requests currently being sent.",
+    ["destination"],
+    multiprocess_mode="livesum",
+)
+WEBHOOK_EVENTS_SENT = Counter(
+    "nautobot_webhook_events_sent_total",
+    "Number of events delivered to webhook receivers, counting each event of a batched request.",
+    ["destination"],
+)
+WEBHOOK_FAILURES = Counter(
+    "nautobot_webhook_failures_total",
+    "Number of outbound webhook requests that failed.",
+    ["destination"],
+)
+WEBHOOK_DEFERRED = Counter(
+    "nautobot_webhook_deferred_total",
+    "Number of webhook deliveries postponed because the destination was at its concurrent request limit.",
+    ["destination"],
+)
+
+# Number of seconds to wait before retrying a delivery to a destination that is at its concurrent request limit
+WEBHOOK_BACKPRESSURE_RETRY_DELAY = 5
+
+# Maximum number of times to retry a delivery to a destination that remains at its concurrent request limit (one hour)
+WEBHOOK_BACKPRESSURE_MAX_RETRIES = 720
+
+# Persistent HTTP sessions, keyed by destination, so that connections (and TLS sessions) to the same webhook
+# receiver are kept alive and reused across deliveries. Sessions are not thread-safe, so they are per-thread.
+_webhook_sessions = threading.local()
+
+
+def get_webhook_destination(webhook):
+    """Return the destination (`host[:port]`) of the given Webhook, used to pool connections and label metrics."""
+    return urlsplit(webhook.payload_url).netloc
+
+
+def get_webhook_session(destination):
+    """Return a persistent `requests.Session` for sending webhook requests to the given destination."""
+    sessions = getattr(_webhook_sessions, "sessions", None)
+    if sessions is None:
+        sessions = _webhook_sessions.sessions = {}
+    if destination not in sessions:
+        sessions[destination] = requests.Session()
+    return sessions[destination]
+
+
+@contextmanager
+def webhook_concurrency_slot(destination):
     """
-    Make a POST request to the defined Webhook
+    Context manager to reserve one of the `WEBHOOK_MAX_CONCURRENT_REQUESTS` slots for the given destination.
+
+    The in-flight request count is shared between all workers via the cache. Yields True if a slot was reserved
+    (or no limit is configured) and False if the destination is currently at its limit.
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    limit = settings.WEBHOOK_MAX_CONCURRENT_REQUESTS
+    if not limit:
+        yield True
+        return
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    cache_key = f"nautobot.extras.tasks.webhook_concurrency.{destination}"
+    # Expire the counter eventually, in case a worker is killed while holding a slot
+    cache.add(cache_key, 0, timeout=settings.REDIS_LOCK_TIMEOUT)
+    try:
+        acquired = cache.incr(cache_key) <= limit
+        incremented = True
+    except ValueError:  # counter expired between add() and incr()
+        # If another worker recreated the counter first, this call hasn't been counted, so it mustn't decrement it
+        acquired = incremented = cache.add(cache_key, 1, timeout=settings.REDIS_LOCK_TIMEOUT)
+    try:
+        yield acquired
+    finally:
+        if incremented:
+            try:
+                cache.decr(cache_key)
+            except ValueError:
+                pass
 
-    context = {
-        "event": dict(ObjectChangeActionChoices)[event].lower(),
-        "timestamp": timestamp,
-        "model": model_name,
-        "username": username,
-        "request_id": request_id,
-        "data": data,
-        "snapshots": snapshots,
-    }
+
+def send_webhook_request(webhook, context, event_count=1):
+    """
+    Render and send the HTTP request for the given Webhook and template context.
+
+    Args:
+        webhook (Webhook): The Webhook to send
+        context (dict): Context for rendering the Webhook's headers and body
+        event_count (int): Number of events conveyed by this request, for metrics
+
+    Returns:
+        (str): Description of the successful result
+
+    Raises:
+        requests.exceptions.RequestException: if the request could not be sent or the receiver returned an error
+    """
+    destination = get_webhook_destination(webhook)
 
     # Build the headers for the HTTP request
     headers = {
@@ -143,7 +233,12 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    if "events" in context:
+        logger.info("Sending %s request to %s (%d events)", params["method"], params["url"], event_count)
+    else:
+        logger.info(
+            "Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"]
+        )
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -155,18 +250,81 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
     if webhook.secret != "":
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
-    # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    # Send the request, reusing any open connection to this destination
+    verify = webhook.ssl_verification
+    if webhook.ca_file_path:
+        verify = webhook.ca_file_path
+    session = get_webhook_session(destination)
+    start_time = time.monotonic()
+    WEBHOOK_REQUESTS_IN_FLIGHT.labels(destination).inc()
+    try:
+        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES, verify=verify)
+    except requests.exceptions.RequestException:
+        WEBHOOK_FAILURES.labels(destination).inc()
+        raise
+    finally:
+        WEBHOOK_REQUESTS_IN_FLIGHT.labels(destination).dec()
+    WEBHOOK_REQUEST_DURATION.labels(destination, response.status_code).observe(time.monotonic() - start_time)
 
     if response.ok:
+        WEBHOOK_EVENTS_SENT.labels(destination).inc(event_count)
         logger.info("Request succeeded; response status %s", response.status_code)
         return f"Status {response.status_code} returned, webhook successfully processed."
     else:
+        WEBHOOK_FAILURES.labels(destination).inc()
         logger.warning("Request failed; response status %s: %s", response.status_code, response.content)
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+def _get_webhook_event_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    return {
+        "event": dict(ObjectChangeActionChoices)[event].lower(),
+        "timestamp": timestamp,
+        "model": model_name,
+        "username": username,
+        "request_id": request_id,
+        "data": data,
+        "snapshots": snapshots,
+    }
+
+
+@nautobot_task(bind=True)
+def process_webhook(self, webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = _get_webhook_event_context(data, model_name, event, timestamp, username, request_id, snapshots)
+
+    destination = get_webhook_destination(webhook)
+    with webhook_concurrency_slot(destination) as acquired:
+        if not acquired:
+            WEBHOOK_DEFERRED.labels(destination).inc()
+            raise self.retry(countdown=WEBHOOK_BACKPRESSURE_RETRY_DELAY, max_retries=WEBHOOK_BACKPRESSURE_MAX_RETRIES)
+        return send_webhook_request(webhook, context)
+
+
+@nautobot_task(bind=True)
+def process_webhook_batch(self, webhook_pk, events):
+    """
+    Make a single request to the defined Webhook conveying multiple events.
+
+    Args:
+        webhook_pk (uuid): The PK of the Webhook to send
+        events (list): List of `process_webhook()` argument lists (excluding `webhook_pk`), one per event
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = {"events": [_get_webhook_event_context(*event) for event in events]}
+
+    destination = get_webhook_destination(webhook)
+    with webhook_concurrency_slot(destination) as acquired:
+        if not acquired:
+            WEBHOOK_DEFERRED.labels(destination).inc()
+            raise self.retry(countdown=WEBHOOK_BACKPRESSURE_RETRY_DELAY, max_retries=WEBHOOK_BACKPRESSURE_MAX_RETRIES)
+        return send_webhook_request(webhook, context, event_count=len(events))
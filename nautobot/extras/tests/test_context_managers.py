@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test import TestCase
 
 from nautobot.core.celery import app
@@ -163,6 +164,52 @@ class WebRequestContextTestCase(TestCase):
         with self.subTest():
             self.assertEqual(oc_list[0].change_context_detail, "test_change_log_context")
 
+    def test_deferred_object_changes(self):
+        """Test that deferred change logging coalesces changes and writes the same records as the default mode"""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        with web_request_context(self.user, defer_object_changes=True):
+            location = Location(name="Test Location 1", location_type=location_type, status=location_status)
+            location.save()
+            location.description = "changed"
+            location.save()
+            other_location = Location.objects.create(
+                name="Test Location 2", location_type=location_type, status=location_status
+            )
+            other_location_pk = other_location.pk
+            other_location.delete()
+            # Nothing is written until the end of the context
+            self.assertFalse(get_changes_for_model(location).exists())
+
+        oc_list = get_changes_for_model(location)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc_list[0].user_name, self.user.username)
+        self.assertEqual(oc_list[0].object_data_v2["description"], "changed")
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=other_location_pk)
+        self.assertEqual(len(oc_list), 2)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc_list[1].action, ObjectChangeActionChoices.ACTION_CREATE)
+
+    def test_deferred_object_changes_rolled_back(self):
+        """Test that deferred changes made inside a rolled-back savepoint are not logged"""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        with web_request_context(self.user, defer_object_changes=True):
+            try:
+                with transaction.atomic():
+                    Location.objects.create(name="Test Location 1", location_type=location_type, status=location_status)
+                    raise ValueError("roll back")
+            except ValueError:
+                pass
+            location = Location.objects.create(
+                name="Test Location 2", location_type=location_type, status=location_status
+            )
+
+        self.assertFalse(Location.objects.filter(name="Test Location 1").exists())
+        self.assertFalse(get_changes_for_model(Location).filter(object_repr="Test Location 1").exists())
+        self.assertEqual(get_changes_for_model(location).count(), 1)
+
     def test_change_webhook_enqueued(self):
         """Test that the webhook resides on the queue"""
         # TODO(john): come back to this with a way to actually do it without a running worker
@@ -1,10 +1,13 @@
+import itertools
 import logging
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError
 from django.forms import ChoiceField, IntegerField, NumberInput
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
@@ -1402,6 +1405,53 @@ class CustomFieldModelTest(TestCase):
     def test_get_computed_fields_only_returns_fields_for_content_type(self):
         self.assertTrue(self.non_location_computed_field.key not in self.location1.get_computed_fields())
 
+    def test_prefetch_computed_fields(self):
+        locations = list(Location.objects.filter(location_type=self.lt))
+        Location.prefetch_computed_fields(locations)
+        with mock.patch.object(ComputedField, "render") as render:
+            for location in locations:
+                self.assertEqual(
+                    location.get_computed_field("computed_field_one"), f"{location.name} is the name of this location."
+                )
+                self.assertEqual(
+                    location.get_computed_fields()["bad_computed_field"], self.bad_computed_field.fallback_value
+                )
+            render.assert_not_called()
+
+    @override_settings(COMPUTED_FIELD_CACHE_TIMEOUT=60)
+    def test_render_many_cache(self):
+        self.computed_field_one.render_many([self.location1])
+        with mock.patch.object(ComputedField, "render", return_value="rendered") as render:
+            self.assertEqual(
+                self.computed_field_one.render_many([self.location1]),
+                [f"{self.location1.name} is the name of this location."],
+            )
+            render.assert_not_called()
+            # Updating the object invalidates its cached value
+            self.location1.save()
+            self.assertEqual(self.computed_field_one.render_many([self.location1]), ["rendered"])
+            render.assert_called_once()
+
+    @override_settings(COMPUTED_FIELD_RENDER_TIMEOUT=1)
+    def test_render_many_timeout(self):
+        locations = [self.location1] * 3
+        # Each object takes 0.6 seconds to render, so only the first is rendered within the timeout
+        with mock.patch("nautobot.extras.models.customfields.time.monotonic", side_effect=itertools.count(0, 0.6)):
+            self.assertEqual(
+                self.computed_field_one.render_many(locations, time_limit=True),
+                [
+                    f"{self.location1.name} is the name of this location.",
+                    self.computed_field_one.fallback_value,
+                    self.computed_field_one.fallback_value,
+                ],
+            )
+        # Without `time_limit`, as for REST API, GraphQL and export data, all objects are rendered regardless
+        with mock.patch("nautobot.extras.models.customfields.time.monotonic", side_effect=itertools.count(0, 0.6)):
+            self.assertEqual(
+                self.computed_field_one.render_many(locations),
+                [f"{self.location1.name} is the name of this location."] * 3,
+            )
+
     def test_check_if_key_is_graphql_safe(self):
         """
         Check the GraphQL validation method on CustomField Key Attribute.
@@ -34,6 +34,7 @@ from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershi
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
+    DynamicGroupCachedMember,
     DynamicGroupMembership,
     Relationship,
     RelationshipAssociation,
@@ -41,6 +42,7 @@ from nautobot.extras.models import (
     Status,
     Tag,
 )
+from nautobot.extras.querysets import DynamicGroupQuerySet
 from nautobot.ipam.models import Prefix
 from nautobot.tenancy.models import Tenant
 
@@ -1001,6 +1003,9 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
             def all(self):
                 return []
 
+            def values_list(self, *args, **kwargs):
+                return []
+
         # Ensure the cache is empty from previous tests
         cache.delete(group.members_cache_key)
 
@@ -1016,7 +1021,89 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
             self.assertEqual(mock_get_queryset.call_count, 2)
 
         # Clean-up after ourselves
-        cache.delete(f"{group.__class__.__name__}.{group.id}.cached_members")
+        cache.delete(group.members_cache_key)
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_update_cached_members(self):
+        """
+        Verify that `update_cached_members()` maintains the cached membership table.
+        """
+        group = self.first_child
+        device1 = self.devices[0]
+        device2 = self.devices[1]
+
+        group.update_cached_members()
+        self.assertEqual(
+            set(DynamicGroupCachedMember.objects.filter(group=group).values_list("member_id", flat=True)),
+            set(group.members.values_list("pk", flat=True)),
+        )
+        self.assertTrue(group.has_member(device1, use_cache=True))
+        self.assertFalse(group.has_member(device2, use_cache=True))
+
+        # Stale cached members are removed and new members are added on refresh
+        DynamicGroupCachedMember.objects.filter(group=group).delete()
+        DynamicGroupCachedMember.objects.create(group=group, member_id=device2.pk)
+        self.assertFalse(group.has_member(device1, use_cache=True))
+        self.assertEqual(set(group.update_cached_members()), set(group.members))
+        self.assertTrue(group.has_member(device1, use_cache=True))
+        self.assertFalse(group.has_member(device2, use_cache=True))
+
+        cache.delete(group.members_cache_key)
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_cached_members_updated_incrementally(self):
+        """
+        Verify that saving or deleting an object updates the cached membership of all groups, including groups of groups.
+        """
+        cache.delete(DynamicGroupQuerySet._get_eligible_dynamic_groups_cache_key(Device))
+        groups = list(DynamicGroup.objects.filter(content_type=self.device_ct))
+        for group in groups:
+            group.update_cached_members()
+            self.addCleanup(cache.delete, group.members_cache_key)
+
+        def assert_cached_members_current():
+            for group in groups:
+                with self.subTest(group=group):
+                    self.assertEqual(
+                        set(DynamicGroupCachedMember.objects.filter(group=group).values_list("member_id", flat=True)),
+                        set(group.members.values_list("pk", flat=True)),
+                    )
+
+        device = self.devices[1]
+        self.assertFalse(self.first_child.has_member(device, use_cache=True))
+
+        with patch.object(DynamicGroup, "update_cached_members") as mock_update_cached_members:
+            device.location = self.locations[0]
+            device.save()
+            self.assertTrue(self.first_child.has_member(device, use_cache=True))
+            assert_cached_members_current()
+
+            device.status = self.status_2
+            device.save()
+            assert_cached_members_current()
+
+            device_pk = device.pk
+            device.delete()
+            self.assertFalse(DynamicGroupCachedMember.objects.filter(member_id=device_pk).exists())
+            assert_cached_members_current()
+
+            mock_update_cached_members.assert_not_called()
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_get_list_for_object_cached(self):
+        """
+        Verify that `get_list_for_object(use_cache=True)` matches the uncached lookup and uses a single query.
+        """
+        for group in DynamicGroup.objects.all():
+            self.addCleanup(cache.delete, group.members_cache_key)
+
+        for device in self.devices:
+            with self.subTest(device=device):
+                expected = DynamicGroup.objects.get_list_for_object(device)
+                self.assertEqual(DynamicGroup.objects.get_list_for_object(device, use_cache=True), expected)
+                # Once the eligible groups and their membership are cached, only the membership lookup is needed
+                with self.assertNumQueries(1):
+                    self.assertEqual(DynamicGroup.objects.get_list_for_object(device, use_cache=True), expected)
 
     @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=0)
     def test_member_caching_disabled(self):
@@ -1029,6 +1116,9 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
             def all(self):
                 return []
 
+            def values_list(self, *args, **kwargs):
+                return []
+
         # Ensure the cache is empty from previous tests
         cache.delete(group.members_cache_key)
 
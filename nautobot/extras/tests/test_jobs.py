@@ -483,8 +483,8 @@ class JobTransactionTest(TransactionTestCase):
         self.assertTrue(profiling_result.exists())
         profiling_result.unlink()
 
-    @mock.patch("nautobot.extras.context_managers.enqueue_webhooks")
-    def test_job_fires_webhooks(self, mock_enqueue_webhooks):
+    @mock.patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_job_fires_webhooks(self, mock_async):
         module = "atomic_transaction"
         name = "TestAtomicDecorator"
 
@@ -495,7 +495,7 @@ class JobTransactionTest(TransactionTestCase):
         job_result = create_job_result_and_run_job(module, name)
         self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
 
-        mock_enqueue_webhooks.assert_called_once()
+        mock_async.assert_called_once()
 
 
 class JobFileUploadTest(TransactionTestCase):
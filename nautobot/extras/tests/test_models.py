@@ -1,6 +1,6 @@
 import os
 import tempfile
-from unittest import expectedFailure, mock
+from unittest import expectedFailure, mock, skipIf
 import uuid
 import warnings
 
@@ -8,6 +8,7 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.db.models import ProtectedError
 from django.db.utils import IntegrityError
 from django.test import override_settings
@@ -58,6 +59,7 @@ from nautobot.extras.models import (
     JobResult,
     ObjectChange,
     Role,
+    SearchDocument,
     Secret,
     SecretsGroup,
     SecretsGroupAssociation,
@@ -67,6 +69,7 @@ from nautobot.extras.models import (
 )
 from nautobot.extras.models.statuses import StatusModel
 from nautobot.extras.secrets.exceptions import SecretParametersError, SecretProviderError, SecretValueNotFoundError
+from nautobot.extras.utils import create_search_index, SEARCH_INDEX_NAME
 from nautobot.ipam.models import IPAddress
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import (
@@ -358,6 +361,92 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         for key in ["parent-group-1", "child-group-1", "child-tenant-1"]:
             self.assertIn(key, device_context)
 
+    @override_settings(CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_get_config_contexts_same_as_get_for_object(self):
+        """Rendering config contexts in bulk should give the same result as for each object in turn."""
+        ConfigContext.objects.create(name="root-location", weight=100, data={"root-location": 1}).locations.add(
+            self.root_location
+        )
+        ConfigContext.objects.create(name="location", weight=90, data={"location": 1}).locations.add(self.location)
+        ConfigContext.objects.create(
+            name="parent_tenant_group", weight=100, data={"parent-group": 1}
+        ).tenant_groups.add(self.parent_tenantgroup)
+        ConfigContext.objects.create(name="tag", weight=100, data={"tag": 1}).tags.add(self.tag)
+        ConfigContext.objects.create(name="dynamic group", weight=100, data={"dynamic_group": 1}).dynamic_groups.add(
+            self.dynamic_group_2
+        )
+        ConfigContext.objects.create(name="inactive", weight=100, data={"inactive": 1}, is_active=False)
+        mismatched_context = ConfigContext.objects.create(name="mismatched", weight=100, data={"mismatched": 1})
+        mismatched_context.locations.add(self.location)
+        mismatched_context.device_types.add(DeviceType.objects.exclude(pk=self.devicetype.pk).first())
+
+        device = Device.objects.create(
+            name="Device 2",
+            location=self.location,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+            tenant=self.child_tenant,
+            local_config_context_data={"location": "local"},
+        )
+        device.tags.add(self.tag)
+        devices = Device.objects.filter(pk__in=[self.device.pk, device.pk])
+
+        config_contexts = devices.get_config_contexts()
+        for obj in devices:
+            self.assertEqual(config_contexts[obj.pk], obj.get_config_context())
+        self.assertEqual(
+            config_contexts[device.pk],
+            {
+                "a": 123,
+                "b": 456,
+                "c": 777,
+                "root-location": 1,
+                "location": "local",
+                "parent-group": 1,
+                "tag": 1,
+                "dynamic_group": 1,
+            },
+        )
+
+    @override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=60)
+    def test_cached_config_context_invalidation(self):
+        """A cached config context is used until the object or any config context it may depend on changes."""
+        location_context = ConfigContext.objects.create(name="location", weight=100, data={"location": 1})
+        location_context.locations.add(self.root_location)
+        expected_data = {"a": 123, "b": 456, "c": 777, "location": 1}
+        self.assertEqual(self.device.get_config_context(), expected_data)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.device.get_config_context(), expected_data)
+        self.assertEqual(Device.objects.filter(pk=self.device.pk).get_config_contexts()[self.device.pk], expected_data)
+
+        # Change to a ConfigContext
+        location_context.data = {"location": 2}
+        location_context.save()
+        expected_data["location"] = 2
+        self.assertEqual(self.device.get_config_context(), expected_data)
+
+        # Change to the ancestry of the object's location
+        self.location.parent = None
+        self.location.save()
+        del expected_data["location"]
+        self.assertEqual(self.device.get_config_context(), expected_data)
+        self.assertEqual(Device.objects.filter(pk=self.device.pk).get_config_contexts()[self.device.pk], expected_data)
+
+        # Change to the tags of the object
+        ConfigContext.objects.create(name="tag", weight=100, data={"tag": 1}).tags.add(self.tag)
+        self.assertNotIn("tag", self.device.get_config_context())
+        self.device.tags.add(self.tag)
+        expected_data["tag"] = 1
+        self.assertEqual(self.device.get_config_context(), expected_data)
+
+        # Change to the object itself
+        self.device.local_config_context_data = {"local": 1}
+        self.device.save()
+        expected_data["local"] = 1
+        self.assertEqual(Device.objects.filter(pk=self.device.pk).get_config_contexts()[self.device.pk], expected_data)
+        self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context(), expected_data)
+
     def test_annotation_same_as_get_for_object_virtualmachine_relations(self):
         location_context = ConfigContext.objects.create(name="location", weight=100, data={"location": 1})
         location_context.locations.add(self.location)
@@ -1674,6 +1763,71 @@ class SecretsGroupTest(ModelTestCases.BaseModelTestCase):
         )
 
 
+class SearchDocumentTest(TestCase):
+    """Tests for the SearchDocument model and the maintenance of the global search index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.manufacturer = Manufacturer.objects.create(name="Acme Search Industries")
+        cls.device_type = DeviceType.objects.create(
+            manufacturer=cls.manufacturer,
+            model="Searchable Model 9000",
+            part_number="SRCH-9000",
+            _custom_field_data={"asset_class": "widget-of-interest"},
+        )
+
+    def test_update_for_objects(self):
+        SearchDocument.objects.update_for_objects(DeviceType, [self.device_type.pk])
+        document = SearchDocument.objects.get(
+            content_type=ContentType.objects.get_for_model(DeviceType), object_id=self.device_type.pk
+        )
+        for value in ("Acme Search Industries", "Searchable Model 9000", "SRCH-9000"):
+            self.assertIn(value, document.text.split("\n"))
+        # Custom field values are included as well
+        self.assertIn("widget-of-interest", document.text.split("\n"))
+        # The PK is matched exactly by search() instead
+        self.assertNotIn(str(self.device_type.pk), document.text)
+
+        pk = self.device_type.pk
+        self.device_type.delete()
+        SearchDocument.objects.update_for_objects(DeviceType, [pk])
+        self.assertFalse(SearchDocument.objects.filter(object_id=pk).exists())
+
+    @skipIf(connection.vendor != "postgresql", "The search index is only used with PostgreSQL")
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_search(self):
+        # The document is maintained by signals when the object is saved
+        self.device_type.save()
+        other_device_type = DeviceType.objects.create(manufacturer=self.manufacturer, model="Searchable")
+        self.assertQuerysetEqual(
+            SearchDocument.objects.search(DeviceType.objects.all(), "searchable"),
+            [other_device_type, self.device_type],
+        )
+        self.assertQuerysetEqual(
+            SearchDocument.objects.search(DeviceType.objects.all(), "widget-of"),
+            [self.device_type],
+        )
+        # The PK is matched exactly, as by the `q` filter, rather than as a substring
+        self.assertQuerysetEqual(
+            SearchDocument.objects.search(DeviceType.objects.all(), str(other_device_type.pk)),
+            [other_device_type],
+        )
+        self.assertQuerysetEqual(
+            SearchDocument.objects.search(DeviceType.objects.all(), str(other_device_type.pk)[:8]),
+            [],
+        )
+
+    @skipIf(connection.vendor != "postgresql", "The search index is only used with PostgreSQL")
+    def test_search_index_used(self):
+        """The trigram index should serve the `icontains` lookup of the documents that search() makes."""
+        create_search_index(connection)
+        with connection.cursor() as cursor:
+            # Leave bitmap scans as the only alternative to the (disfavored) sequential scan of the table
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_indexscan = off")
+        self.assertIn(SEARCH_INDEX_NAME, SearchDocument.objects.filter(text__icontains="searchable").explain())
+
+
 class StatusTest(ModelTestCases.BaseModelTestCase):
     """
     Tests for the `Status` model class.
@@ -850,6 +850,48 @@ class RelationshipAssociationTest(RelationshipBaseTest, ModelTestCases.BaseModel
             },
         )
 
+    def test_bulk_get_relationships(self):
+        associations = [
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[0]),
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[1]),
+            RelationshipAssociation(relationship=self.m2m_2, source=self.racks[1], destination=self.vlans[2]),
+            RelationshipAssociation(relationship=self.o2o_1, source=self.racks[2], destination=self.locations[0]),
+            RelationshipAssociation(relationship=self.o2os_1, source=self.racks[0], destination=self.racks[1]),
+        ]
+        for association in associations:
+            association.validated_save()
+
+        racks = list(Rack.objects.filter(pk__in=[rack.pk for rack in self.racks]))
+        results = Rack.bulk_get_relationships(racks)
+        for rack in racks:
+            expected = rack.get_relationships(include_hidden=True)
+            self.assertEqual(results[rack.pk].keys(), expected.keys())
+            for side, relationships in expected.items():
+                self.assertEqual(results[rack.pk][side].keys(), relationships.keys())
+                for relationship, queryset in relationships.items():
+                    self.assertEqual(set(results[rack.pk][side][relationship]), set(queryset))
+
+        # Once prefetched, relationships and their peers are resolved without any further queries
+        Rack.prefetch_relationships(racks)
+        with self.assertNumQueries(0):
+            peers = {
+                rack: {
+                    relationship: [association.get_peer(rack) for association in relationship_associations]
+                    for relationships in rack.get_relationships().values()
+                    for relationship, relationship_associations in relationships.items()
+                }
+                for rack in racks
+            }
+        racks_by_pk = {rack.pk: rack for rack in racks}
+        rack_0, rack_1 = racks_by_pk[self.racks[0].pk], racks_by_pk[self.racks[1].pk]
+        self.assertCountEqual(peers[rack_0][self.m2m_1], [self.vlans[0], self.vlans[1]])
+        self.assertEqual(peers[rack_0][self.o2os_1], [self.racks[1]])
+        self.assertEqual(peers[rack_1][self.m2m_2], [self.vlans[2]])
+        self.assertEqual(peers[rack_1][self.o2os_1], [self.racks[0]])
+        # Hidden relationships are only included if requested
+        self.assertNotIn(self.o2o_1, racks_by_pk[self.racks[2].pk].get_relationships()["source"])
+        self.assertIn(self.o2o_1, racks_by_pk[self.racks[2].pk].get_relationships(include_hidden=True)["source"])
+
     def test_delete_cascade(self):
         """Verify that a RelationshipAssociation is deleted if either of the associated records is deleted."""
         initial_count = RelationshipAssociation.objects.count()
@@ -1,11 +1,15 @@
 from copy import deepcopy
+from http.server import ThreadingHTTPServer
+from io import StringIO
 import json
+import threading
 from unittest.mock import patch
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
 from django.utils import timezone
 from requests import Session
 
@@ -17,11 +21,19 @@ from nautobot.dcim.api.serializers import LocationSerializer
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.context_managers import web_request_context
-from nautobot.extras.models import Tag, Webhook
+from nautobot.extras.management.commands.webhook_receiver import WebhookHandler
+from nautobot.extras.models import ObjectChange, Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import (
+    get_webhook_destination,
+    get_webhook_session,
+    process_webhook,
+    process_webhook_batch,
+    webhook_concurrency_slot,
+)
 from nautobot.extras.utils import generate_signature
+from nautobot.extras.webhooks import get_snapshots_for_object_changes
 
 User = get_user_model()
 
@@ -272,6 +284,144 @@ class WebhookTest(APITestCase):
                     snapshots,
                 )
 
+    def test_process_webhook_batch(self):
+        """
+        Mock a Session.send to inspect the result of `process_webhook_batch()`.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        timestamp = str(timezone.now())
+        events = [
+            [
+                {"name": f"Location {i}"},
+                "location",
+                ObjectChangeActionChoices.ACTION_CREATE,
+                timestamp,
+                "admin",
+                request_id,
+                {},
+            ]
+            for i in range(3)
+        ]
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            body = json.loads(request.body)
+            self.assertEqual(
+                [event["data"]["name"] for event in body["events"]], ["Location 0", "Location 1", "Location 2"]
+            )
+            self.assertEqual(body["events"][0]["event"], "created")
+            self.assertEqual(body["events"][0]["request_id"], str(request_id))
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk, events)
+
+    def test_process_webhook_reuses_connections(self):
+        """
+        Send webhooks to a local `webhook_receiver` and make sure that a single connection is reused for all of them.
+        """
+        client_ports = set()
+
+        class RecordingWebhookHandler(WebhookHandler):
+            show_headers = False
+
+            def do_ANY(self):
+                client_ports.add(self.client_address[1])
+                super().do_ANY()
+
+        httpd = ThreadingHTTPServer(("localhost", 0), RecordingWebhookHandler)
+        httpd.daemon_threads = True
+        server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        server_thread.start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+
+        webhook = Webhook.objects.create(
+            name="Local Receiver Webhook",
+            type_create=True,
+            payload_url=f"http://localhost:{httpd.server_address[1]}/",
+        )
+        timestamp = str(timezone.now())
+        with patch("sys.stdout", new_callable=StringIO):
+            for i in range(3):
+                process_webhook(
+                    webhook.pk,
+                    {"name": f"Location {i}"},
+                    "location",
+                    ObjectChangeActionChoices.ACTION_CREATE,
+                    timestamp,
+                    self.user.username,
+                    uuid.uuid4(),
+                    {},
+                )
+
+        self.assertEqual(len(client_ports), 1)
+        get_webhook_session(get_webhook_destination(webhook)).close()
+
+    @override_settings(WEBHOOK_MAX_CONCURRENT_REQUESTS=1)
+    def test_webhook_concurrency_slot(self):
+        """Make sure that the number of concurrent requests to a single destination is limited."""
+        with webhook_concurrency_slot("example.com") as acquired:
+            self.assertTrue(acquired)
+            with webhook_concurrency_slot("example.com") as acquired_again:
+                self.assertFalse(acquired_again)
+            with webhook_concurrency_slot("example.org") as acquired_other:
+                self.assertTrue(acquired_other)
+        with webhook_concurrency_slot("example.com") as acquired:
+            self.assertTrue(acquired)
+
+    @override_settings(WEBHOOK_MAX_CONCURRENT_REQUESTS=1)
+    def test_webhook_concurrency_slot_counter_expired(self):
+        """Make sure that a slot that wasn't counted isn't released, if the counter is recreated by another worker."""
+        with webhook_concurrency_slot("example.com") as acquired:
+            self.assertTrue(acquired)
+            # Simulate the counter expiring just before incr(), and another worker recreating it in the meantime
+            with patch("nautobot.extras.tasks.cache.incr", side_effect=ValueError), patch(
+                "nautobot.extras.tasks.cache.add", return_value=False
+            ):
+                with webhook_concurrency_slot("example.com") as acquired_again:
+                    self.assertFalse(acquired_again)
+            # The first slot is still held
+            with webhook_concurrency_slot("example.com") as acquired_again:
+                self.assertFalse(acquired_again)
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    def test_enqueue_webhooks_batched(self, mock_batch_async, mock_async):
+        """
+        Make sure that events for a webhook with a `batch_size` are grouped into batches.
+        """
+        webhook = Webhook.objects.create(
+            name="Location Batch Webhook",
+            type_create=True,
+            payload_url="http://localhost/batch/",
+            batch_size=2,
+        )
+        webhook.content_types.set([ContentType.objects.get_for_model(Location)])
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        # One event per request for the non-batched create webhook
+        self.assertEqual(mock_async.call_count, 3)
+        # Two requests of up to two events each for the batched webhook
+        self.assertEqual(mock_batch_async.call_count, 2)
+        batches = [call[1]["args"] for call in mock_batch_async.call_args_list]
+        self.assertEqual([args[0] for args in batches], [webhook.pk, webhook.pk])
+        self.assertEqual(sorted(len(args[1]) for args in batches), [1, 2])
+        self.assertEqual(
+            sorted(event[0]["name"] for args in batches for event in args[1]),
+            ["Location 0", "Location 1", "Location 2"],
+        )
+
     def test_webhook_render_body_with_utf8(self):
         self.assertEqual(Webhook().render_body({"utf8": "I am UTF-8! 😀"}), '{"utf8": "I am UTF-8! 😀"}')
 
@@ -330,8 +480,8 @@ class WebhookTest(APITestCase):
         self.assertEqual(args[6], request_id)
         self.assertNotEqual(args[7], {})
 
-    @patch("nautobot.extras.context_managers.enqueue_webhooks")
-    def test_enqueue_webhooks_create_update(self, mock_enqueue_webhooks):
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_create_update(self, mock_async):
         """
         Make sure only one webhook is enqueued if there's a create and update in the same change context.
         """
@@ -345,7 +495,35 @@ class WebhookTest(APITestCase):
 
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
-        mock_enqueue_webhooks.assert_called_once_with(all_changes.first())
+        mock_async.assert_called_once()
+        self.assertEqual(mock_async.call_args[1]["args"][6], all_changes.first().request_id)
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_for_object_changes(self, mock_async):
+        """
+        Make sure that webhooks for many changes are enqueued with snapshots matching `ObjectChange.get_snapshots()`.
+        """
+        location_type = LocationType.objects.get(name="Campus")
+        with web_request_context(self.user):
+            locations = [
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+                for i in range(5)
+            ]
+        request_id = uuid.uuid4()
+        with web_request_context(self.user, change_id=request_id):
+            for location in locations:
+                location.description = "changed"
+                location.save()
+
+        object_changes = list(ObjectChange.objects.filter(request_id=request_id))
+        self.assertEqual(len(object_changes), 5)
+        self.assertEqual(mock_async.call_count, 5 + 5)
+        # Snapshots for all five changes are computed with a constant number of queries
+        with self.assertNumQueries(2):
+            snapshots = get_snapshots_for_object_changes(object_changes)
+        for object_change in object_changes:
+            self.assertEqual(snapshots[object_change.pk], object_change.get_snapshots())
+            self.assertEqual(snapshots[object_change.pk]["differences"]["added"]["description"], "changed")
 
     def test_all_webhook_supported_models(self):
         """
@@ -1,4 +1,6 @@
 import collections
+from copy import deepcopy
+import functools
 import hashlib
 import hmac
 import logging
@@ -9,7 +11,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import ValidationError
-from django.db import transaction
+from django.db import connection, DatabaseError, transaction
 from django.db.models import Q
 from django.template.loader import get_template, TemplateDoesNotExist
 from django.utils.deconstruct import deconstructible
@@ -17,6 +19,7 @@ from django.utils.deconstruct import deconstructible
 from nautobot.core.choices import ColorChoices
 from nautobot.core.models.managers import TagsManager
 from nautobot.core.models.utils import find_models_with_matching_fields
+from nautobot.core.utils.lookup import get_filterset_for_model, get_searchable_models
 from nautobot.extras.constants import (
     EXTRAS_FEATURES,
     JOB_MAX_GROUPING_LENGTH,
@@ -485,6 +488,113 @@ def check_if_key_is_graphql_safe(model_name, key, field_name="key"):
         )
 
 
+def is_search_index_enabled():
+    """Return whether the global search should look up results with the `SearchDocument` index (PostgreSQL only)."""
+    return settings.SEARCH_INDEX_ENABLED and connection.vendor == "postgresql"
+
+
+SEARCH_INDEX_NAME = "extras_searchdocument_text_upper_trgm"
+
+
+def create_search_index(connection):
+    """
+    Create the trigram GIN index of `SearchDocument` text on PostgreSQL, along with the `pg_trgm` extension it needs.
+
+    The index is of the upper-cased text, as that's what Django's `icontains` lookup matches against on PostgreSQL
+    (`UPPER("text"::text) LIKE UPPER(...)`); an index of the bare column wouldn't be used by `SearchDocument` searches.
+
+    Raises:
+        DatabaseError: if the `pg_trgm` extension isn't available, or can't be created by the database user. Any
+            statements already executed are rolled back, leaving an enclosing transaction usable.
+    """
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute("SELECT installed_version FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        row = cursor.fetchone()
+        if row is None:
+            raise DatabaseError("the pg_trgm extension isn't available on this PostgreSQL server")
+        if row[0] is None:
+            # pg_trgm is a "trusted" extension as of PostgreSQL 13, which any user with CREATE on the database may create
+            cursor.execute(
+                "SELECT rolsuper OR (%s AND has_database_privilege(current_database(), 'CREATE')) "
+                "FROM pg_roles WHERE rolname = current_user",
+                [connection.pg_version >= 130000],
+            )
+            if not cursor.fetchone()[0]:
+                raise DatabaseError("the database user isn't permitted to create the pg_trgm extension")
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX_NAME} "
+            "ON extras_searchdocument USING gin ((UPPER(text::text)) gin_trgm_ops)"
+        )
+
+
+def _get_search_filter(model):
+    """Return the `q` filter of the given model's FilterSet if it's a SearchFilter (or similar), otherwise None."""
+    from nautobot.core.filters import MappedPredicatesFilterMixin  # avoid circular import
+
+    filterset = get_filterset_for_model(model)
+    search_filter = filterset.base_filters.get("q") if filterset is not None else None
+    if not isinstance(search_filter, MappedPredicatesFilterMixin):
+        return None
+    return search_filter
+
+
+def _is_icontains_predicate(lookup_info):
+    """Return whether the given SearchFilter predicate (a lookup expression or a dict) uses the `icontains` lookup."""
+    lookup_expr = lookup_info.get("lookup_expr") if isinstance(lookup_info, dict) else lookup_info
+    return lookup_expr == "icontains"
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_fields(model):
+    """
+    Return the fields whose values make up the `SearchDocument` of each instance of the given model.
+
+    These are the fields (which may span relationships) matched with `icontains` by the `q` SearchFilter of the model's
+    FilterSet; see `get_search_direct_filter()` for those matched otherwise. Returns None if the model's FilterSet has
+    no such filter, for example because its search is implemented by a custom method, in which case the model is
+    searched with its FilterSet rather than with the index.
+    """
+    search_filter = _get_search_filter(model)
+    if search_filter is None:
+        return None
+    return tuple(
+        field_name
+        for field_name, lookup_info in search_filter.filter_predicates.items()
+        if _is_icontains_predicate(lookup_info)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_direct_filter(model):
+    """
+    Return a filter matching the predicates of the model's `q` SearchFilter that don't use the `icontains` lookup.
+
+    Such predicates (for example `{"id": "iexact"}` or an `exact` match of an ASN) can't be served by a substring match
+    of the `SearchDocument` text, so they're matched directly against the model's table, with their own lookup.
+    Returns None if there are no such predicates, or if the model isn't included in the search index.
+    """
+    search_filter = _get_search_filter(model)
+    if search_filter is None:
+        return None
+    filter_predicates = {
+        field_name: lookup_info
+        for field_name, lookup_info in search_filter.filter_predicates.items()
+        if not _is_icontains_predicate(lookup_info)
+    }
+    if not filter_predicates:
+        return None
+    direct_filter = deepcopy(search_filter)
+    direct_filter.filter_predicates = filter_predicates
+    return direct_filter
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_indexed_models():
+    """Return the searchable models whose global search results are looked up with the `SearchDocument` index."""
+    return frozenset(model for model in get_searchable_models() if get_search_fields(model) is not None)
+
+
 def fixup_null_statuses(*, model, model_contenttype, status_model):
     """For instances of model that have an invalid NULL status field, create and use a special status_model instance."""
     instances_to_fixup = model.objects.filter(status__isnull=True)
@@ -1,15 +1,109 @@
+from collections import defaultdict
+
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
+from nautobot.core.celery import app
+from nautobot.core.utils.data import batched
 from nautobot.extras.choices import ObjectChangeActionChoices
-from nautobot.extras.models import Webhook
+from nautobot.extras.models import ObjectChange, Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+# Map of ObjectChange actions to the Webhook/JobHook boolean field that enables them
+ACTION_FLAGS = {
+    ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+    ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+    ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+}
+
+
+def index_hooks_by_content_type_and_action(hooks):
+    """
+    Build a lookup table of `{(content_type_pk, action): [hook, ...]}` for the given Webhooks or JobHooks.
+
+    The hooks should have their `content_types` prefetched to avoid a query per hook.
+    """
+    index = defaultdict(list)
+    for hook in hooks:
+        actions = [action for action, flag in ACTION_FLAGS.items() if getattr(hook, flag)]
+        for content_type in hook.content_types.all():
+            for action in actions:
+                index[(content_type.pk, action)].append(hook)
+    return index
+
 
+def get_snapshots_for_object_changes(object_changes):
+    """
+    Compute `ObjectChange.get_snapshots()` for many ObjectChanges at once.
+
+    Rather than looking up the previous change for each ObjectChange individually, all previous changes are retrieved
+    with a single query.
+
+    Returns:
+        (dict): `{object_change.pk: snapshots}`
+    """
+    object_changes = list(object_changes)
+    # A create never has a previous state, so there's no need to look up its prior change
+    needs_prior_change = [oc.pk for oc in object_changes if oc.action != ObjectChangeActionChoices.ACTION_CREATE]
+    prior_change_pks = {}
+    if needs_prior_change:
+        prior_changes = (
+            ObjectChange.objects.filter(
+                changed_object_type=OuterRef("changed_object_type"),
+                changed_object_id=OuterRef("changed_object_id"),
+                time__lt=OuterRef("time"),
+            )
+            .exclude(pk=OuterRef("pk"))
+            .order_by("-time")
+        )
+        prior_change_pks = dict(
+            ObjectChange.objects.filter(pk__in=needs_prior_change)
+            .annotate(prior_change_pk=Subquery(prior_changes.values("pk")[:1]))
+            .values_list("pk", "prior_change_pk")
+        )
+    prior_changes_by_pk = ObjectChange.objects.in_bulk([pk for pk in prior_change_pks.values() if pk is not None])
 
-def enqueue_webhooks(object_change):
+    return {
+        oc.pk: oc.get_snapshots(
+            prior_change=prior_changes_by_pk.get(prior_change_pks.get(oc.pk)),
+            lookup_prior_change=False,
+        )
+        for oc in object_changes
+    }
+
+
+def get_webhook_event_args(object_change, snapshots):
+    """
+    Return the per-event arguments of `process_webhook()` (i.e. excluding the Webhook PK) for the given ObjectChange.
+    """
+    # fall back to object_data if object_data_v2 is not available
+    serialized_data = object_change.object_data_v2
+    if serialized_data is None:
+        serialized_data = object_change.object_data
+
+    return [
+        serialized_data,
+        object_change.changed_object_type.model,
+        object_change.action,
+        str(timezone.now()),
+        object_change.user_name,
+        object_change.request_id,
+        snapshots,
+    ]
+
+
+def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None, producer=None):
     """
     Find Webhook(s) assigned to this instance + action and enqueue them
     to be processed
+
+    Args:
+        object_change (ObjectChange): The change to notify Webhooks about
+        snapshots (dict): Optional precomputed result of `object_change.get_snapshots()`
+        webhook_queryset (iterable): Optional candidate Webhooks to consider instead of querying the database; these
+            must already be filtered to enabled Webhooks matching this object's content type and action
+        producer (kombu.Producer): Optional Celery producer to publish with, to reuse a single broker connection
     """
     # Determine whether this type of object supports webhooks
     app_label = object_change.changed_object_type.app_label
@@ -18,30 +112,64 @@ def enqueue_webhooks(object_change):
         return
 
     # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
-        # fall back to object_data if object_data_v2 is not available
-        serialized_data = object_change.object_data_v2
-        if serialized_data is None:
-            serialized_data = object_change.object_data
+    if webhook_queryset is None:
+        content_type = object_change.changed_object_type
+        action_flag = ACTION_FLAGS[object_change.action]
+        webhook_queryset = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+    webhooks = list(webhook_queryset)
+
+    if webhooks:
+        if snapshots is None:
+            snapshots = object_change.get_snapshots()
+        event_args = get_webhook_event_args(object_change, snapshots)
 
         # Enqueue the webhooks
         for webhook in webhooks:
-            args = [
-                webhook.pk,
-                serialized_data,
-                model_name,
-                object_change.action,
-                str(timezone.now()),
-                object_change.user_name,
-                object_change.request_id,
-                object_change.get_snapshots(),
-            ]
-            process_webhook.apply_async(args=args)
+            if webhook.batch_size > 1:
+                # The receiver expects batched requests, even if there's only a single event to send
+                process_webhook_batch.apply_async(args=[webhook.pk, [event_args]], producer=producer)
+            else:
+                process_webhook.apply_async(args=[webhook.pk, *event_args], producer=producer)
+
+
+def enqueue_webhooks_for_object_changes(object_changes):
+    """
+    Enqueue Webhooks for many ObjectChanges at once, such as all of the changes made in a single change context.
+
+    All enabled Webhooks are loaded once and matched in memory against each change, snapshots are computed in bulk
+    for the changes that have a matching Webhook, and all resulting Celery messages are published over one producer.
+    Events for Webhooks with a `batch_size` greater than 1 are grouped into requests of up to `batch_size` events.
+    """
+    webhooks_index = index_hooks_by_content_type_and_action(
+        Webhook.objects.filter(enabled=True).prefetch_related("content_types")
+    )
+    if not webhooks_index:
+        return
+
+    to_enqueue = []
+    for object_change in object_changes:
+        content_type = object_change.changed_object_type
+        if content_type is None or content_type.model not in registry["model_features"]["webhooks"].get(
+            content_type.app_label, []
+        ):
+            continue
+        webhooks = webhooks_index.get((content_type.pk, object_change.action))
+        if webhooks:
+            to_enqueue.append((object_change, webhooks))
+    if not to_enqueue:
+        return
+
+    snapshots = get_snapshots_for_object_changes(object_change for object_change, _ in to_enqueue)
+    batches = defaultdict(list)
+    with app.producer_or_acquire() as producer:
+        for object_change, webhooks in to_enqueue:
+            event_args = get_webhook_event_args(object_change, snapshots[object_change.pk])
+            for webhook in webhooks:
+                if webhook.batch_size > 1:
+                    batches[webhook].append(event_args)
+                else:
+                    process_webhook.apply_async(args=[webhook.pk, *event_args], producer=producer)
+
+        for webhook, events in batches.items():
+            for events_batch in batched(events, webhook.batch_size):
+                process_webhook_batch.apply_async(args=[webhook.pk, events_batch], producer=producer)
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueTogetherValidator
@@ -143,6 +144,7 @@ class VLANSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
 class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     prefix = IPFieldSerializer()
     type = ChoiceField(choices=PrefixTypeChoices, default=PrefixTypeChoices.TYPE_NETWORK)
+    utilization = serializers.SerializerMethodField()
 
     class Meta:
         model = Prefix
@@ -191,6 +193,16 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
             ],
         }
 
+    def get_field_names(self, declared_fields, info):
+        """Utilization is comparatively expensive to compute and so it's opt-in only."""
+        fields = list(super().get_field_names(declared_fields, info))
+        self.extend_field_names(fields, "utilization", opt_in_only=True)
+        return fields
+
+    @extend_schema_field(serializers.DictField(child=serializers.IntegerField()))
+    def get_utilization(self, obj):
+        return obj.get_utilization()._asdict()
+
 
 class PrefixLengthSerializer(serializers.Serializer):
     prefix_length = serializers.IntegerField()
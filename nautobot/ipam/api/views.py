@@ -104,6 +104,14 @@ class PrefixViewSet(NautobotModelViewSet):
     serializer_class = serializers.PrefixSerializer
     filterset_class = filters.PrefixFilterSet
 
+    def get_queryset(self):
+        """If the `include` query param includes `utilization`, have the database compute it for the whole page."""
+        queryset = super().get_queryset()
+        request = self.get_serializer_context()["request"]
+        if request is not None and "utilization" in request.query_params.getlist("include"):
+            return queryset.annotate_utilization()
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "available_prefixes" and self.request.method == "POST":
             return serializers.PrefixLengthSerializer
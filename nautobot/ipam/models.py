@@ -482,6 +482,9 @@ class Prefix(PrimaryModel):
 
     objects = BaseManager.from_queryset(PrefixQuerySet)()
 
+    # PrefixQuerySet.bulk_create() maintains the Prefix hierarchy just as save() does
+    bulk_create_safe_save = True
+
     clone_fields = [
         "date_allocated",
         "description",
@@ -833,24 +836,41 @@ class Prefix(PrimaryModel):
 
         return query
 
-    def get_available_prefixes(self):
+    def _iter_available_ranges(self, used_ranges, first=None, last=None):
         """
-        Return all available Prefixes within this prefix as an IPSet.
-        """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
-
-        return available_prefixes
+        Yield the `(first, last)` integer address ranges within this prefix that aren't covered by any `used_ranges`.
 
-    def get_available_ips(self):
-        """
-        Return all available IPs within this prefix as an IPSet.
+        Args:
+            used_ranges (iterable): `(first, last)` address ranges, sorted by `first` but possibly overlapping; consumed
+                lazily, so that finding the first available range doesn't require retrieving every used range
+            first (int): Lowest address to consider, if not the network address of this prefix
+            last (int): Highest address to consider, if not the broadcast address of this prefix
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.ip_addresses.all()])
-        available_ips = prefix - child_ips
-
+        start = self.prefix.first if first is None else first
+        end = self.prefix.last if last is None else last
+        for used_first, used_last in used_ranges:
+            if used_first > end:
+                break
+            if used_first > start:
+                yield start, used_first - 1
+            start = max(start, used_last + 1)
+            if start > end:
+                return
+        yield start, end
+
+    def _get_used_prefix_ranges(self):
+        """Iterate over the address ranges of all descendants of this prefix, sorted by network address."""
+        for network, broadcast in self.descendants().order_by("network").values_list("network", "broadcast").iterator():
+            yield int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast))
+
+    def _get_used_ip_ranges(self):
+        """Iterate over the addresses of all child IP addresses of this prefix, sorted, as single-address ranges."""
+        for host in self.ip_addresses.order_by("host").values_list("host", flat=True).iterator():
+            host = int(netaddr.IPAddress(host))
+            yield host, host
+
+    def _get_usable_ip_range(self):
+        """Return the first and last assignable addresses within this prefix, as integers."""
         # IPv6, pool, or IPv4 /31-32 sets are fully usable
         if any(
             [
@@ -859,17 +879,31 @@ class Prefix(PrimaryModel):
                 self.ip_version == 4 and self.prefix_length >= 31,
             ]
         ):
-            return available_ips
-
-        # Omit first and last IP address from the available set
+            return self.prefix.first, self.prefix.last
         # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
+        return self.prefix.first + 1, self.prefix.last - 1
+
+    def _ranges_to_ipset(self, ranges):
+        return netaddr.IPSet(
+            cidr
+            for first, last in ranges
+            for cidr in netaddr.iprange_to_cidrs(
+                netaddr.IPAddress(first, version=self.ip_version), netaddr.IPAddress(last, version=self.ip_version)
+            )
         )
-        return available_ips
+
+    def get_available_prefixes(self):
+        """
+        Return all available Prefixes within this prefix as an IPSet.
+        """
+        return self._ranges_to_ipset(self._iter_available_ranges(self._get_used_prefix_ranges()))
+
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+        """
+        first, last = self._get_usable_ip_range()
+        return self._ranges_to_ipset(self._iter_available_ranges(self._get_used_ip_ranges(), first=first, last=last))
 
     def get_child_ips(self):
         """
@@ -892,19 +926,20 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        for first, last in self._iter_available_ranges(self._get_used_prefix_ranges()):
+            return netaddr.iprange_to_cidrs(
+                netaddr.IPAddress(first, version=self.ip_version), netaddr.IPAddress(last, version=self.ip_version)
+            )[0]
+        return None
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
-            return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        first, last = self._get_usable_ip_range()
+        for available_first, _ in self._iter_available_ranges(self._get_used_ip_ranges(), first=first, last=last):
+            return f"{netaddr.IPAddress(available_first, version=self.ip_version)}/{self.prefix_length}"
+        return None
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -914,26 +949,19 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
+        The utilization is computed by the database; if this prefix was retrieved from a queryset with
+        `annotate_utilization()` applied, no further queries are needed.
+
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
-        denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
-
-        # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
-        # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
-        # change this when that is the case, see #3873 for historical context.
-        if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
-                parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
-
-        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.only("network", "prefix_length").iterator())
+        if hasattr(self, "_utilization_child_ip_count"):
+            utilization = self
+        else:
+            utilization = Prefix.objects.filter(pk=self.pk).annotate_utilization().only("pk").get()
 
-        numerator_set = child_ips | child_prefixes
+        denominator = self.prefix.size
+        numerator = int(utilization._utilization_child_prefix_size) + utilization._utilization_child_ip_count
 
         # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
@@ -944,10 +972,10 @@ class Prefix(PrimaryModel):
                 self.ip_version == 4,
             ]
         ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            if not utilization._utilization_edges_used:
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features(
@@ -1035,6 +1063,9 @@ class IPAddress(PrimaryModel):
 
     objects = BaseManager.from_queryset(IPAddressQuerySet)()
 
+    # IPAddressQuerySet.bulk_create() assigns the closest parent Prefix just as save() does
+    bulk_create_safe_save = True
+
     class Meta:
         ordering = ("ip_version", "host", "mask_length")  # address may be non-unique
         verbose_name = "IP address"
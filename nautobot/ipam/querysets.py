@@ -1,11 +1,30 @@
+from collections import defaultdict
+import operator
 import re
 
 from django.core.exceptions import ValidationError
-from django.db.models import ProtectedError, Q
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    Exists,
+    F,
+    OuterRef,
+    ProtectedError,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Power
 import netaddr
 
 from nautobot.core.models.querysets import RestrictedQuerySet
-from nautobot.core.utils.data import merge_dicts_without_collision
+from nautobot.core.utils.data import batched, merge_dicts_without_collision
+from nautobot.ipam.choices import PrefixTypeChoices
+from nautobot.ipam.trie import IP_VERSION_BITS, PrefixTrie
 
 
 class RIRQuerySet(RestrictedQuerySet):
@@ -193,10 +212,196 @@ class BaseNetworkQuerySet(RestrictedQuerySet):
         last_ip = self._get_last_ip(ip)
         return ip, last_ip
 
+    def _get_prefix_trie(self, namespace_id, ip_version, first, last):
+        """
+        Return a `PrefixTrie` of the Prefixes in the given namespace and IP version overlapping the given range.
+
+        The trie values are the Prefix PKs. Ranges are given as integers. Since every supernet of a Prefix overlapping
+        the range also overlaps it, the trie is complete for the purpose of computing the hierarchy within the range.
+
+        Returns:
+            (tuple): `(trie, {prefix_pk: parent_pk})`
+        """
+        from nautobot.ipam.models import Prefix  # avoid circular import
+
+        prefixes = Prefix.objects.filter(
+            namespace_id=namespace_id,
+            ip_version=ip_version,
+            network__lte=str(netaddr.IPAddress(last, version=ip_version)),
+            broadcast__gte=str(netaddr.IPAddress(first, version=ip_version)),
+        ).values_list("pk", "network", "prefix_length", "parent_id")
+        trie = PrefixTrie()
+        parents = {}
+        for pk, network, prefix_length, parent_id in prefixes.iterator():
+            trie._insert(ip_version, int(netaddr.IPAddress(network)), prefix_length, pk)
+            parents[pk] = parent_id
+        return trie, parents
+
 
 class PrefixQuerySet(BaseNetworkQuerySet):
     """Queryset for `Prefix` objects."""
 
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False):
+        """
+        Create the given Prefixes in bulk, maintaining the Prefix hierarchy as `Prefix.save()` does for each Prefix.
+
+        The new Prefixes are assigned their closest parent, and existing Prefixes and IPAddresses that now belong to a
+        new Prefix are reparented to it. The hierarchy of each affected namespace is computed in memory with a
+        `PrefixTrie`, rather than with several queries per new Prefix, and changes to existing records are written
+        with `bulk_update()`.
+
+        When `ignore_conflicts` is True, it's unknown which of the Prefixes were actually created, so the hierarchy
+        is left unchanged, as with a plain `bulk_create()`.
+        """
+        objs = list(objs)
+        if ignore_conflicts or not objs:
+            return super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+
+        from nautobot.ipam.models import IPAddress  # avoid circular import
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            updated_prefixes, updated_ip_addresses = self._update_hierarchy_for_new_prefixes(objs)
+            # Insert supernets ahead of their subnets, for databases that check foreign keys on each row
+            super().bulk_create(sorted(objs, key=operator.attrgetter("prefix_length")), batch_size=batch_size)
+            if updated_prefixes:
+                self.model.objects.bulk_update(updated_prefixes, ["parent"], batch_size=batch_size)
+            if updated_ip_addresses:
+                IPAddress.objects.bulk_update(updated_ip_addresses, ["parent"], batch_size=batch_size)
+        return objs
+
+    def _update_hierarchy_for_new_prefixes(self, new_prefixes):
+        """
+        Set the parent of each of the given unsaved Prefixes, and determine the resulting changes to existing records.
+
+        Returns:
+            (tuple): Lists of existing Prefixes and IPAddresses (with only `id` and `parent_id` populated) whose parent
+                should be updated once the new Prefixes are saved
+        """
+        from nautobot.ipam.models import IPAddress  # avoid circular import
+
+        new_prefixes_by_pk = {}
+        groups = defaultdict(list)
+        for prefix in new_prefixes:
+            # Clear host bits from prefix
+            prefix.prefix = prefix.prefix.cidr
+            new_prefixes_by_pk[prefix.pk] = prefix
+            groups[(prefix.namespace_id, prefix.ip_version)].append(prefix)
+
+        updated_prefixes = []
+        updated_ip_addresses = []
+        for (namespace_id, ip_version), prefixes in groups.items():
+            trie, existing_parents = self._get_prefix_trie(
+                namespace_id,
+                ip_version,
+                min(prefix.prefix.first for prefix in prefixes),
+                max(prefix.prefix.last for prefix in prefixes),
+            )
+            for prefix in prefixes:
+                trie._insert(ip_version, prefix.prefix.first, prefix.prefix_length, prefix.pk)
+
+            # New Prefixes whose parent is an existing Prefix may take over some of that parent's IPAddresses
+            ip_address_queries = []
+            for _, _, _, pk, parent_pk in trie._iter_hierarchy():
+                if pk in new_prefixes_by_pk:
+                    prefix = new_prefixes_by_pk[pk]
+                    if parent_pk in new_prefixes_by_pk:
+                        prefix.parent = new_prefixes_by_pk[parent_pk]
+                    else:
+                        prefix.parent_id = parent_pk
+                        if parent_pk is not None:
+                            ip_address_queries.append(
+                                Q(parent_id=parent_pk, host__gte=prefix.network, host__lte=prefix.broadcast)
+                            )
+                elif existing_parents[pk] != parent_pk:
+                    updated_prefixes.append(self.model(id=pk, namespace_id=namespace_id, parent_id=parent_pk))
+
+            bits = IP_VERSION_BITS[ip_version]
+            for queries in batched(ip_address_queries, 500):
+                ip_addresses = IPAddress.objects.filter(Q(*queries, _connector=Q.OR)).values_list(
+                    "pk", "host", "parent_id"
+                )
+                for pk, host, parent_id in ip_addresses.iterator():
+                    node = trie._get_closest_parent(ip_version, int(netaddr.IPAddress(host)), bits, include_self=True)
+                    if node.value != parent_id:
+                        updated_ip_addresses.append(IPAddress(id=pk, parent_id=node.value))
+
+        return updated_prefixes, updated_ip_addresses
+
+    def annotate_utilization(self):
+        """
+        Annotate each Prefix with the data needed by `Prefix.get_utilization()`, computed by the database.
+
+        Rather than loading every child Prefix and IPAddress into a `netaddr.IPSet`, the utilization of each Prefix is
+        derived from a handful of correlated subqueries over the `network`, `broadcast` and `host` columns, so that the
+        utilization of a whole page of Prefixes is retrieved with the Prefixes themselves in a single query:
+
+        - `_utilization_child_prefix_size`: total address space of the direct child Prefixes (which never overlap)
+        - `_utilization_child_ip_count`: number of IPAddresses within the Prefix that aren't within a child Prefix
+        - `_utilization_edges_used`: whether the first or last address of the Prefix is an IPAddress or in a child
+        """
+        from nautobot.ipam.models import IPAddress  # avoid circular import
+
+        child_prefixes = self.model.objects.filter(parent_id=OuterRef("pk")).order_by().values("parent_id")
+        child_prefix_size = child_prefixes.annotate(
+            size=Sum(
+                Power(
+                    # Using an exact numeric type, as IPv6 prefix sizes exceed the precision of a float
+                    Cast(Value(2), DecimalField(max_digits=40, decimal_places=0)),
+                    Case(When(ip_version=4, then=Value(32)), default=Value(128)) - F("prefix_length"),
+                ),
+                output_field=DecimalField(max_digits=40, decimal_places=0),
+            )
+        ).values("size")
+
+        ip_addresses = IPAddress.objects.filter(
+            parent__namespace_id=OuterRef("namespace_id"),
+            ip_version=OuterRef("ip_version"),
+            host__gte=OuterRef("network"),
+            host__lte=OuterRef("broadcast"),
+        ).order_by()
+        covering_child_prefixes = self.model.objects.filter(
+            parent_id=OuterRef(OuterRef("pk")),
+            network__lte=OuterRef("host"),
+            broadcast__gte=OuterRef("host"),
+        )
+
+        def count_hosts(queryset):
+            return Coalesce(
+                Subquery(queryset.values("ip_version").annotate(count=Count("host", distinct=True)).values("count")),
+                0,
+            )
+
+        # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
+        # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
+        # change this when that is the case, see #3873 for historical context.
+        return self.annotate(
+            _utilization_child_prefix_size=Case(
+                When(type=PrefixTypeChoices.TYPE_POOL, then=Value(0)),
+                default=Coalesce(Subquery(child_prefix_size), 0),
+                output_field=DecimalField(max_digits=40, decimal_places=0),
+            ),
+            _utilization_child_ip_count=Case(
+                When(type=PrefixTypeChoices.TYPE_CONTAINER, then=Value(0)),
+                When(type=PrefixTypeChoices.TYPE_POOL, then=count_hosts(ip_addresses)),
+                default=count_hosts(ip_addresses.filter(~Exists(covering_child_prefixes))),
+            ),
+            _utilization_edges_used=Case(
+                When(
+                    Q(Exists(ip_addresses.filter(Q(host=OuterRef("network")) | Q(host=OuterRef("broadcast")))))
+                    | Q(
+                        Exists(
+                            self.model.objects.filter(
+                                Q(network=OuterRef("network")) | Q(broadcast=OuterRef("broadcast")),
+                                parent_id=OuterRef("pk"),
+                            )
+                        )
+                    ),
+                    then=Value(True),
+                ),
+                default=Value(False),
+            ),
+        )
+
     def net_equals(self, *prefixes):
         query = Q()
         for prefix in prefixes:
@@ -386,6 +591,45 @@ class PrefixQuerySet(BaseNetworkQuerySet):
 class IPAddressQuerySet(BaseNetworkQuerySet):
     """Queryset for `IPAddress` objects."""
 
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False):
+        """
+        Create the given IPAddresses in bulk, assigning each its closest parent Prefix and lowercasing its `dns_name`
+        as `IPAddress.save()` does.
+
+        Candidate parents are loaded with a single query per namespace and IP version into a `PrefixTrie`, rather than
+        looked up with a query per IPAddress. A `ValidationError` is raised if any IPAddress has no suitable parent.
+        """
+        from nautobot.ipam.models import get_default_namespace_pk  # avoid circular import
+
+        objs = list(objs)
+        default_namespace_pk = None
+        groups = defaultdict(list)
+        for ip_address in objs:
+            ip_address.dns_name = ip_address.dns_name.lower()
+            namespace = getattr(ip_address, "_provided_namespace", None)
+            if namespace is not None:
+                namespace_id = namespace.pk
+            elif ip_address.parent_id is not None:
+                namespace_id = ip_address.parent.namespace_id
+            else:
+                if default_namespace_pk is None:
+                    default_namespace_pk = get_default_namespace_pk()
+                namespace_id = default_namespace_pk
+            groups[(namespace_id, ip_address.ip_version)].append(ip_address)
+
+        for (namespace_id, ip_version), ip_addresses in groups.items():
+            hosts = [int(netaddr.IPAddress(ip_address.host)) for ip_address in ip_addresses]
+            trie, _ = self._get_prefix_trie(namespace_id, ip_version, min(hosts), max(hosts))
+            bits = IP_VERSION_BITS[ip_version]
+            for ip_address, host in zip(ip_addresses, hosts):
+                node = trie._get_closest_parent(ip_version, host, bits, include_self=True)
+                if node is None:
+                    raise ValidationError({"namespace": "No suitable parent Prefix exists in this Namespace"})
+                ip_address.parent_id = node.value
+                ip_address._namespace = None
+
+        return super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+
     def get_queryset(self):
         """
         By default, PostgreSQL will order INETs with shorter (larger) prefix lengths ahead of those with longer
@@ -185,6 +185,24 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         }
         cls.choices_fields = ["type"]
 
+    def test_list_prefixes_with_utilization(self):
+        """
+        Test that utilization is included, when requested, for each prefix in a list.
+        """
+        self.add_permissions("ipam.view_prefix")
+        url = reverse("ipam-api:prefix-list")
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn("utilization", response.data["results"][0])
+
+        response = self.client.get(f"{url}?include=utilization&limit=10", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        for result in response.data["results"]:
+            prefix = Prefix.objects.get(pk=result["id"])
+            numerator, denominator = prefix.get_utilization()
+            self.assertEqual(result["utilization"], {"numerator": numerator, "denominator": denominator})
+
     def test_list_available_prefixes(self):
         """
         Test retrieval of all available prefixes within a parent prefix.
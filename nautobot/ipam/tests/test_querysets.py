@@ -1,6 +1,7 @@
 import re
 from unittest import skipIf
 
+from django.core.exceptions import ValidationError
 from django.db import connection
 import netaddr
 
@@ -757,3 +758,91 @@ class PrefixQuerysetTestCase(TestCase):
                     .order_by("-prefix_length")
                     .first(),
                 )
+
+    def test_bulk_create_maintains_hierarchy(self):
+        """Prefix.objects.bulk_create() should result in the same hierarchy as saving each Prefix individually."""
+        namespace = Namespace.objects.create(name="Bulk Create Hierarchy")
+        supernet = Prefix.objects.create(prefix="10.0.0.0/8", namespace=namespace, status=self.status)
+        subnet = Prefix.objects.create(prefix="10.1.2.0/24", namespace=namespace, status=self.status)
+        ip_address = IPAddress.objects.create(address="10.1.2.3/24", namespace=namespace, status=self.status)
+        other_ip_address = IPAddress.objects.create(address="10.9.0.1/16", namespace=namespace, status=self.status)
+        self.assertEqual(ip_address.parent, subnet)
+        self.assertEqual(other_ip_address.parent, supernet)
+
+        new_prefixes = [
+            Prefix(prefix="10.1.2.0/28", namespace=namespace, status=self.status),
+            Prefix(prefix="10.1.0.0/16", namespace=namespace, status=self.status),
+            Prefix(prefix="10.9.0.0/16", namespace=namespace, status=self.status),
+            Prefix(prefix="10.0.0.0/8", namespace=Namespace.objects.create(name="Other"), status=self.status),
+        ]
+        Prefix.objects.bulk_create(new_prefixes)
+
+        expected_parents = {
+            "10.0.0.0/8": None,
+            "10.1.0.0/16": "10.0.0.0/8",
+            "10.1.2.0/24": "10.1.0.0/16",
+            "10.1.2.0/28": "10.1.2.0/24",
+            "10.9.0.0/16": "10.0.0.0/8",
+        }
+        for prefix in Prefix.objects.filter(namespace=namespace):
+            with self.subTest(prefix=prefix):
+                self.assertEqual(str(prefix.parent.prefix) if prefix.parent else None, expected_parents[str(prefix)])
+        self.assertIsNone(new_prefixes[3].parent)
+        ip_address.refresh_from_db()
+        other_ip_address.refresh_from_db()
+        self.assertEqual(str(ip_address.parent), "10.1.2.0/28")
+        self.assertEqual(str(other_ip_address.parent), "10.9.0.0/16")
+
+    def test_ip_address_bulk_create_assigns_parent(self):
+        """IPAddress.objects.bulk_create() should assign the closest parent Prefix in the right namespace."""
+        namespace = Namespace.objects.create(name="Bulk Create IPs")
+        Prefix.objects.create(prefix="10.0.0.0/8", namespace=namespace, status=self.status)
+        subnet = Prefix.objects.create(prefix="10.1.0.0/16", namespace=namespace, status=self.status)
+        host_prefix = Prefix.objects.create(prefix="10.1.0.9/32", namespace=namespace, status=self.status)
+
+        ip_addresses = IPAddress.objects.bulk_create(
+            [
+                IPAddress(address="10.1.0.1/16", namespace=namespace, status=self.status),
+                IPAddress(address="10.1.0.9/32", namespace=namespace, status=self.status, dns_name="Host.Example.COM"),
+            ]
+        )
+        self.assertEqual(ip_addresses[0].parent, subnet)
+        self.assertEqual(ip_addresses[1].parent, host_prefix)
+        self.assertEqual(IPAddress.objects.get(pk=ip_addresses[0].pk).parent, subnet)
+        # The dns_name is lowercased as well
+        self.assertEqual(IPAddress.objects.get(pk=ip_addresses[1].pk).dns_name, "host.example.com")
+
+        with self.assertRaises(ValidationError):
+            IPAddress.objects.bulk_create([IPAddress(address="11.0.0.1/8", namespace=namespace, status=self.status)])
+
+    def test_annotate_utilization(self):
+        """annotate_utilization() should let get_utilization() of many prefixes be computed in a single query."""
+        namespace = Namespace.objects.create(name="Annotate Utilization")
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=choices.PrefixTypeChoices.TYPE_CONTAINER, namespace=namespace, status=self.status
+        )
+        network = Prefix.objects.create(prefix="10.0.0.0/24", namespace=namespace, status=self.status)
+        pool = Prefix.objects.create(
+            prefix="10.0.0.128/26", type=choices.PrefixTypeChoices.TYPE_POOL, namespace=namespace, status=self.status
+        )
+        Prefix.objects.create(prefix="2001:db8::/32", namespace=namespace, status=self.status)
+        Prefix.objects.create(prefix="2001:db8::/34", namespace=namespace, status=self.status)
+        for address in ["10.0.0.1/24", "10.0.0.2/24", "10.0.0.130/26", "10.0.0.255/24", "2001:db8::1/64"]:
+            IPAddress.objects.create(address=address, namespace=namespace, status=self.status)
+
+        expected = {
+            "10.0.0.0/16": (256, 65536),
+            "10.0.0.0/24": (67, 256),
+            "10.0.0.128/26": (1, 64),
+            "2001:db8::/32": (2**94, 2**96),
+            "2001:db8::/34": (1, 2**94),
+        }
+        with self.assertNumQueries(1):
+            prefixes = list(Prefix.objects.filter(namespace=namespace).annotate_utilization())
+            for prefix in prefixes:
+                with self.subTest(prefix=prefix):
+                    self.assertEqual(prefix.get_utilization(), expected[str(prefix)])
+        # Without the annotation, each prefix is looked up individually, with the same result
+        for prefix in [container, network, pool]:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(prefix.get_utilization(), expected[str(prefix)])
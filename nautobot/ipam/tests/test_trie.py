@@ -0,0 +1,95 @@
+import random
+
+import netaddr
+
+from nautobot.core.testing import TestCase
+from nautobot.ipam.trie import PrefixTrie
+
+
+class PrefixTrieTest(TestCase):
+    def setUp(self):
+        self.trie = PrefixTrie(
+            [
+                ("10.0.0.0/8", "10/8"),
+                ("10.1.0.0/16", "10.1/16"),
+                ("10.1.2.0/24", "10.1.2/24"),
+                ("10.2.0.0/16", "10.2/16"),
+                ("2001:db8::/32", "2001:db8::/32"),
+                ("2001:db8:1::/48", "2001:db8:1::/48"),
+            ]
+        )
+
+    def test_insert_and_get(self):
+        self.assertEqual(len(self.trie), 6)
+        self.assertIn("10.1.0.0/16", self.trie)
+        self.assertIn(netaddr.IPNetwork("2001:db8:1::/48"), self.trie)
+        self.assertNotIn("10.1.0.0/17", self.trie)
+        self.assertNotIn("10.0.0.0/7", self.trie)
+        self.assertEqual(self.trie.get("10.2.0.0/16"), "10.2/16")
+        self.assertIsNone(self.trie.get("10.3.0.0/16"))
+
+        self.trie.insert("10.2.0.0/16", "replaced")
+        self.trie.insert("0.0.0.0/0", "default")
+        self.assertEqual(len(self.trie), 7)
+        self.assertEqual(self.trie.get("10.2.0.0/16"), "replaced")
+        self.assertEqual(self.trie.get("0.0.0.0/0"), "default")
+
+    def test_get_closest_parent(self):
+        self.assertEqual(self.trie.get_closest_parent("10.1.2.0/24"), (netaddr.IPNetwork("10.1.0.0/16"), "10.1/16"))
+        self.assertEqual(self.trie.get_closest_parent("10.1.2.0/24", include_self=True)[1], "10.1.2/24")
+        self.assertEqual(self.trie.get_closest_parent("10.1.2.3/32")[1], "10.1.2/24")
+        self.assertEqual(self.trie.get_closest_parent("10.3.0.0/16")[1], "10/8")
+        self.assertEqual(self.trie.get_closest_parent("2001:db8:1:2::/64")[1], "2001:db8:1::/48")
+        self.assertIsNone(self.trie.get_closest_parent("10.0.0.0/8"))
+        self.assertIsNone(self.trie.get_closest_parent("192.168.0.0/16"))
+
+    def test_get_children_and_descendants(self):
+        self.assertEqual([value for _, value in self.trie.get_children("10.0.0.0/8")], ["10.1/16", "10.2/16"])
+        self.assertEqual(
+            [value for _, value in self.trie.get_descendants("10.0.0.0/8")], ["10.1/16", "10.1.2/24", "10.2/16"]
+        )
+        # The prefix itself doesn't need to be in the trie
+        self.assertEqual([value for _, value in self.trie.get_children("10.1.0.0/17")], ["10.1.2/24"])
+        self.assertEqual(self.trie.get_children("10.1.2.0/24"), [])
+        self.assertEqual(self.trie.get_children("192.168.0.0/16"), [])
+
+    def test_get_available_ranges(self):
+        self.assertEqual(
+            self.trie.get_available_ranges("10.0.0.0/8"),
+            [netaddr.IPRange("10.0.0.0", "10.0.255.255"), netaddr.IPRange("10.3.0.0", "10.255.255.255")],
+        )
+        self.assertEqual(self.trie.get_available_ranges("10.1.2.0/24"), [netaddr.IPRange("10.1.2.0", "10.1.2.255")])
+        self.assertEqual(
+            self.trie.get_available_ranges("10.1.0.0/16"),
+            [netaddr.IPRange("10.1.0.0", "10.1.1.255"), netaddr.IPRange("10.1.3.0", "10.1.255.255")],
+        )
+
+    def test_get_parents(self):
+        self.assertEqual(
+            self.trie.get_parents(),
+            {
+                "10/8": None,
+                "10.1/16": "10/8",
+                "10.1.2/24": "10.1/16",
+                "10.2/16": "10/8",
+                "2001:db8::/32": None,
+                "2001:db8:1::/48": "2001:db8::/32",
+            },
+        )
+
+    def test_matches_brute_force(self):
+        """The hierarchy computed by the trie should match a brute-force comparison of every pair of prefixes."""
+        # Use a fixed seed so that any failure is reproducible, restoring the global random state afterwards
+        self.addCleanup(random.setstate, random.getstate())
+        random.seed(1234)
+        prefixes = {
+            netaddr.IPNetwork((random.getrandbits(32) & 0x0AFFFFFF, random.randint(8, 28))).cidr  # noqa: S311  # suspicious-non-cryptographic-random-usage
+            for _ in range(500)
+        }
+        trie = PrefixTrie((prefix, prefix) for prefix in prefixes)
+        self.assertEqual(len(trie), len(prefixes))
+        parents = trie.get_parents()
+        for prefix in prefixes:
+            supernets = [other for other in prefixes if other.prefixlen < prefix.prefixlen and prefix in other]
+            expected = max(supernets, key=lambda supernet: supernet.prefixlen) if supernets else None
+            self.assertEqual(parents[prefix], expected)
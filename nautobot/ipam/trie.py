@@ -0,0 +1,251 @@
+"""In-memory radix trie of IP prefixes, used to compute the IPAM hierarchy without a database query per prefix."""
+
+import netaddr
+
+IP_VERSION_BITS = {4: 32, 6: 128}
+
+
+def _bit(value, position, bits):
+    """Return the bit at `position` (counting from the most significant bit) of the `bits`-bit integer `value`."""
+    return (value >> (bits - 1 - position)) & 1
+
+
+def _mask(value, length, bits):
+    """Return `value` with all but the `length` most significant of its `bits` bits cleared."""
+    return value & ~((1 << (bits - length)) - 1)
+
+
+class _Node:
+    __slots__ = ("children", "has_value", "length", "network", "value")
+
+    def __init__(self, network, length, value=None, has_value=False):
+        self.network = network
+        self.length = length
+        self.value = value
+        self.has_value = has_value
+        self.children = [None, None]
+
+
+class PrefixTrie:
+    """
+    Patricia (path-compressed binary radix) trie of IPv4 and IPv6 prefixes, each associated with a value.
+
+    Each address family has its own trie. Every stored prefix is a node, and further "glue" nodes without a value are
+    only added where the paths to two stored prefixes diverge, so the trie has fewer than twice as many nodes as
+    stored prefixes, and inserting or looking up a prefix takes at most one step per bit of the prefix length.
+
+    Prefixes may be given to all methods as `netaddr.IPNetwork` objects or strings, and are returned as
+    `netaddr.IPNetwork` objects. Methods with a leading underscore instead take and return `(ip_version, network,
+    prefix_length)` tuples, with the network address as an integer, avoiding the overhead of `netaddr` in bulk
+    operations.
+
+    Example:
+        >>> trie = PrefixTrie()
+        >>> trie.insert("10.0.0.0/8", "a")
+        >>> trie.insert("10.1.0.0/16", "b")
+        >>> trie.get_closest_parent("10.1.2.0/24")
+        (IPNetwork('10.1.0.0/16'), 'b')
+    """
+
+    def __init__(self, prefixes=None):
+        """
+        Args:
+            prefixes (iterable): Optional `(prefix, value)` pairs to insert into the trie
+        """
+        self._roots = {version: _Node(0, 0) for version in IP_VERSION_BITS}
+        self._size = 0
+        for prefix, value in prefixes or ():
+            self.insert(prefix, value)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, prefix):
+        return self._find(*self._to_key(prefix)) is not None
+
+    @staticmethod
+    def _to_key(prefix):
+        if not isinstance(prefix, netaddr.IPNetwork):
+            prefix = netaddr.IPNetwork(prefix)
+        return (prefix.version, prefix.first, prefix.prefixlen)
+
+    @staticmethod
+    def _to_prefix(version, network, length):
+        return netaddr.IPNetwork((network, length), version=version)
+
+    def insert(self, prefix, value=None):
+        """Add `prefix` to the trie with the given `value`, replacing the value of `prefix` if already present."""
+        self._insert(*self._to_key(prefix), value)
+
+    def _insert(self, version, network, length, value=None):
+        bits = IP_VERSION_BITS[version]
+        network = _mask(network, length, bits)
+        node = self._roots[version]
+        if length == 0:
+            self._set_value(node, value)
+            return
+
+        while True:
+            branch = _bit(network, node.length, bits)
+            child = node.children[branch]
+            if child is None:
+                node.children[branch] = _Node(network, length, value, has_value=True)
+                self._size += 1
+                return
+
+            common = min(length, child.length, bits - (network ^ child.network).bit_length())
+            if common == child.length:
+                if child.length == length:
+                    self._set_value(child, value)
+                    return
+                # The child is a supernet of the new prefix; keep descending
+                node = child
+                continue
+
+            new_node = _Node(network, length, value, has_value=True)
+            if common == length:
+                # The new prefix is a supernet of the child
+                new_node.children[_bit(child.network, length, bits)] = child
+                node.children[branch] = new_node
+            else:
+                # The new prefix and the child diverge after their first `common` bits
+                glue = _Node(_mask(network, common, bits), common)
+                glue.children[_bit(network, common, bits)] = new_node
+                glue.children[_bit(child.network, common, bits)] = child
+                node.children[branch] = glue
+            self._size += 1
+            return
+
+    def _set_value(self, node, value):
+        if not node.has_value:
+            node.has_value = True
+            self._size += 1
+        node.value = value
+
+    def _find(self, version, network, length):
+        """Return the node storing exactly the given prefix, or None."""
+        bits = IP_VERSION_BITS[version]
+        network = _mask(network, length, bits)
+        node = self._roots[version]
+        while node is not None and node.length <= length:
+            if _mask(network, node.length, bits) != node.network:
+                return None
+            if node.length == length:
+                return node if node.has_value else None
+            node = node.children[_bit(network, node.length, bits)]
+        return None
+
+    def get(self, prefix, default=None):
+        """Return the value of `prefix`, or `default` if it isn't in the trie."""
+        node = self._find(*self._to_key(prefix))
+        return node.value if node is not None else default
+
+    def get_closest_parent(self, prefix, include_self=False):
+        """
+        Return `(prefix, value)` of the longest prefix in the trie containing `prefix`, or None if there is none.
+
+        Args:
+            prefix (IPNetwork, str): Prefix to look up; an IP address can be looked up as a /32 or /128 prefix
+            include_self (bool): Whether `prefix` itself is a candidate, if it's present in the trie
+        """
+        version, network, length = self._to_key(prefix)
+        node = self._get_closest_parent(version, network, length, include_self=include_self)
+        if node is None:
+            return None
+        return self._to_prefix(version, node.network, node.length), node.value
+
+    def _get_closest_parent(self, version, network, length, include_self=False):
+        bits = IP_VERSION_BITS[version]
+        node = self._roots[version]
+        closest = None
+        while node is not None and node.length <= length:
+            if _mask(network, node.length, bits) != node.network:
+                break
+            if node.has_value and (node.length < length or include_self):
+                closest = node
+            if node.length == length:
+                break
+            node = node.children[_bit(network, node.length, bits)]
+        return closest
+
+    def _get_subtrees(self, version, network, length):
+        """Return the nodes at the top of the subtrees containing the proper subnets of the given prefix."""
+        bits = IP_VERSION_BITS[version]
+        network = _mask(network, length, bits)
+        node = self._roots[version]
+        while node is not None:
+            if node.length > length:
+                # Either the top of the subtree of subnets, or a prefix outside of the given prefix altogether
+                return [node] if _mask(node.network, length, bits) == network else []
+            if _mask(network, node.length, bits) != node.network:
+                return []
+            if node.length == length:
+                return [child for child in node.children if child is not None]
+            node = node.children[_bit(network, node.length, bits)]
+        return []
+
+    def _iter_subnet_nodes(self, version, network, length, direct=False):
+        """Yield the nodes of the stored proper subnets of the given prefix, in ascending order of network address."""
+        stack = list(reversed(self._get_subtrees(version, network, length)))
+        while stack:
+            node = stack.pop()
+            if node.has_value:
+                yield node
+                if direct:
+                    continue
+            stack.extend(child for child in reversed(node.children) if child is not None)
+
+    def get_children(self, prefix):
+        """Return `(prefix, value)` of each prefix in the trie whose closest parent is `prefix`, in ascending order."""
+        version, network, length = self._to_key(prefix)
+        return [
+            (self._to_prefix(version, node.network, node.length), node.value)
+            for node in self._iter_subnet_nodes(version, network, length, direct=True)
+        ]
+
+    def get_descendants(self, prefix):
+        """Return `(prefix, value)` of each prefix in the trie contained within `prefix`, in ascending order."""
+        version, network, length = self._to_key(prefix)
+        return [
+            (self._to_prefix(version, node.network, node.length), node.value)
+            for node in self._iter_subnet_nodes(version, network, length)
+        ]
+
+    def get_available_ranges(self, prefix):
+        """
+        Return the address ranges within `prefix` that aren't covered by any prefix in the trie, as a list of
+        `netaddr.IPRange` objects in ascending order.
+        """
+        version, network, length = self._to_key(prefix)
+        bits = IP_VERSION_BITS[version]
+        ranges = []
+        start = network
+        for node in self._iter_subnet_nodes(version, network, length, direct=True):
+            if node.network > start:
+                ranges.append((start, node.network - 1))
+            start = node.network + (1 << (bits - node.length))
+        end = network + (1 << (bits - length)) - 1
+        if start <= end:
+            ranges.append((start, end))
+        return [
+            netaddr.IPRange(netaddr.IPAddress(first, version=version), netaddr.IPAddress(last, version=version))
+            for first, last in ranges
+        ]
+
+    def _iter_hierarchy(self):
+        """
+        Yield `(ip_version, network, prefix_length, value, parent_value)` for every prefix in the trie, where
+        `parent_value` is the value of its closest parent, or None if it has no parent.
+        """
+        for version, root in self._roots.items():
+            stack = [(root, None)]
+            while stack:
+                node, parent = stack.pop()
+                if node.has_value:
+                    yield version, node.network, node.length, node.value, parent.value if parent else None
+                    parent = node
+                stack.extend((child, parent) for child in node.children if child is not None)
+
+    def get_parents(self):
+        """Return a dict mapping the value of each prefix in the trie to the value of its closest parent (or None)."""
+        return {value: parent_value for _, _, _, value, parent_value in self._iter_hierarchy()}
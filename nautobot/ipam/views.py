@@ -433,10 +433,7 @@ class PrefixListView(generic.ObjectListView):
         "rir",
         "role",
         "status",
-    ).prefetch_related(
-        "ip_addresses",
-        "children",
-    )
+    ).annotate_utilization()
     use_new_ui = True
 
 
@@ -478,6 +475,7 @@ class PrefixPrefixesView(generic.ObjectView):
             instance.descendants()
             .restrict(request.user, "view")
             .select_related("parent", "location", "status", "role", "vlan", "namespace")
+            .annotate_utilization()
         )
 
         # Add available prefixes to the table if requested
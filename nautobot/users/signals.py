@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from nautobot.core.authentication import get_compiled_object_permissions
+from nautobot.users.models import ObjectPermission
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=User)
+def invalidate_object_permission_cache(sender, **kwargs):
+    """
+    Invalidate the cached ObjectPermissions of all users, in all Nautobot processes.
+
+    Deleting a Group removes its memberships without sending `m2m_changed`, hence its `post_delete` is handled as well.
+    Saving a User doesn't change the ObjectPermissions granted to it (`is_active` and `is_superuser` are always checked
+    against the User itself), so it's deliberately ignored; otherwise every login would invalidate the cache.
+
+    The cache is cleared again once the current transaction is committed, so that a concurrent request can't cache the
+    permissions as they were before the change while the transaction is in progress.
+    """
+    get_compiled_object_permissions.cache_clear()
+    transaction.on_commit(get_compiled_object_permissions.cache_clear)